@@ -0,0 +1,18 @@
+-- Add to Supabase: Version number for optimistic concurrency on clients_data
+-- PATCH /api/client-data/<lead_id> only writes when the row still has the version it read
+-- (If-Match), so concurrent edits get a 409 instead of overwriting each other.
+
+ALTER TABLE clients_data ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1;
+
+-- Every update - PATCH or a full /api/save-client upsert - moves the version on
+CREATE OR REPLACE FUNCTION bump_version_column()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.version = OLD.version + 1;
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS bump_clients_data_version ON clients_data;
+CREATE TRIGGER bump_clients_data_version BEFORE UPDATE ON clients_data
+    FOR EACH ROW EXECUTE FUNCTION bump_version_column();
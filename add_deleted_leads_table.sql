@@ -0,0 +1,13 @@
+-- Add to Supabase: Lead change feed support
+
+-- Tombstones for deleted leads, written by DELETE /api/leads/<id> and
+-- POST /api/leads/clear-all, so GET /api/leads/changes can report deletions.
+CREATE TABLE IF NOT EXISTS deleted_leads (
+    lead_id UUID PRIMARY KEY,
+    deleted_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_deleted_leads_deleted_at ON deleted_leads(deleted_at);
+
+-- The change feed scans leads by updated_at (kept current by update_leads_updated_at)
+CREATE INDEX IF NOT EXISTS idx_leads_updated_at ON leads(updated_at);
@@ -0,0 +1,56 @@
+-- Add to Supabase: One properties_data row per email
+-- /api/save-property upserts on this key (on_conflict=email) instead of select-then-insert/update.
+
+-- Preview the duplicates this removes:
+--   SELECT LOWER(TRIM(email)) AS email, COUNT(*) FROM properties_data
+--   WHERE email IS NOT NULL GROUP BY 1 HAVING COUNT(*) > 1;
+
+BEGIN;
+
+-- The updated_at trigger would stamp NOW() on every row touched below, erasing real edit times
+ALTER TABLE properties_data DISABLE TRIGGER update_properties_data_updated_at;
+
+-- Rank duplicates on the original timestamps, before anything is updated: the most recently
+-- updated row per normalized email survives (rows linked to a lead win ties)
+CREATE TEMP TABLE properties_data_ranked ON COMMIT DROP AS
+SELECT id,
+       LOWER(TRIM(email)) AS norm_email,
+       lead_id,
+       updated_at,
+       ROW_NUMBER() OVER (
+           PARTITION BY LOWER(TRIM(email))
+           ORDER BY updated_at DESC NULLS LAST, (lead_id IS NOT NULL) DESC, created_at DESC NULLS LAST
+       ) AS rank
+FROM properties_data
+WHERE email IS NOT NULL;
+
+-- Give the surviving row a lead link if only an older duplicate had one
+UPDATE properties_data keep
+SET lead_id = dup.lead_id
+FROM properties_data_ranked survivor,
+     properties_data_ranked dup
+WHERE survivor.id = keep.id
+  AND survivor.rank = 1
+  AND keep.lead_id IS NULL
+  AND dup.norm_email = survivor.norm_email
+  AND dup.rank > 1
+  AND dup.lead_id IS NOT NULL;
+
+DELETE FROM properties_data
+WHERE id IN (SELECT id FROM properties_data_ranked WHERE rank > 1);
+
+-- Store emails trimmed and lower-cased, the way the backend now writes them
+UPDATE properties_data
+SET email = LOWER(TRIM(email))
+WHERE email IS NOT NULL AND email <> LOWER(TRIM(email));
+
+ALTER TABLE properties_data ENABLE TRIGGER update_properties_data_updated_at;
+
+-- A plain unique constraint (not an expression index) so PostgREST can use it for on_conflict
+ALTER TABLE properties_data DROP CONSTRAINT IF EXISTS properties_data_email_key;
+ALTER TABLE properties_data ADD CONSTRAINT properties_data_email_key UNIQUE (email);
+
+-- The unique constraint's index replaces the plain one
+DROP INDEX IF EXISTS idx_properties_data_email;
+
+COMMIT;
@@ -0,0 +1,18 @@
+-- Add to Supabase: Background sync job status
+
+-- Every lead sync job (scheduled or triggered from /api/leads/sync) is mirrored
+-- here so GET /api/sync-jobs/<id> works no matter which gunicorn worker ran it.
+CREATE TABLE IF NOT EXISTS sync_jobs (
+    id UUID PRIMARY KEY,
+    kind VARCHAR(50) NOT NULL,
+    trigger VARCHAR(20),
+    status VARCHAR(20) NOT NULL, -- 'queued', 'running', 'succeeded', 'failed'
+    progress JSONB,
+    result JSONB,
+    error TEXT,
+    created_at TIMESTAMP DEFAULT NOW(),
+    started_at TIMESTAMP,
+    finished_at TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_sync_jobs_created_at ON sync_jobs(created_at DESC);
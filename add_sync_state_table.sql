@@ -0,0 +1,10 @@
+-- Add to Supabase: Incremental Meta lead sync state
+
+-- One row per lead form: the newest lead already stored in `leads`.
+-- /api/leads/sync only asks Meta for leads created after this point.
+CREATE TABLE IF NOT EXISTS sync_state (
+    form_id VARCHAR(255) PRIMARY KEY,
+    last_created_time TIMESTAMPTZ,
+    last_lead_id VARCHAR(255),
+    updated_at TIMESTAMP DEFAULT NOW()
+);
@@ -1,28 +1,38 @@
 """
-Auto-sync Facebook leads to database every 2 minutes
-Run this in background to keep database updated
+Trigger a one-off Facebook lead sync and wait for it to finish
+The backend now syncs every AUTO_SYNC_INTERVAL seconds on its own, so this
+script is only needed to force a sync outside the schedule
 """
 import time
 import requests
 
-SYNC_INTERVAL = 120  # 2 minutes
+BACKEND_URL = 'http://localhost:5000'
+POLL_INTERVAL = 2  # seconds
+MAX_WAIT = 300  # 5 minutes
 
-print("🔄 Auto-sync started - syncing Facebook leads every 2 minutes")
-print("Press Ctrl+C to stop")
+print(f"⏰ {time.strftime('%H:%M:%S')} - Starting Facebook lead sync...")
 
-while True:
-    try:
-        print(f"\n⏰ {time.strftime('%H:%M:%S')} - Syncing leads from Facebook...")
-        response = requests.post('http://localhost:5000/api/leads/sync', timeout=120)
-        
-        if response.status_code == 200:
-            data = response.json()
-            print(f"✅ Sync complete: {data.get('message')}")
-        else:
-            print(f"❌ Sync failed: {response.status_code}")
-            
-    except Exception as e:
-        print(f"❌ Error: {e}")
-    
-    print(f"💤 Sleeping for {SYNC_INTERVAL} seconds...")
-    time.sleep(SYNC_INTERVAL)
+try:
+    response = requests.post(f'{BACKEND_URL}/api/leads/sync', timeout=30)
+    response.raise_for_status()
+    job_id = response.json()['job_id']
+    print(f"📋 Sync job started: {job_id}")
+
+    waited = 0
+    while waited < MAX_WAIT:
+        time.sleep(POLL_INTERVAL)
+        waited += POLL_INTERVAL
+        job = requests.get(f'{BACKEND_URL}/api/sync-jobs/{job_id}', timeout=30).json()['job']
+
+        if job['status'] == 'succeeded':
+            print(f"✅ Sync complete: {job['result'].get('message')}")
+            break
+        if job['status'] == 'failed':
+            print(f"❌ Sync failed: {job.get('error')}")
+            break
+        print(f"⏳ {job['status']} - {job.get('progress')}")
+    else:
+        print(f"⚠️ Sync still running after {MAX_WAIT} seconds")
+
+except Exception as e:
+    print(f"❌ Error: {e}")
@@ -15,20 +15,43 @@ if sys.platform == 'win32':
 
 import os
 import json
-import requests
-from datetime import datetime
+from datetime import datetime, timezone
 from flask import Flask, request, jsonify, send_from_directory
 from flask_cors import CORS
+from werkzeug.exceptions import RequestEntityTooLarge
 from dotenv import load_dotenv
 from supabase import create_client, Client
 import hmac
 import hashlib
+import time
+import base64
+import tempfile
+import uuid
+import logging
+import multiprocessing
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 # Import pdf_parser using relative import
-from .pdf_parser import parse_mvr_pdf, parse_dash_pdf
+from .pdf_parser import parse_mvr_pdf, parse_dash_pdf, PARSER_VERSION
+from .meta_client import MetaClient
+from .jobs import JobRunner, PeriodicScheduler, ProcessLock
+from .cache import TTLCache
+from .lead_data_cache import LeadDataCache, WriteGeneration
+from .events import EventBroker, format_sse
+from .parse_pool import ParsePool, ParsePoolBusy, ParsePoolError
+from .parse_cache import ParseResultCache
+from .uploads import UploadRejected, spool_pdf_upload
+from .driver_merge import licence_key, merge_driver_reports
+from .json_patch import JsonPatchError, JsonPatchTestFailed, apply_json_patch, apply_merge_patch
+from .logging_setup import configure_logging
 
 # Load environment variables
 load_dotenv(os.path.join(os.path.dirname(__file__), '../.env.local'))
 
+configure_logging()
+logger = logging.getLogger(__name__)
+
 # Configure Flask to serve static files from parent directory
 STATIC_FOLDER = os.path.join(os.path.dirname(__file__), '..')
 app = Flask(__name__, static_folder=STATIC_FOLDER, static_url_path='')
@@ -46,8 +69,8 @@ FB_PIXEL_ID = os.getenv('FB_PIXEL_ID')
 SUPABASE_URL = os.getenv('VITE_SUPABASE_URL')
 SUPABASE_KEY = os.getenv('VITE_SUPABASE_SERVICE_ROLE_KEY')
 
-# Debug: Print Supabase URL
-print(f"🔗 Supabase URL: {SUPABASE_URL}")
+# Debug: Log Supabase URL
+logger.info("🔗 Supabase URL: %s", SUPABASE_URL)
 
 # Initialize Supabase
 supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
@@ -56,6 +79,126 @@ supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
 META_API_VERSION = 'v18.0'
 META_BASE_URL = f'https://graph.facebook.com/{META_API_VERSION}'
 
+# Shared Graph API client (pooled keep-alive session, timeouts, retry/backoff)
+meta_client = MetaClient(
+    META_BASE_URL,
+    META_PAGE_ACCESS_TOKEN,
+    timeout=float(os.getenv('META_HTTP_TIMEOUT', 30)),
+    connect_timeout=float(os.getenv('META_HTTP_CONNECT_TIMEOUT', 5)),
+    max_retries=int(os.getenv('META_HTTP_MAX_RETRIES', 3)),
+    max_backoff=float(os.getenv('META_HTTP_MAX_BACKOFF', 60))
+)
+
+# Leads per Supabase round trip when bulk-syncing from Meta
+LEAD_SYNC_CHUNK_SIZE = int(os.getenv('LEAD_SYNC_CHUNK_SIZE', 200))
+
+# Lead ids per batch when clearing the table, and the tables that hang off leads.lead_id
+LEAD_DELETE_CHUNK_SIZE = int(os.getenv('LEAD_DELETE_CHUNK_SIZE', 200))
+LEAD_CHILD_TABLES = ('clients_data', 'properties_data', 'sync_events', 'reminders')
+
+# Incremental sync: first run starts here, later runs resume from sync_state
+META_SYNC_START = datetime(2026, 1, 12, 0, 0, 0, tzinfo=timezone.utc)
+META_SYNC_PAGE_SIZE = int(os.getenv('META_SYNC_PAGE_SIZE', 500))
+META_SYNC_MAX_PAGES = int(os.getenv('META_SYNC_MAX_PAGES', 50))
+
+# Multi-form sync: explicit comma-separated form ids, or discover every form on the page
+META_LEAD_FORM_IDS = [form_id.strip() for form_id in os.getenv('META_LEAD_FORM_IDS', '').split(',') if form_id.strip()]
+META_SYNC_ALL_FORMS = os.getenv('META_SYNC_ALL_FORMS', 'true').lower() in ('1', 'true', 'yes')
+META_SYNC_MAX_WORKERS = int(os.getenv('META_SYNC_MAX_WORKERS', 4))
+
+# GET /api/leads paging and projection
+LEADS_DEFAULT_PAGE_SIZE = int(os.getenv('LEADS_DEFAULT_PAGE_SIZE', 100))
+LEADS_MAX_PAGE_SIZE = int(os.getenv('LEADS_MAX_PAGE_SIZE', 1000))
+LEAD_COLUMNS = [
+    'id', 'meta_lead_id', 'meta_user_id', 'name', 'phone', 'email', 'message', 'type',
+    'status', 'potential_status', 'notes', 'is_manual', 'premium', 'renewal_date',
+    'insurance_type', 'policy_term', 'visa_type', 'coverage', 'trip_start', 'trip_end',
+    'last_sync', 'sync_status', 'sync_signal', 'created_at', 'updated_at', 'meta_data'
+]
+# The raw Graph payload in meta_data is only sent when asked for explicitly
+LEAD_DEFAULT_FIELDS = [column for column in LEAD_COLUMNS if column != 'meta_data']
+
+# GET /api/lead-bundle embeds: response key -> (table, columns). fields= can name "client_data" for
+# the whole row or "client_data.email" for single columns, leaving the big JSONB ones out
+BUNDLE_EMBEDS = {
+    'client_data': ('clients_data', ['id', 'lead_id', 'email', 'drivers', 'version', 'created_at', 'updated_at']),
+    'property_data': ('properties_data', ['id', 'lead_id', 'email', 'properties', 'customer', 'created_at', 'updated_at'])
+}
+
+REDIS_URL = os.getenv('REDIS_URL')
+
+# Per-worker cache of serialized lead pages, keyed by query and the leads write generation. The
+# generation is shared through REDIS_URL, so a write on any worker retires every worker's pages;
+# without Redis other workers only notice when the short TTL runs out. ETags come from the data alone
+LEADS_CACHE_TTL = float(os.getenv('LEADS_CACHE_TTL', 60 if REDIS_URL else 5))
+LEADS_CACHE_SIZE = int(os.getenv('LEADS_CACHE_SIZE', 128))
+leads_cache = TTLCache(maxsize=LEADS_CACHE_SIZE, ttl=LEADS_CACHE_TTL)
+leads_generation = WriteGeneration('leads', redis_url=REDIS_URL)
+
+# get-client-data / get-property-data rows, dropped on every save and lead delete. Per worker unless
+# REDIS_URL is set (needs the redis package), in which case all workers share one copy
+LEAD_DATA_CACHE_TTL = float(os.getenv('LEAD_DATA_CACHE_TTL', 30))
+LEAD_DATA_CACHE_SIZE = int(os.getenv('LEAD_DATA_CACHE_SIZE', 256))
+lead_data_cache = LeadDataCache(maxsize=LEAD_DATA_CACHE_SIZE, ttl=LEAD_DATA_CACHE_TTL, redis_url=REDIS_URL)
+
+# Live lead stream (SSE) - fan-out is per worker process, dashboards still poll /api/leads/changes
+SSE_HEARTBEAT_SECONDS = float(os.getenv('SSE_HEARTBEAT_SECONDS', 15))
+SSE_CLIENT_QUEUE_SIZE = int(os.getenv('SSE_CLIENT_QUEUE_SIZE', 100))
+# Every open stream pins one gthread thread for as long as it lasts, so the cap follows the worker's
+# thread count (WEB_THREADS, the same value passed to gunicorn --threads): a quarter by default and
+# never more than half, leaving the rest for normal requests
+WEB_THREADS = int(os.getenv('WEB_THREADS', 16))
+SSE_MAX_CLIENTS = min(int(os.getenv('SSE_MAX_CLIENTS', max(1, WEB_THREADS // 4))), max(1, WEB_THREADS // 2))
+lead_events = EventBroker(max_queue=SSE_CLIENT_QUEUE_SIZE, max_clients=SSE_MAX_CLIENTS)
+
+# PDF parsing runs in a per-worker process pool: PDF_PARSE_WORKERS parse at once, PDF_PARSE_QUEUE
+# more may wait (then 429), and a job over PDF_PARSE_TIMEOUT seconds is killed (503)
+PDF_PARSE_WORKERS = int(os.getenv('PDF_PARSE_WORKERS', 2))
+PDF_PARSE_QUEUE = int(os.getenv('PDF_PARSE_QUEUE', 4))
+PDF_PARSE_TIMEOUT = float(os.getenv('PDF_PARSE_TIMEOUT', 60))
+PDF_PARSE_MAX_TASKS = int(os.getenv('PDF_PARSE_MAX_TASKS', 25))
+parse_pool = ParsePool(
+    max_workers=PDF_PARSE_WORKERS,
+    max_queue=PDF_PARSE_QUEUE,
+    timeout=PDF_PARSE_TIMEOUT,
+    max_tasks_per_child=PDF_PARSE_MAX_TASKS,
+    initializer=configure_logging
+)
+
+# Parsed PDFs are cached by content hash + PARSER_VERSION: PDF_CACHE_SIZE results per worker in
+# memory, backed by JSON files in PDF_CACHE_DIR shared by all workers (empty disables the disk tier).
+# Disk entries unused for PDF_CACHE_MAX_AGE_DAYS are evicted, then the least recently used past PDF_CACHE_MAX_MB
+PDF_CACHE_SIZE = int(os.getenv('PDF_CACHE_SIZE', 64))
+PDF_CACHE_DIR = os.getenv('PDF_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'pdf-parse-cache'))
+PDF_CACHE_MAX_MB = int(os.getenv('PDF_CACHE_MAX_MB', 256))
+PDF_CACHE_MAX_AGE_DAYS = float(os.getenv('PDF_CACHE_MAX_AGE_DAYS', 30))
+parse_cache = ParseResultCache(
+    PARSER_VERSION,
+    maxsize=PDF_CACHE_SIZE,
+    directory=PDF_CACHE_DIR,
+    max_bytes=PDF_CACHE_MAX_MB * 1024 * 1024,
+    max_age=PDF_CACHE_MAX_AGE_DAYS * 86400
+)
+
+# Request bodies over MAX_UPLOAD_MB are refused with 413 before they are read; PDF uploads are
+# streamed to PDF_UPLOAD_DIR (default: system temp dir) and parsed from there
+MAX_UPLOAD_MB = float(os.getenv('MAX_UPLOAD_MB', 20))
+PDF_UPLOAD_DIR = os.getenv('PDF_UPLOAD_DIR') or None
+app.config['MAX_CONTENT_LENGTH'] = int(MAX_UPLOAD_MB * 1024 * 1024)
+# /api/parse-batch accepts at most PDF_BATCH_MAX_FILES reports (MAX_UPLOAD_MB covers the whole request)
+PDF_BATCH_MAX_FILES = int(os.getenv('PDF_BATCH_MAX_FILES', 12))
+
+# PATCH /api/client-data/<lead_id> body formats
+CLIENT_PATCH_TYPES = ('application/json-patch+json', 'application/merge-patch+json')
+
+# Which extraction tier (pypdf2 / pdfminer / pdfplumber) produced each parsed report, per worker
+text_tier_counts = Counter()
+text_tier_lock = threading.Lock()
+
+# In-process scheduler (replaces the external auto_sync.py loop); 0 disables it
+AUTO_SYNC_INTERVAL = int(os.getenv('AUTO_SYNC_INTERVAL', 120))
+SYNC_LOCK_DIR = os.getenv('SYNC_LOCK_DIR', tempfile.gettempdir())
+
 # ========== HELPER FUNCTIONS ==========
 
 def verify_meta_webhook(data, hub_signature):
@@ -69,64 +212,263 @@ def verify_meta_webhook(data, hub_signature):
     return hmac.compare_digest(expected_signature, hub_signature)
 
 
-def get_leads_from_meta():
-    """Fetch all leads from Meta Lead Form API with pagination (up to 500 leads)"""
+def parse_meta_time(created_time):
+    """Parse a Meta created_time ('2026-01-15T12:34:56+0000') into an aware datetime"""
     try:
-        all_leads = []
-        url = f'{META_BASE_URL}/{META_LEAD_FORM_ID}/leads'
-        
-        # Try to get leads from Jan 12, 2026 onwards
-        from datetime import datetime, timezone
-        jan_12_timestamp = int(datetime(2026, 1, 12, 0, 0, 0, tzinfo=timezone.utc).timestamp())
-        
-        params = {
-            'fields': 'id,created_time,field_data,adgroup_id',
-            'access_token': META_PAGE_ACCESS_TOKEN,
-            'limit': 500,  # Request max leads
-            'filtering': f'[{{"field":"time_created","operator":"GREATER_THAN","value":{jan_12_timestamp}}}]'
-        }
-        
-        print(f"📞 Fetching leads from Meta API since Jan 12, 2026: {url}")
-        print(f"🔑 Using Lead Form ID: {META_LEAD_FORM_ID}")
-        print(f"📅 Filtering from timestamp: {jan_12_timestamp}")
-        
-        # Fetch first page
-        response = requests.get(url, params=params)
-        print(f"📡 Meta API Response Status: {response.status_code}")
-        response.raise_for_status()
-        
-        data = response.json()
-        all_leads.extend(data.get('data', []))
-        print(f"📄 Page 1: {len(data.get('data', []))} leads")
-        
-        # Continue fetching all pages (max 500 total to avoid overwhelming)
-        page_count = 1
-        while 'paging' in data and 'next' in data['paging'] and len(all_leads) < 500:
-            page_count += 1
-            next_url = data['paging']['next']
-            print(f"📄 Fetching page {page_count}... (Total so far: {len(all_leads)})")
-            response = requests.get(next_url)
-            response.raise_for_status()
-            data = response.json()
-            page_leads = data.get('data', [])
-            all_leads.extend(page_leads)
-            print(f"   + {len(page_leads)} leads")
-            
-            # Safety limit
-            if page_count > 10:
-                print(f"⚠️ Reached page limit (10 pages)")
-                break
-        
-        print(f"✅ Found {len(all_leads)} total leads from Meta")
-        return all_leads
+        return datetime.strptime(created_time, '%Y-%m-%dT%H:%M:%S%z')
+    except (TypeError, ValueError):
+        try:
+            return datetime.fromisoformat(created_time)
+        except (TypeError, ValueError):
+            return None
+
+
+def load_sync_cursors(form_ids):
+    """Load the newest created_time / lead id already synced for each form (one query)"""
+    cursors = {}
+    if not form_ids:
+        return cursors
+    try:
+        result = supabase.table('sync_state').select('*').in_('form_id', list(form_ids)).execute()
+        for row in result.data or []:
+            cursors[row['form_id']] = {
+                'created_time': parse_meta_time(row.get('last_created_time')),
+                'lead_id': row.get('last_lead_id')
+            }
+    except Exception as e:
+        logger.warning("⚠️ Could not load sync cursors: %s", e)
+    return cursors
+
+
+def save_sync_cursor(form_id, created_time, lead_id):
+    """Persist the high-water mark for a form after a successful sync"""
+    try:
+        supabase.table('sync_state').upsert({
+            'form_id': form_id,
+            'last_created_time': created_time.isoformat(),
+            'last_lead_id': lead_id,
+            'updated_at': datetime.utcnow().isoformat()
+        }, on_conflict='form_id').execute()
+        logger.info("📌 Sync cursor for form %s -> %s (%s)", form_id, created_time.isoformat(), lead_id)
+    except Exception as e:
+        logger.warning("⚠️ Could not save sync cursor for form %s: %s", form_id, e)
+
+
+def newest_lead_cursor(meta_leads):
+    """Return (created_time, lead_id) of the newest lead in a Meta batch"""
+    newest = None
+    for lead in meta_leads:
+        created_time = parse_meta_time(lead.get('created_time'))
+        if created_time and (newest is None or created_time > newest[0]):
+            newest = (created_time, lead.get('id'))
+    return newest
+
+
+def fetch_meta_leads(form_id=None, since=None):
+    """Fetch leads created after `since` from a Meta lead form, following pagination"""
+    form_id = form_id or META_LEAD_FORM_ID
+    since = since or META_SYNC_START
+    all_leads = []
+    path = f'/{form_id}/leads'
     
+    # Meta only filters on whole seconds, so step back one second and let
+    # the bulk writer skip anything already stored
+    since_timestamp = int(since.timestamp()) - 1
+    
+    params = {
+        'fields': 'id,created_time,field_data,adgroup_id,form_id',
+        'limit': META_SYNC_PAGE_SIZE,
+        'filtering': f'[{{"field":"time_created","operator":"GREATER_THAN","value":{since_timestamp}}}]'
+    }
+    
+    logger.info("📞 Fetching leads from Meta API since %s: %s", since.isoformat(), path)
+    logger.debug("🔑 Using Lead Form ID: %s", form_id)
+    
+    # Stream pages over the shared session
+    complete = True
+    for page_count, page in enumerate(meta_client.iter_pages(path, params), 1):
+        page_leads = page.get('data', [])
+        all_leads.extend(page_leads)
+        logger.debug("📄 Page %s: %s leads (Total so far: %s)", page_count, len(page_leads), len(all_leads))
+        
+        # Safety limit - a truncated fetch must not advance the cursor
+        if page_count >= META_SYNC_MAX_PAGES and page.get('paging', {}).get('next'):
+            logger.warning("⚠️ Reached page limit (%s pages)", META_SYNC_MAX_PAGES)
+            complete = False
+            break
+    
+    logger.info("✅ Found %s total leads from Meta", len(all_leads))
+    return {'leads': all_leads, 'complete': complete}
+
+
+def get_leads_from_meta(since=None):
+    """Fetch leads from Meta Lead Form API (all since the sync start by default)"""
+    try:
+        return fetch_meta_leads(since=since)['leads']
     except Exception as e:
-        print(f"❌ Error fetching leads from Meta: {str(e)}")
-        if hasattr(e, 'response'):
-            print(f"❌ Meta API Error Response: {e.response.text if e.response else 'No response'}")
+        logger.error("❌ Error fetching leads from Meta: %s", e)
+        if getattr(e, 'response', None) is not None:
+            logger.error("❌ Meta API Error Response: %s", e.response.text)
         return []
 
 
+def get_lead_forms():
+    """List the lead forms to sync: configured ids, every form on the page, or the default form"""
+    if META_LEAD_FORM_IDS:
+        return [{'id': form_id, 'name': None} for form_id in META_LEAD_FORM_IDS]
+    
+    if META_SYNC_ALL_FORMS and META_PAGE_ID:
+        try:
+            forms = []
+            for page in meta_client.iter_pages(f'/{META_PAGE_ID}/leadgen_forms', {'fields': 'id,name,status'}):
+                forms.extend(page.get('data', []))
+            if forms:
+                logger.info("📋 Discovered %s lead forms on page %s", len(forms), META_PAGE_ID)
+                return [{'id': form['id'], 'name': form.get('name')} for form in forms]
+        except Exception as e:
+            logger.warning("⚠️ Could not discover lead forms, using META_LEAD_FORM_ID: %s", e)
+    
+    return [{'id': META_LEAD_FORM_ID, 'name': None}] if META_LEAD_FORM_ID else []
+
+
+def fetch_form_leads(form, cursor):
+    """Fetch one form's new leads since its cursor, timing the Graph calls"""
+    started = time.perf_counter()
+    since = cursor['created_time'] if cursor and cursor.get('created_time') else None
+    report = {
+        'form_id': form['id'],
+        'name': form.get('name'),
+        'since': since.isoformat() if since else None,
+        'leads': [],
+        'complete': False,
+        'error': None
+    }
+    try:
+        fetched = fetch_meta_leads(form['id'], since=since)
+        leads = fetched['leads']
+        if cursor:
+            leads = [lead for lead in leads if lead.get('id') != cursor.get('lead_id')]
+        report['leads'] = leads
+        report['complete'] = fetched['complete']
+    except Exception as e:
+        logger.error("❌ Error fetching leads for form %s: %s", form['id'], e)
+        report['error'] = str(e)
+    report['elapsed_ms'] = round((time.perf_counter() - started) * 1000)
+    return report
+
+
+def run_lead_sync(progress=None):
+    """Fetch new leads from every lead form concurrently and bulk-write them once"""
+    progress = progress or (lambda **fields: None)
+    started = time.perf_counter()
+    progress(stage='discovering_forms')
+    forms = get_lead_forms()
+    cursors = load_sync_cursors([form['id'] for form in forms])
+    
+    reports = []
+    if forms:
+        progress(stage='fetching', forms_total=len(forms), forms_done=0)
+        workers = max(1, min(META_SYNC_MAX_WORKERS, len(forms)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='meta-sync') as pool:
+            futures = [pool.submit(fetch_form_leads, form, cursors.get(form['id'])) for form in forms]
+            for done, _ in enumerate(as_completed(futures), 1):
+                progress(forms_done=done)
+            reports = [future.result() for future in futures]
+    
+    # Merge every form into one deduplicated batch
+    meta_leads = []
+    seen_ids = set()
+    for report in reports:
+        for lead in report['leads']:
+            if lead.get('id') in seen_ids:
+                continue
+            seen_ids.add(lead.get('id'))
+            meta_leads.append(lead)
+    logger.info("✅ Fetched %s leads from %s form(s)", len(meta_leads), len(forms))
+    
+    progress(stage='writing', leads_fetched=len(meta_leads))
+    parsed_leads = [parse_meta_lead(meta_lead) for meta_lead in meta_leads]
+    result = save_leads_bulk(parsed_leads)
+    failed_ids = set(result['failed_ids'])
+    
+    # Only move a form's cursor once everything up to it is safely stored
+    form_stats = []
+    for report in reports:
+        cursor = cursors.get(report['form_id'])
+        newest = newest_lead_cursor(report['leads'])
+        form_failed = any(lead.get('id') in failed_ids for lead in report['leads'])
+        if newest and report['complete'] and not form_failed:
+            save_sync_cursor(report['form_id'], *newest)
+            cursor = {'created_time': newest[0], 'lead_id': newest[1]}
+        form_stats.append({
+            'form_id': report['form_id'],
+            'name': report['name'],
+            'fetched': len(report['leads']),
+            'complete': report['complete'],
+            'cursor': cursor['created_time'].isoformat() if cursor and cursor.get('created_time') else None,
+            'elapsed_ms': report['elapsed_ms'],
+            'error': report['error']
+        })
+    
+    logger.info("💾 Saved %s new leads to database (%s skipped, %s failed)", result['inserted'], result['skipped'], result['failed'])
+    
+    return {
+        'leads': result['leads'],
+        'inserted': result['inserted'],
+        'skipped': result['skipped'],
+        'failed': result['failed'],
+        'chunks': result['chunks'],
+        'forms': form_stats,
+        'elapsed_ms': round((time.perf_counter() - started) * 1000)
+    }
+
+
+def persist_job(job):
+    """Mirror a job record into Supabase so every gunicorn worker can report it"""
+    supabase.table('sync_jobs').upsert(job, on_conflict='id').execute()
+
+
+def load_job(job_id):
+    """Look up a job another worker ran"""
+    try:
+        result = supabase.table('sync_jobs').select('*').eq('id', job_id).limit(1).execute()
+        return result.data[0] if result.data else None
+    except Exception as e:
+        logger.warning("⚠️ Could not load job %s: %s", job_id, e)
+        return None
+
+
+# Only one process may run a lead sync at a time, whoever triggered it
+lead_sync_lock = ProcessLock(os.path.join(SYNC_LOCK_DIR, 'auto-dash-lead-sync.lock'))
+
+
+def lead_sync_job(progress):
+    """Background job body for a Meta lead sync"""
+    if not lead_sync_lock.acquire():
+        progress(stage='skipped')
+        return {'skipped': True, 'message': 'Another worker is already syncing leads'}
+    try:
+        result = run_lead_sync(progress=progress)
+    finally:
+        lead_sync_lock.release()
+    progress(stage='done')
+    # Keep the job record small - the dashboard reloads rows from /api/leads
+    result.pop('leads', None)
+    result['count'] = result['inserted']
+    result['message'] = f"Synced {result['inserted']} new leads from Facebook"
+    return result
+
+
+job_runner = JobRunner(max_workers=1, persist=persist_job)
+sync_scheduler = PeriodicScheduler(
+    job_runner,
+    'lead_sync',
+    lead_sync_job,
+    AUTO_SYNC_INTERVAL,
+    os.path.join(SYNC_LOCK_DIR, 'auto-dash-lead-sync-scheduler.lock')
+)
+
+
 def parse_meta_lead(meta_lead):
     """Parse Meta lead data into standardized format"""
     field_data = meta_lead.get('field_data', [])
@@ -170,54 +512,385 @@ def save_lead_to_supabase(lead_data):
             existing = supabase.table('leads').select('id').eq('meta_lead_id', lead_data.get('meta_lead_id')).execute()
             
             if existing.data:
-                print(f"⏭️ Lead {lead_data.get('meta_lead_id')} already exists, skipping")
+                logger.debug("⏭️ Lead %s already exists, skipping", lead_data.get('meta_lead_id'))
                 return existing.data[0]
         
         # Insert new lead
-        print(f"🔄 Attempting to save lead: {lead_data.get('name')}")
+        logger.debug("🔄 Attempting to save lead: %s", lead_data.get('name'))
         response = supabase.table('leads').insert(lead_data).execute()
-        print(f"💾 Saved lead: {lead_data.get('name')} (ID: {response.data[0].get('id') if response.data else 'N/A'})")
+        invalidate_leads_cache()
+        publish_lead_event('created', response.data)
+        logger.debug("💾 Saved lead: %s (ID: %s)", lead_data.get('name'), response.data[0].get('id') if response.data else 'N/A')
         return response.data[0] if response.data else None
     except Exception as e:
-        print(f"❌ Error saving lead to Supabase: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Error saving lead to Supabase: %s", e)
+        return None
+
+
+def save_leads_bulk(leads):
+    """Save parsed Meta leads in chunks (one lookup + one upsert per chunk)"""
+    # Meta can repeat a lead across pages - keep the first copy of each id
+    unique_leads = []
+    seen_ids = set()
+    for lead in leads:
+        meta_lead_id = lead.get('meta_lead_id')
+        if meta_lead_id in seen_ids:
+            continue
+        if meta_lead_id:
+            seen_ids.add(meta_lead_id)
+        unique_leads.append(lead)
+    
+    saved_leads = []
+    failed_ids = []
+    chunk_stats = []
+    
+    for start in range(0, len(unique_leads), LEAD_SYNC_CHUNK_SIZE):
+        chunk = unique_leads[start:start + LEAD_SYNC_CHUNK_SIZE]
+        stats = {
+            'chunk': len(chunk_stats) + 1,
+            'size': len(chunk),
+            'inserted': 0,
+            'skipped': 0,
+            'failed': 0
+        }
+        to_write = chunk
+        try:
+            # Resolve which leads are already stored with a single lookup
+            chunk_ids = [lead['meta_lead_id'] for lead in chunk if lead.get('meta_lead_id')]
+            if chunk_ids:
+                existing = supabase.table('leads').select('meta_lead_id').in_('meta_lead_id', chunk_ids).execute()
+                existing_ids = {row['meta_lead_id'] for row in (existing.data or [])}
+                to_write = [lead for lead in chunk if lead.get('meta_lead_id') not in existing_ids]
+                stats['skipped'] = len(chunk) - len(to_write)
+            
+            if to_write:
+                # ignore_duplicates keeps rows another writer inserted meanwhile untouched
+                response = supabase.table('leads').upsert(
+                    to_write,
+                    on_conflict='meta_lead_id',
+                    ignore_duplicates=True
+                ).execute()
+                written = response.data or []
+                if written:
+                    invalidate_leads_cache()
+                    publish_lead_event('created', written)
+                stats['inserted'] = len(written)
+                stats['skipped'] += len(to_write) - len(written)
+                saved_leads.extend(written)
+            
+            logger.info("💾 Chunk %s: %s inserted, %s skipped", stats['chunk'], stats['inserted'], stats['skipped'])
+        except Exception as e:
+            stats['failed'] = len(to_write)
+            stats['error'] = str(e)
+            failed_ids.extend(lead.get('meta_lead_id') for lead in to_write)
+            logger.error("❌ Error saving lead chunk %s: %s", stats['chunk'], e)
+        
+        chunk_stats.append(stats)
+    
+    return {
+        'leads': saved_leads,
+        'inserted': sum(stats['inserted'] for stats in chunk_stats),
+        'skipped': sum(stats['skipped'] for stats in chunk_stats),
+        'failed': sum(stats['failed'] for stats in chunk_stats),
+        'failed_ids': failed_ids,
+        'chunks': chunk_stats
+    }
+
+
+def postgrest_quote(value):
+    """Quote a value for use inside a PostgREST or=() filter"""
+    return '"' + str(value).replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def normalize_email(email):
+    """Emails are stored trimmed and lower-cased so one client has one row"""
+    return email.strip().lower() if email else None
+
+
+# Most specific match first when one lead lookup matches several ways
+LEAD_MATCH_ORDER = ('email', 'phone', 'name')
+# Rows the combined lookup reads; if it fills up, some matches (maybe the email one) were cut off
+LEAD_MATCH_LIMIT = 50
+
+
+def find_lead_id(email=None, phone=None, name=None):
+    """
+    Id of the lead matching email, else phone, else name
+
+    One or=() query covers all three. Ranking its rows is only safe when it returned every match, so a
+    full page (a phone or name shared by many leads) falls back to one lookup per column, in order.
+    """
+    values = {'email': email, 'phone': phone, 'name': name}
+    columns = [column for column in LEAD_MATCH_ORDER if values[column]]
+    if not columns:
+        return None
+    conditions = [f"{column}.eq.{postgrest_quote(values[column])}" for column in columns]
+    result = supabase.table('leads').select('id,email,phone,name').or_(','.join(conditions)) \
+        .limit(LEAD_MATCH_LIMIT).execute()
+    leads = result.data or []
+
+    if len(leads) < LEAD_MATCH_LIMIT:
+        for column in columns:
+            for lead in leads:
+                if lead.get(column) == values[column]:
+                    logger.debug("✅ Found lead by %s: %s", column, lead['id'])
+                    return lead['id']
         return None
 
+    for column in columns:
+        result = supabase.table('leads').select('id').eq(column, values[column]).limit(1).execute()
+        if result.data:
+            logger.debug("✅ Found lead by %s: %s", column, result.data[0]['id'])
+            return result.data[0]['id']
+    return None
+
+
+def encode_lead_cursor(lead):
+    """Opaque keyset cursor for the (created_at, id) position of a lead"""
+    raw = json.dumps([lead.get('created_at'), lead.get('id')])
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
 
-def get_leads_from_db(filters=None):
-    """Get leads from Supabase"""
+
+def decode_lead_cursor(cursor):
     try:
-        print(f"📋 Querying leads table with filters: {filters}")
-        query = supabase.table('leads').select('*')
-        
-        if filters:
-            if filters.get('type'):
-                query = query.eq('type', filters['type'])
-            if filters.get('status'):
-                query = query.eq('status', filters['status'])
-        
-        # No limit - fetch ALL leads
-        response = query.order('created_at', desc=True).execute()
-        print(f"✅ Query returned {len(response.data)} leads")
-        return response.data
-    except Exception as e:
-        print(f"❌ Error fetching leads from Supabase: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return []
+        created_at, lead_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except Exception:
+        raise ValueError('Invalid cursor')
+    return created_at, lead_id
+
+
+def parse_lead_fields(args):
+    """Validate a fields= projection against the leads columns"""
+    if not args.get('fields'):
+        return LEAD_DEFAULT_FIELDS
+    fields = [field.strip() for field in args.get('fields').split(',') if field.strip()]
+    unknown = [field for field in fields if field not in LEAD_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    # Cursors need both sort keys, ETags and change feeds need updated_at
+    return list(dict.fromkeys(['id', 'created_at', 'updated_at'] + fields))
+
+
+def parse_leads_query(args):
+    """Validate GET /api/leads query parameters into a query dict"""
+    query = {'filters': {}}
+    
+    for key in ('type', 'status', 'potential_status', 'sync_status', 'name', 'created_from', 'created_to'):
+        if args.get(key):
+            query['filters'][key] = args.get(key)
+    if args.get('is_manual'):
+        value = args.get('is_manual').lower()
+        if value not in ('true', 'false', '1', '0'):
+            raise ValueError('is_manual must be true or false')
+        query['filters']['is_manual'] = value in ('true', '1')
+    
+    try:
+        limit = int(args.get('limit', LEADS_DEFAULT_PAGE_SIZE))
+    except ValueError:
+        raise ValueError('limit must be an integer')
+    query['limit'] = max(1, min(limit, LEADS_MAX_PAGE_SIZE))
+    
+    query['fields'] = parse_lead_fields(args)
+    query['cursor'] = decode_lead_cursor(args.get('cursor')) if args.get('cursor') else None
+    return query
+
+
+def apply_lead_filters(db_query, filters):
+    """Apply validated GET /api/leads filters to a Supabase query"""
+    for column in ('type', 'status', 'potential_status', 'sync_status', 'is_manual'):
+        if column in filters:
+            db_query = db_query.eq(column, filters[column])
+    if filters.get('name'):
+        db_query = db_query.ilike('name', f"{filters['name']}%")
+    if filters.get('created_from'):
+        db_query = db_query.gte('created_at', filters['created_from'])
+    if filters.get('created_to'):
+        db_query = db_query.lte('created_at', filters['created_to'])
+    return db_query
+
+
+def get_leads_from_db(query):
+    """Get one keyset page of leads from Supabase, newest first"""
+    filters = query.get('filters', {})
+    logger.debug("📋 Querying leads table with filters: %s", filters)
+    cursor = query.get('cursor')
+    
+    # The first page counts in the same request; later pages need a separate
+    # head-only count because the cursor filter would shrink it
+    db_query = supabase.table('leads').select(','.join(query['fields']), count=None if cursor else 'exact')
+    db_query = apply_lead_filters(db_query, filters)
+    
+    # Keyset pagination on (created_at, id) - stable no matter how deep the page
+    if cursor:
+        created_at, lead_id = cursor
+        db_query = db_query.or_(
+            f"created_at.lt.{postgrest_quote(created_at)},"
+            f"and(created_at.eq.{postgrest_quote(created_at)},id.lt.{postgrest_quote(lead_id)})"
+        )
+    
+    # Fetch one extra row to know whether another page exists
+    response = db_query.order('created_at', desc=True).order('id', desc=True).limit(query['limit'] + 1).execute()
+    leads = response.data or []
+    next_cursor = None
+    if len(leads) > query['limit']:
+        leads = leads[:query['limit']]
+        next_cursor = encode_lead_cursor(leads[-1])
+    
+    total = response.count
+    if cursor:
+        count_query = apply_lead_filters(supabase.table('leads').select('id', count='exact', head=True), filters)
+        total = count_query.execute().count
+    
+    logger.debug("✅ Query returned %s of %s leads", len(leads), total)
+    return {'data': leads, 'total': total, 'next_cursor': next_cursor}
+
+
+def record_deleted_leads(lead_ids):
+    """Write tombstones so /api/leads/changes can report deletions"""
+    for start in range(0, len(lead_ids), LEAD_SYNC_CHUNK_SIZE):
+        chunk = lead_ids[start:start + LEAD_SYNC_CHUNK_SIZE]
+        try:
+            supabase.table('deleted_leads').upsert(
+                [{'lead_id': lead_id} for lead_id in chunk],
+                on_conflict='lead_id'
+            ).execute()
+        except Exception as e:
+            logger.warning("⚠️ Could not record %s deleted lead(s): %s", len(chunk), e)
+
+
+def delete_leads_bulk(counts):
+    """
+    Delete every lead and its child rows in chunked in_() batches, tallying rows per table
+
+    Raises RuntimeError instead of looping forever when a batch does not go away (e.g. a row-level
+    security policy that lets the key read leads but not delete them)
+    """
+    deleted_ids = set()
+    while True:
+        # Always read the first chunk again - the previous one is gone, so this pages forward
+        response = supabase.table('leads').select('id').limit(LEAD_DELETE_CHUNK_SIZE).execute()
+        lead_ids = [lead['id'] for lead in (response.data or [])]
+        if not lead_ids:
+            return counts
+        if deleted_ids.intersection(lead_ids):
+            raise RuntimeError('Deleted leads are still returned - stopping the bulk delete')
+        
+        # Children first so the per-table counts are real, not hidden inside ON DELETE CASCADE
+        for table in LEAD_CHILD_TABLES:
+            deleted = supabase.table(table).delete(count='exact', returning='minimal') \
+                .in_('lead_id', lead_ids).execute()
+            counts[table] += deleted.count or 0
+        deleted = supabase.table('leads').delete(count='exact', returning='minimal') \
+            .in_('id', lead_ids).execute()
+        if deleted.count == 0:
+            raise RuntimeError(f'A batch of {len(lead_ids)} leads deleted nothing - stopping the bulk delete')
+        counts['leads'] += deleted.count if deleted.count is not None else len(lead_ids)
+        deleted_ids.update(lead_ids)
+        
+        record_deleted_leads(lead_ids)
+        invalidate_leads_cache()
+        lead_data_cache.clear()
+        logger.info("🗑️ Deleted batch of %s leads (%s so far)", len(lead_ids), counts['leads'])
+
+
+def encode_changes_cursor(position):
+    """Opaque next_since for the change feed: (updated_at, id) of the last lead sent + tombstone watermark"""
+    raw = json.dumps(list(position))
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+
+
+def decode_changes_since(since):
+    """A plain timestamp (first call) or a next_since cursor -> (updated_at, lead id, deleted_since)"""
+    try:
+        datetime.fromisoformat(since.replace('Z', '+00:00'))
+        return since, None, since
+    except ValueError:
+        pass
+    try:
+        updated_at, lead_id, deleted_since = json.loads(base64.urlsafe_b64decode(since.encode('ascii')))
+    except Exception:
+        raise ValueError('since must be an ISO timestamp or a next_since value')
+    return updated_at, lead_id, deleted_since
+
+
+def latest_timestamp(a, b):
+    """The later of two ISO timestamps (naive ones are UTC, as Postgres stores them)"""
+    def parse(value):
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+    return a if parse(a) >= parse(b) else b
+
+
+def get_lead_changes(position, fields):
+    """One page of leads after the (updated_at, id) position, plus ids deleted in the same time window"""
+    updated_at, lead_id, deleted_since = position
+    db_query = supabase.table('leads').select(','.join(fields))
+    # Keyset on (updated_at, id): rows sharing a timestamp continue on the next page instead of being skipped
+    if lead_id:
+        db_query = db_query.or_(
+            f"updated_at.gt.{postgrest_quote(updated_at)},"
+            f"and(updated_at.eq.{postgrest_quote(updated_at)},id.gt.{postgrest_quote(lead_id)})"
+        )
+    else:
+        db_query = db_query.gt('updated_at', updated_at)
+    response = db_query.order('updated_at').order('id').limit(LEADS_MAX_PAGE_SIZE + 1).execute()
+    changed = response.data or []
+    has_more = len(changed) > LEADS_MAX_PAGE_SIZE
+    if has_more:
+        changed = changed[:LEADS_MAX_PAGE_SIZE]
+    if changed:
+        updated_at, lead_id = changed[-1]['updated_at'], changed[-1]['id']
+    
+    # Every page reports the deletions up to where its leads reach, so a lead deleted while a
+    # backlog is being paged is not skipped when the position moves past its deleted_at
+    tombstone_query = supabase.table('deleted_leads').select('lead_id,deleted_at').gt('deleted_at', deleted_since)
+    if has_more:
+        tombstone_query = tombstone_query.lte('deleted_at', updated_at)
+    deleted = tombstone_query.order('deleted_at').execute().data or []
+    if has_more:
+        deleted_since = latest_timestamp(deleted_since, updated_at)
+    elif deleted:
+        deleted_since = deleted[-1]['deleted_at']
+    
+    return {
+        'changed': changed,
+        'deleted': [row['lead_id'] for row in deleted],
+        'has_more': has_more,
+        'next_since': encode_changes_cursor((updated_at, lead_id, deleted_since))
+    }
+
+
+def invalidate_leads_cache():
+    """Retire cached lead pages after a write to the leads table, on every worker when shared"""
+    leads_generation.bump()
+    leads_cache.clear()
+
+
+def publish_lead_event(event, leads):
+    """Push created/updated lead rows to connected /api/leads/stream clients"""
+    rows = [{field: lead.get(field) for field in LEAD_DEFAULT_FIELDS} for lead in (leads or [])]
+    if rows:
+        lead_events.publish(event, {'leads': rows})
+
+
+def leads_page_etag(query, page):
+    """Strong ETag from the query, the newest updated_at and the row counts of a page - the same on every worker"""
+    newest = max((lead.get('updated_at') or '' for lead in page['data']), default='')
+    fingerprint = f"{json.dumps(query, sort_keys=True)}|{newest}|{page['total']}|{len(page['data'])}"
+    return hashlib.sha256(fingerprint.encode('utf-8')).hexdigest()[:32]
 
 
 def send_event_to_meta(lead_id, event_type, event_data):
     """Send event to Meta Conversions API (Event Manager)"""
     try:
-        url = f'{META_BASE_URL}/{FB_PIXEL_ID}/events'
-        
         payload = {
             'data': [
                 {
                     'event_name': event_type,  # 'Purchase', 'Lead', 'ViewContent', etc
                     'event_time': int(datetime.utcnow().timestamp()),
+                    # New for every send, shared by that send's retries: Meta drops repeats of an
+                    # event_name + event_id, so a retried POST counts once and a real resend still counts
+                    'event_id': str(uuid.uuid4()),
                     'user_data': {
                         'em': event_data.get('email', ''),  # hashed email
                         'ph': event_data.get('phone', ''),  # hashed phone
@@ -230,17 +903,13 @@ def send_event_to_meta(lead_id, event_type, event_data):
                     'event_source_url': event_data.get('source_url', ''),
                     'action_source': 'website'
                 }
-            ],
-            'access_token': META_PAGE_ACCESS_TOKEN
+            ]
         }
         
-        response = requests.post(url, json=payload)
-        response.raise_for_status()
-        
-        return response.json()
+        return meta_client.post(f'/{FB_PIXEL_ID}/events', json_body=payload, idempotent=True)
     
     except Exception as e:
-        print(f"Error sending event to Meta: {str(e)}")
+        logger.error("Error sending event to Meta: %s", e)
         return {'success': False, 'error': str(e)}
 
 
@@ -264,62 +933,211 @@ def property_dashboard():
 @app.route('/api/health', methods=['GET'])
 def health():
     """Health check endpoint"""
-    return jsonify({'status': 'ok', 'service': 'Meta Lead Dashboard Backend'}), 200
+    return jsonify({'status': 'ok', 'service': 'Meta Lead Dashboard Backend', 'pdf_parser': parse_pool.stats(), 'pdf_cache': parse_cache.stats(), 'pdf_text_tiers': text_tier_stats(), 'lead_data_cache': lead_data_cache.stats()}), 200
 
 
 @app.route('/api/leads', methods=['GET'])
 def get_leads():
-    """Get leads from database for instant load"""
+    """Get one page of leads from the database (filters, keyset cursor, field projection)"""
     try:
-        filters = {}
-        if request.args.get('type'):
-            filters['type'] = request.args.get('type')
-        if request.args.get('status'):
-            filters['status'] = request.args.get('status')
-        
-        print("📊 Loading leads from database (instant)...")
-        leads = get_leads_from_db(filters)
+        try:
+            query = parse_leads_query(request.args)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        
+        # No readable generation (Redis down) means no way to tell a stale page - skip the cache
+        generation = leads_generation.current()
+        cache_key = json.dumps([generation, query], sort_keys=True)
+        cached = leads_cache.get(cache_key) if generation is not None else None
+        if cached is None:
+            logger.debug("📊 Loading leads from database (instant)...")
+            page = get_leads_from_db(query)
+            body = app.json.dumps({
+                'data': page['data'],
+                'count': len(page['data']),
+                'total': page['total'],
+                'limit': query['limit'],
+                'next_cursor': page['next_cursor']
+            })
+            cached = {'body': body, 'etag': leads_page_etag(query, page), 'count': len(page['data'])}
+            if generation is not None:
+                leads_cache.set(cache_key, cached)
+            cache_status = 'MISS'
+        else:
+            cache_status = 'HIT'
         
-        print(f"📤 Returning {len(leads)} leads from database")
-        return jsonify({'data': leads, 'count': len(leads)}), 200
+        # Conditional GET - a cache hit answers without touching Supabase or re-serializing
+        if request.if_none_match.contains(cached['etag']):
+            response = app.response_class(status=304)
+        else:
+            logger.debug("📤 Returning %s leads (%s)", cached['count'], cache_status)
+            response = app.response_class(cached['body'], status=200, mimetype='application/json')
+        response.set_etag(cached['etag'])
+        response.headers['Cache-Control'] = 'no-cache'
+        response.headers['X-Cache'] = cache_status
+        return response
         
     except Exception as e:
-        print(f"❌ Error loading leads from database: {str(e)}")
+        logger.error("❌ Error loading leads from database: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
-@app.route('/api/leads/sync', methods=['POST'])
-def sync_leads():
-    """Fetch fresh leads from Facebook and save to database"""
+@app.route('/api/leads/changes', methods=['GET'])
+def get_leads_changes():
+    """Leads created/updated since a timestamp (or a previous next_since), plus tombstones for deleted ids"""
     try:
-        print("📞 Fetching fresh leads from Facebook API...")
+        since = request.args.get('since')
+        if not since:
+            return jsonify({'success': False, 'error': 'since is required'}), 400
+        try:
+            position = decode_changes_since(since)
+            fields = parse_lead_fields(request.args)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
         
-        # Fetch from Facebook
-        meta_leads = get_leads_from_meta()
-        print(f"✅ Fetched {len(meta_leads)} leads from Facebook")
+        changes = get_lead_changes(position, fields)
+        logger.debug("🔁 %s changed / %s deleted leads since %s", len(changes['changed']), len(changes['deleted']), since)
+        return jsonify({'success': True, **changes}), 200
         
-        # Parse and save
-        new_leads = []
-        for meta_lead in meta_leads:
-            parsed_lead = parse_meta_lead(meta_lead)
-            saved = save_lead_to_supabase(parsed_lead)
-            if saved:
-                new_leads.append(parsed_lead)
+    except Exception as e:
+        logger.error("❌ Error loading lead changes: %s", e)
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+def parse_bundle_fields(args):
+    """Split a lead-bundle fields= projection into lead columns and columns per embedded table"""
+    if not args.get('fields'):
+        return LEAD_DEFAULT_FIELDS, {key: list(columns) for key, (_, columns) in BUNDLE_EMBEDS.items()}
+    
+    lead_fields = ['id']
+    embeds = {}
+    unknown = []
+    for field in (field.strip() for field in args.get('fields').split(',')):
+        if not field:
+            continue
+        key, _, column = field.partition('.')
+        if key in BUNDLE_EMBEDS:
+            columns = BUNDLE_EMBEDS[key][1]
+            if not column:
+                embeds[key] = list(columns)
+            elif column in columns:
+                embeds.setdefault(key, ['id'])
+                if column not in embeds[key]:
+                    embeds[key].append(column)
+            else:
+                unknown.append(field)
+        elif field in LEAD_COLUMNS:
+            lead_fields.append(field)
+        else:
+            unknown.append(field)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return list(dict.fromkeys(lead_fields)), embeds
+
+
+@app.route('/api/lead-bundle/<lead_id>', methods=['GET'])
+def get_lead_bundle(lead_id):
+    """A lead with its saved client and property data, in one embedded select"""
+    try:
+        try:
+            uuid.UUID(lead_id)
+        except ValueError:
+            return jsonify({'success': False, 'error': 'lead_id must be a UUID'}), 400
+        try:
+            lead_fields, embeds = parse_bundle_fields(request.args)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        
+        # leads(..., clients_data(...), properties_data(...)) - PostgREST joins on the lead_id foreign keys
+        select = list(lead_fields)
+        for key, columns in embeds.items():
+            select.append(f"{BUNDLE_EMBEDS[key][0]}({','.join(columns)})")
+        db_query = supabase.table('leads').select(','.join(select)).eq('id', lead_id)
+        for key in embeds:
+            # Newest saved row if a lead was ever linked to more than one
+            table = BUNDLE_EMBEDS[key][0]
+            db_query = db_query.order('updated_at', desc=True, foreign_table=table).limit(1, foreign_table=table)
+        result = db_query.limit(1).execute()
+        
+        if not result.data:
+            return jsonify({'success': False, 'error': 'Lead not found'}), 404
+        lead = result.data[0]
         
-        print(f"💾 Saved {len(new_leads)} new leads to database")
+        bundle = {'success': True}
+        for key in embeds:
+            rows = lead.pop(BUNDLE_EMBEDS[key][0], None) or []
+            bundle[key] = rows[0] if rows else None
+        bundle['lead'] = lead
+        logger.debug("📦 Lead bundle for %s (embeds: %s)", lead_id, ', '.join(embeds) or 'none')
+        return jsonify(bundle), 200
+        
+    except Exception as e:
+        logger.error("❌ Error loading lead bundle: %s", e)
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/leads/stream', methods=['GET'])
+def stream_leads():
+    """Server-Sent Events stream of lead inserts and updates made by this worker"""
+    subscription = lead_events.subscribe()
+    if subscription is None:
+        response = jsonify({'success': False, 'error': 'Too many live connections, poll /api/leads/changes'})
+        response.headers['Retry-After'] = '30'
+        return response, 503
+    
+    def generate():
+        try:
+            yield "retry: 5000\n\n"
+            yield format_sse({'connected_at': datetime.now(timezone.utc).isoformat()}, event='ready')
+            while True:
+                message = subscription.get(timeout=SSE_HEARTBEAT_SECONDS)
+                if subscription.overflowed:
+                    # Dropped for falling behind - the client should catch up from the changes feed
+                    yield format_sse({'reason': 'client too slow'}, event='resync')
+                    return
+                if message is None:
+                    # SSE comment line keeps proxies from closing an idle connection
+                    yield ': heartbeat\n\n'
+                    continue
+                yield format_sse(message['data'], event=message['event'])
+        finally:
+            lead_events.unsubscribe(subscription)
+    
+    response = app.response_class(generate(), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+
+@app.route('/api/leads/sync', methods=['POST'])
+def sync_leads():
+    """Start a background sync of fresh leads from Facebook"""
+    try:
+        job = job_runner.submit('lead_sync', lead_sync_job, trigger='api')
+        logger.info("📞 Lead sync job %s is %s", job['id'], job['status'])
         
         return jsonify({
             'success': True,
-            'message': f'Synced {len(new_leads)} new leads from Facebook',
-            'leads': new_leads,
-            'count': len(new_leads)
-        }), 200
+            'message': 'Lead sync started',
+            'job_id': job['id'],
+            'status': job['status'],
+            'status_url': f"/api/sync-jobs/{job['id']}"
+        }), 202
         
     except Exception as e:
-        print(f"❌ Error syncing from Facebook: {str(e)}")
+        logger.error("❌ Error starting Facebook sync: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@app.route('/api/sync-jobs/<job_id>', methods=['GET'])
+def get_sync_job(job_id):
+    """Report progress and results of a background sync job"""
+    job = job_runner.get(job_id) or load_job(job_id)
+    if not job:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    return jsonify({'success': True, 'job': job}), 200
+
+
 @app.route('/api/leads/debug-meta', methods=['GET'])
 def debug_meta_leads():
     """Debug endpoint to see raw Facebook API response"""
@@ -371,6 +1189,7 @@ def test_save_one_lead():
             
             # Try insert
             response = supabase.table('leads').insert(parsed).execute()
+            invalidate_leads_cache()
             
             if response.data:
                 return jsonify({
@@ -408,14 +1227,9 @@ def test_save_one_lead():
 def check_lead_forms():
     """Check all lead forms on the page"""
     try:
-        url = f'{META_BASE_URL}/{META_PAGE_ID}/leadgen_forms'
-        params = {
-            'fields': 'id,name,status,leads_count',
-            'access_token': META_PAGE_ACCESS_TOKEN
-        }
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
+        data = meta_client.get(f'/{META_PAGE_ID}/leadgen_forms', {
+            'fields': 'id,name,status,leads_count'
+        })
         
         return jsonify({
             'success': True,
@@ -456,6 +1270,7 @@ def sync_lead_event(lead_id):
             'last_sync': datetime.utcnow().isoformat(),
             'sync_status': 'sent' if result else 'failed'
         }).eq('id', lead_id).execute()
+        invalidate_leads_cache()
         
         # Log sync event
         supabase.table('sync_events').insert({
@@ -472,7 +1287,7 @@ def sync_lead_event(lead_id):
         }), 200
     
     except Exception as e:
-        print(f"Error syncing lead event: {str(e)}")
+        logger.error("Error syncing lead event: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
@@ -508,7 +1323,7 @@ def create_lead():
         return jsonify({'success': True, 'data': saved}), 201
     
     except Exception as e:
-        print(f"Error creating lead: {str(e)}")
+        logger.error("Error creating lead: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
@@ -519,6 +1334,8 @@ def update_lead(lead_id):
         data = request.get_json()
         
         response = supabase.table('leads').update(data).eq('id', lead_id).execute()
+        invalidate_leads_cache()
+        publish_lead_event('updated', response.data)
         
         return jsonify({'success': True, 'data': response.data[0] if response.data else None}), 200
     
@@ -535,6 +1352,10 @@ def delete_lead(lead_id):
         supabase.table('properties_data').delete().eq('lead_id', lead_id).execute()
         # Then delete from leads
         supabase.table('leads').delete().eq('id', lead_id).execute()
+        record_deleted_leads([lead_id])
+        invalidate_leads_cache()
+        lead_data_cache.invalidate('client', f'lead:{lead_id}')
+        lead_data_cache.invalidate('property', f'lead:{lead_id}')
         return jsonify({'success': True, 'message': 'Lead and all related data deleted'}), 200
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -542,28 +1363,30 @@ def delete_lead(lead_id):
 
 @app.route('/api/leads/clear-all', methods=['POST'])
 def clear_all_leads():
-    """Delete all leads from database"""
+    """Delete all leads (and their client, property, sync event and reminder rows) from database"""
+    started = time.monotonic()
+    counts = {table: 0 for table in ('leads',) + LEAD_CHILD_TABLES}
     try:
-        # Get all lead IDs first
-        all_leads = supabase.table('leads').select('id').execute()
+        delete_leads_bulk(counts)
+        elapsed_ms = int((time.monotonic() - started) * 1000)
+        logger.info("🗑️ Cleared %s leads in %sms", counts['leads'], elapsed_ms)
         
-        if all_leads.data:
-            # Delete each lead
-            for lead in all_leads.data:
-                supabase.table('leads').delete().eq('id', lead['id']).execute()
-            
-            return jsonify({
-                'success': True, 
-                'message': f'Cleared {len(all_leads.data)} leads from database'
-            }), 200
-        else:
-            return jsonify({
-                'success': True, 
-                'message': 'Database already empty'
-            }), 200
+        return jsonify({
+            'success': True,
+            'message': f"Cleared {counts['leads']} leads from database" if counts['leads'] else 'Database already empty',
+            'deleted': counts,
+            'elapsed_ms': elapsed_ms
+        }), 200
     
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        # Batches already deleted stay deleted - calling again picks up where this stopped
+        logger.error("❌ Error clearing leads: %s", e)
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'deleted': counts,
+            'elapsed_ms': int((time.monotonic() - started) * 1000)
+        }), 500
 
 
 @app.route('/api/leads/<lead_id>/signal', methods=['POST'])
@@ -573,15 +1396,17 @@ def update_signal(lead_id):
         data = request.get_json()
         signal = data.get('signal', 'green')  # 'green' or 'red'
         
-        supabase.table('leads').update({
+        response = supabase.table('leads').update({
             'sync_signal': signal,
             'potential_status': 'qualified' if signal == 'green' else 'not-qualified'
         }).eq('id', lead_id).execute()
+        invalidate_leads_cache()
+        publish_lead_event('updated', response.data)
         
         return jsonify({'success': True, 'message': f'Signal updated to {signal}'}), 200
     
     except Exception as e:
-        print(f"Error updating signal: {str(e)}")
+        logger.error("Error updating signal: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
@@ -633,9 +1458,65 @@ def webhook():
 
 # ========== PDF PARSING ENDPOINT ==========
 
+def record_text_tier(kind, result):
+    """Count the extractor that produced a parse so the pdfplumber fallback rate is visible"""
+    tier = result.get('text_tier', 'unknown')
+    with text_tier_lock:
+        text_tier_counts[f'{kind}:{tier}'] += 1
+    logger.info("📄 %s text extracted with %s", kind.upper(), tier)
+
+
+def text_tier_stats():
+    with text_tier_lock:
+        return dict(text_tier_counts)
+
+
+def parse_pool_error_response(error):
+    """429 when the parser queue is full, 503 when a parse timed out or crashed"""
+    response = jsonify({'success': False, 'error': str(error)})
+    response.headers['Retry-After'] = str(error.retry_after)
+    return response, 429 if isinstance(error, ParsePoolBusy) else 503
+
+
+@app.errorhandler(413)
+def upload_too_large(error):
+    return jsonify({'success': False, 'error': f'Upload too large (limit {MAX_UPLOAD_MB:g} MB)'}), 413
+
+
+PDF_PARSERS = {'mvr': parse_mvr_pdf, 'dash': parse_dash_pdf}
+
+
+def parse_spooled_pdf(kind, upload):
+    """
+    Parse a spooled MVR / DASH upload, answering re-uploads of the same report from the cache
+
+    Returns:
+        (payload, 'HIT' | 'MISS') - payload['success'] is False when the PDF could not be parsed
+    """
+    payload = parse_cache.get(kind, upload.sha256)
+    if payload is not None:
+        return payload, 'HIT'
+
+    # Parse the PDF in the worker pool
+    result = parse_pool.run(PDF_PARSERS[kind], upload.path)
+    if not result['success']:
+        return result, 'MISS'
+    record_text_tier(kind, result)
+
+    payload = {
+        'success': True,
+        'data': result['data']
+    }
+    if kind == 'dash':
+        payload['raw_text'] = result['raw_text'][:1000]  # First 1000 chars for debugging
+    parse_cache.set(kind, upload.sha256, payload)
+    return payload, 'MISS'
+
+
 @app.route('/api/parse-mvr', methods=['POST'])
 def parse_mvr():
     """Parse uploaded MVR PDF and extract driver information"""
+    upload = None
     try:
         if 'file' not in request.files:
             return jsonify({'success': False, 'error': 'No file uploaded'}), 400
@@ -648,37 +1529,44 @@ def parse_mvr():
         if not file.filename.lower().endswith('.pdf'):
             return jsonify({'success': False, 'error': 'Only PDF files are supported'}), 400
         
-        # Read file content
-        pdf_content = file.read()
+        # Stream to disk (rejecting non-PDFs on the first bytes); the parser opens the path
+        upload = spool_pdf_upload(file, PDF_UPLOAD_DIR)
         
-        # Parse the PDF
-        result = parse_mvr_pdf(pdf_content)
-        
-        if not result['success']:
-            return jsonify(result), 400
+        payload, cache_status = parse_spooled_pdf('mvr', upload)
+        if not payload['success']:
+            return jsonify(payload), 400
         
         # CRITICAL: Verify policy1_vehicles is in the response before sending to client
-        print(f"\n[API] /parse-mvr endpoint response verification:")
-        print(f"[API] - 'policy1_vehicles' in result['data']: {'policy1_vehicles' in result['data']}")
-        if 'policy1_vehicles' in result['data']:
-            print(f"[API] - result['data']['policy1_vehicles']: {result['data']['policy1_vehicles']}")
+        logger.debug("[API] /parse-mvr endpoint response verification:")
+        logger.debug("[API] - 'policy1_vehicles' in result['data']: %s", 'policy1_vehicles' in payload['data'])
+        if 'policy1_vehicles' in payload['data']:
+            logger.debug("[API] - result['data']['policy1_vehicles']: %s", payload['data']['policy1_vehicles'])
         
         # Return extracted data
-        return jsonify({
-            'success': True,
-            'data': result['data']
-        }), 200
-        
+        response = jsonify(payload)
+        response.headers['X-Cache'] = cache_status
+        return response, 200
+        
+    except RequestEntityTooLarge:
+        raise  # answered by upload_too_large
+    except UploadRejected as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    except ParsePoolError as e:
+        return parse_pool_error_response(e)
     except Exception as e:
         return jsonify({
             'success': False,
             'error': f'Server error: {str(e)}'
         }), 500
+    finally:
+        if upload is not None:
+            upload.remove()
 
 
 @app.route('/api/parse-dash', methods=['POST'])
 def parse_dash():
     """Parse uploaded DASH PDF and extract driver information"""
+    upload = None
     try:
         if 'file' not in request.files:
             return jsonify({'success': False, 'error': 'No file uploaded'}), 400
@@ -691,27 +1579,136 @@ def parse_dash():
         if not file.filename.lower().endswith('.pdf'):
             return jsonify({'success': False, 'error': 'Only PDF files are supported'}), 400
         
-        # Read file content
-        pdf_content = file.read()
-        
-        # Parse the PDF
-        result = parse_dash_pdf(pdf_content)
+        # Stream to disk (rejecting non-PDFs on the first bytes); the parser opens the path
+        upload = spool_pdf_upload(file, PDF_UPLOAD_DIR)
         
-        if not result['success']:
-            return jsonify(result), 400
+        payload, cache_status = parse_spooled_pdf('dash', upload)
+        if not payload['success']:
+            return jsonify(payload), 400
         
         # Return extracted data AND raw text for debugging
+        response = jsonify(payload)
+        response.headers['X-Cache'] = cache_status
+        return response, 200
+        
+    except RequestEntityTooLarge:
+        raise  # answered by upload_too_large
+    except UploadRejected as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    except ParsePoolError as e:
+        return parse_pool_error_response(e)
+    except Exception as e:
         return jsonify({
-            'success': True,
-            'data': result['data'],
-            'raw_text': result['raw_text'][:1000]  # First 1000 chars for debugging
-        }), 200
-        
+            'success': False,
+            'error': f'Server error: {str(e)}'
+        }), 500
+    finally:
+        if upload is not None:
+            upload.remove()
+
+
+@app.route('/api/parse-batch', methods=['POST'])
+def parse_batch():
+    """
+    Parse a household's MVR and DASH PDFs in one request and merge them per driver
+
+    Multipart fields are named by report type, optionally with a driver key: "mvr:0", "dash:0",
+    "mvr:1", ... Files without a key are matched to a driver by licence number.
+    """
+    uploads = []
+    try:
+        files = [(field, file) for field, file in request.files.items(multi=True)]
+        if not files:
+            return jsonify({'success': False, 'error': 'No files uploaded'}), 400
+        if len(files) > PDF_BATCH_MAX_FILES:
+            return jsonify({'success': False, 'error': f'At most {PDF_BATCH_MAX_FILES} files per batch'}), 400
+
+        entries = []
+        for field, file in files:
+            kind, _, driver = field.partition(':')
+            kind = kind.strip().lower()
+            if kind not in PDF_PARSERS:
+                return jsonify({'success': False, 'error': f"Unknown report type in field '{field}' (use mvr or dash)"}), 400
+            entry = {'field': field, 'filename': file.filename, 'type': kind, 'driver': driver.strip() or None}
+            entries.append(entry)
+            if not file.filename or not file.filename.lower().endswith('.pdf'):
+                entry['error'] = 'Only PDF files are supported'
+                continue
+            try:
+                entry['upload'] = spool_pdf_upload(file, PDF_UPLOAD_DIR)
+                uploads.append(entry['upload'])
+            except UploadRejected as e:
+                entry['error'] = str(e)
+
+        # Never more threads than parser processes, so one batch can't fill the pool's wait queue
+        to_parse = [entry for entry in entries if 'upload' in entry]
+        if to_parse:
+            workers = min(len(to_parse), PDF_PARSE_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='parse-batch') as pool:
+                futures = {pool.submit(parse_spooled_pdf, entry['type'], entry['upload']): entry for entry in to_parse}
+                for future in as_completed(futures):
+                    entry = futures[future]
+                    try:
+                        payload, entry['cache'] = future.result()
+                    except ParsePoolBusy:
+                        raise
+                    except ParsePoolError as e:
+                        entry['error'] = str(e)
+                        continue
+                    if payload['success']:
+                        entry['data'] = payload['data']
+                    else:
+                        entry['error'] = payload.get('error', 'Could not parse PDF')
+
+        # Group by driver key, else by licence number; unmatched reports stand alone
+        drivers = {}
+        reports = {}
+        for index, entry in enumerate(entries):
+            if 'data' not in entry:
+                continue
+            key = entry['driver']
+            if key is None:
+                licence = licence_key(entry['data'].get('license_number'))
+                key = f'licence:{licence}' if licence else f'file:{index}'
+            driver = drivers.setdefault(key, {'driver': entry['driver'] or key, 'files': []})
+            driver['files'].append(entry['filename'])
+            # First report of each type wins if a driver was sent two
+            reports.setdefault(key, {}).setdefault(entry['type'], entry['data'])
+
+        # Only the merge goes back - the per-report dicts would roughly triple the response
+        for key, driver in drivers.items():
+            driver['data'] = merge_driver_reports(mvr=reports[key].get('mvr'), dash=reports[key].get('dash'))
+
+        results = [{
+            'field': entry['field'],
+            'filename': entry['filename'],
+            'type': entry['type'],
+            'driver': entry['driver'],
+            'success': 'data' in entry,
+            'cache': entry.get('cache'),
+            'error': entry.get('error')
+        } for entry in entries]
+        parsed = sum(1 for result in results if result['success'])
+        logger.info("📦 Batch parsed %s/%s PDFs into %s driver(s)", parsed, len(results), len(drivers))
+
+        return jsonify({
+            'success': parsed > 0,
+            'drivers': list(drivers.values()),
+            'files': results
+        }), 200 if parsed else 400
+
+    except RequestEntityTooLarge:
+        raise  # answered by upload_too_large
+    except ParsePoolError as e:
+        return parse_pool_error_response(e)
     except Exception as e:
         return jsonify({
             'success': False,
             'error': f'Server error: {str(e)}'
         }), 500
+    finally:
+        for upload in uploads:
+            upload.remove()
 
 
 @app.route('/api/save-client', methods=['POST'])
@@ -723,9 +1720,9 @@ def save_client():
         if not data:
             return jsonify({'success': False, 'error': 'No data provided'}), 400
         
-        print(f"💾 Saving client data to Supabase...")
-        print(f"📊 Data received keys: {list(data.keys())}")
-        print(f"📊 Received drivers: {len(data.get('drivers', []))} driver(s)")
+        logger.debug("💾 Saving client data to Supabase...")
+        logger.debug("📊 Data received keys: %s", list(data.keys()))
+        logger.debug("📊 Received drivers: %s driver(s)", len(data.get('drivers', [])))
         
         # Get email/phone/name to identify the lead
         email = None
@@ -734,117 +1731,52 @@ def save_client():
         
         if data.get('drivers') and len(data['drivers']) > 0:
             driver = data['drivers'][0]
-            print(f"🔍 First driver keys: {list(driver.keys())[:5]}...")
+            logger.debug("🔍 First driver keys: %s...", list(driver.keys())[:5])
             email = driver.get('personalEmail')
             phone = driver.get('personalMobile')
             name = driver.get('personalName') or driver.get('mainName')
-            print(f"✓ Extracted - Email: {email}, Phone: {phone}, Name: {name}")
+            logger.debug("✓ Extracted - Email: %s, Phone: %s, Name: %s", email, phone, name)
         else:
-            print(f"⚠️ No drivers data found in request")
+            logger.warning("⚠️ No drivers data found in request")
         
-        print(f"📋 Lead info - Name: {name}, Email: {email}, Phone: {phone}")
+        logger.debug("📋 Lead info - Name: %s, Email: %s, Phone: %s", name, email, phone)
         
-        # Find lead by email, phone, or name
-        lead_id = None
-        
-        # Try email first
-        if email:
-            try:
-                result = supabase.table('leads').select('id').eq('email', email).limit(1).execute()
-                if result.data and len(result.data) > 0:
-                    lead_id = result.data[0]['id']
-                    print(f"✅ Found lead by email {email}: {lead_id}")
-            except Exception as e:
-                print(f"⚠️ Error finding lead by email: {str(e)}")
-        
-        # Try phone if email didn't work
-        if not lead_id and phone:
-            try:
-                result = supabase.table('leads').select('id').eq('phone', phone).limit(1).execute()
-                if result.data and len(result.data) > 0:
-                    lead_id = result.data[0]['id']
-                    print(f"✅ Found lead by phone {phone}: {lead_id}")
-            except Exception as e:
-                print(f"⚠️ Error finding lead by phone: {str(e)}")
+        if not email:
+            logger.error("❌ Cannot save - no email available in drivers")
+            return jsonify({
+                'success': False,
+                'error': 'Cannot save without email'
+            }), 400
         
-        # Try name if still not found
-        if not lead_id and name:
-            try:
-                result = supabase.table('leads').select('id').eq('name', name).limit(1).execute()
-                if result.data and len(result.data) > 0:
-                    lead_id = result.data[0]['id']
-                    print(f"✅ Found lead by name {name}: {lead_id}")
-            except Exception as e:
-                print(f"⚠️ Error finding lead by name: {str(e)}")
+        # Find the lead in one query, preferring an email match over phone over name
+        lead_id = None
+        try:
+            lead_id = find_lead_id(email=email, phone=phone, name=name)
+        except Exception as e:
+            logger.warning("⚠️ Error finding lead: %s", e)
         
         if not lead_id:
-            print(f"⚠️ No lead found with email={email}, phone={phone}, name={name}")
+            logger.debug("⚠️ No lead found with email=%s, phone=%s, name=%s", email, phone, name)
         
         # Prepare data for storage - only include columns that exist in table
         save_data = {
-            'email': email,
+            'email': normalize_email(email),
             'drivers': data.get('drivers', []),
             'updated_at': datetime.utcnow().isoformat()
         }
         
-        # Add lead_id if found
+        # Add lead_id if found (an existing link is kept otherwise - upsert only sets these columns)
         if lead_id:
             save_data['lead_id'] = lead_id
         
-        print(f"💾 INSERT/UPDATE STEP - lead_id: {lead_id}, email: {email}, phone: {phone}")
-        print(f"📦 Data to save keys: {list(save_data.keys())}")
-        print(f"📦 Drivers count: {len(save_data.get('drivers', []))}")
-        
-        # Insert or update in clients_data table
-        if email:
-            print(f"💡 Saving client data by email: {email} (lead_id: {lead_id})")
-            try:
-                # Prefer to update by lead_id if found, else by email
-                if lead_id:
-                    result = supabase.table('clients_data').select('id').eq('lead_id', lead_id).limit(1).execute()
-                    if result.data and len(result.data) > 0:
-                        print(f"🔄 Existing record found for lead {lead_id}, updating...")
-                        save_result = supabase.table('clients_data').update(save_data).eq('lead_id', lead_id).execute()
-                        print(f"✅ Updated existing client data for lead {lead_id}")
-                    else:
-                        print(f"📝 No existing record for lead {lead_id}, inserting new...")
-                        save_result = supabase.table('clients_data').insert(save_data).execute()
-                        print(f"✅ Inserted new client data for lead {lead_id}")
-                        if save_result.data:
-                            print(f"   Inserted ID: {save_result.data[0].get('id')}")
-                else:
-                    # Always upsert by email if no lead_id
-                    result = supabase.table('clients_data').select('id').eq('email', email).limit(1).execute()
-                    if result.data and len(result.data) > 0:
-                        print(f"🔄 Existing record found for email {email}, updating...")
-                        save_result = supabase.table('clients_data').update(save_data).eq('email', email).execute()
-                        print(f"✅ Updated client data by email {email}")
-                    else:
-                        print(f"📝 No existing record for email {email}, inserting new...")
-                        save_result = supabase.table('clients_data').insert(save_data).execute()
-                        print(f"✅ Inserted new client data by email {email}")
-                        if save_result.data:
-                            print(f"   Inserted ID: {save_result.data[0].get('id')}")
-            except Exception as e:
-                print(f"❌ Error saving client data: {str(e)}")
-                import traceback
-                traceback.print_exc()
-                save_result = None
-        else:
-            print(f"❌ Cannot save - no email available in drivers")
-            return jsonify({
-                'success': False,
-                'error': 'Cannot save without email'
-            }), 400
+        logger.debug("💾 UPSERT STEP - lead_id: %s, email: %s, phone: %s", lead_id, email, phone)
+        logger.debug("📦 Drivers count: %s", len(save_data.get('drivers', [])))
         
-        print(f"✅ Client data save operation completed")
+        # One row per normalized email (unique constraint from add_clients_data_unique_email.sql)
+        supabase.table('clients_data').upsert(save_data, on_conflict='email').execute()
+        lead_data_cache.invalidate('client', f"email:{save_data['email']}", lead_id and f'lead:{lead_id}')
         
-        # Verify data was actually saved
-        try:
-            verify_result = supabase.table('clients_data').select('count', count='exact').execute()
-            print(f"📊 Total clients_data rows in DB: {verify_result.count}")
-        except Exception as e:
-            print(f"⚠️ Could not verify save: {str(e)}")
+        logger.info("✅ Client data save operation completed")
         
         return jsonify({
             'success': True,
@@ -855,9 +1787,7 @@ def save_client():
         }), 200
         
     except Exception as e:
-        print(f"❌ Error saving client: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Error saving client: %s", e)
         return jsonify({
             'success': False,
             'error': f'Failed to save client: {str(e)}'
@@ -868,34 +1798,36 @@ def save_client():
 def get_client_data(query):
     """Retrieve saved client data by email or lead ID"""
     try:
-        print(f"📂 Retrieving client data for: {query}")
+        logger.debug("📂 Retrieving client data for: %s", query)
+        
+        is_lead_id = len(query) == 36 and query.count('-') == 4  # UUID format check
+        cache_key = f'lead:{query.lower()}' if is_lead_id else f'email:{normalize_email(query)}'
+        cached = lead_data_cache.get('client', cache_key)
+        if cached is not None:
+            return lead_data_response(cached, 'HIT')
         
         # Try to find by lead_id first (if valid UUID format)
         try:
-            if len(query) == 36 and query.count('-') == 4:  # UUID format check
-                result = supabase.table('clients_data').select('*').eq('lead_id', query).limit(1).execute()
+            if is_lead_id:
+                result = supabase.table('clients_data').select('*').eq('lead_id', query).order('updated_at', desc=True).limit(1).execute()
                 if result.data and len(result.data) > 0:
-                    print(f"✅ Found client data by lead_id: {query}")
-                    return jsonify({
-                        'success': True,
-                        'data': result.data[0]
-                    }), 200
+                    logger.debug("✅ Found client data by lead_id: %s", query)
+                    lead_data_cache.set('client', result.data[0])
+                    return lead_data_response(result.data[0], 'MISS')
         except Exception as e:
-            print(f"⚠️ Error searching by lead_id: {str(e)}")
+            logger.warning("⚠️ Error searching by lead_id: %s", e)
         
         # Try to find by email (primary search)
         try:
-            result = supabase.table('clients_data').select('*').eq('email', query).limit(1).execute()
+            result = supabase.table('clients_data').select('*').eq('email', normalize_email(query)).limit(1).execute()
             if result.data and len(result.data) > 0:
-                print(f"✅ Found client data by email: {query}")
-                return jsonify({
-                    'success': True,
-                    'data': result.data[0]
-                }), 200
+                logger.debug("✅ Found client data by email: %s", query)
+                lead_data_cache.set('client', result.data[0])
+                return lead_data_response(result.data[0], 'MISS')
         except Exception as e:
-            print(f"⚠️ Error searching by email: {str(e)}")
+            logger.warning("⚠️ Error searching by email: %s", e)
         
-        print(f"⚠️ No client data found for: {query}")
+        logger.debug("⚠️ No client data found for: %s", query)
         return jsonify({
             'success': False,
             'error': 'No data found',
@@ -903,35 +1835,129 @@ def get_client_data(query):
         }), 404
         
     except Exception as e:
-        print(f"❌ Error retrieving client data: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Error retrieving client data: %s", e)
         return jsonify({
             'success': False,
             'error': f'Failed to retrieve client data: {str(e)}'
         }), 500
 
 
+def lead_data_response(row, cache_status):
+    response = jsonify({
+        'success': True,
+        'data': row
+    })
+    response.headers['X-Cache'] = cache_status
+    return response, 200
+
+
+@app.route('/api/client-data/<lead_id>', methods=['PATCH'])
+def patch_client_data(lead_id):
+    """
+    Apply a JSON Patch (application/json-patch+json) or merge patch (application/merge-patch+json)
+    to a lead's saved client data, e.g. [{"op": "replace", "path": "/drivers/0/licNumber", "value": "..."}]
+
+    If-Match: "<version>" makes the patch conditional; any version mismatch answers 409.
+    """
+    try:
+        try:
+            uuid.UUID(lead_id)
+        except ValueError:
+            return jsonify({'success': False, 'error': 'lead_id must be a UUID'}), 400
+        content_type = request.mimetype
+        if content_type not in CLIENT_PATCH_TYPES:
+            return jsonify({
+                'success': False,
+                'error': f"Content-Type must be one of: {', '.join(CLIENT_PATCH_TYPES)}"
+            }), 415
+        patch = request.get_json(force=True, silent=True)
+        if patch is None:
+            return jsonify({'success': False, 'error': 'Invalid JSON body'}), 400
+        
+        expected_version = None
+        if_match = request.headers.get('If-Match')
+        if if_match:
+            try:
+                expected_version = int(if_match.strip().removeprefix('W/').strip('"'))
+            except ValueError:
+                return jsonify({'success': False, 'error': 'If-Match must be a client data version'}), 400
+        
+        result = supabase.table('clients_data').select('id,drivers,version').eq('lead_id', lead_id).order('updated_at', desc=True).limit(1).execute()
+        if not result.data:
+            return jsonify({'success': False, 'error': 'No client data for this lead'}), 404
+        row = result.data[0]
+        version = row.get('version')
+        if expected_version is not None and expected_version != version:
+            return client_data_conflict(version)
+        
+        # The patch target is the saved document; only its drivers are patchable
+        document = {'drivers': row.get('drivers') or []}
+        try:
+            if content_type == 'application/json-patch+json':
+                patched = apply_json_patch(document, patch)
+            else:
+                patched = apply_merge_patch(document, patch)
+        except JsonPatchTestFailed as e:
+            return jsonify({'success': False, 'error': str(e), 'version': version}), 409
+        except JsonPatchError as e:
+            return jsonify({'success': False, 'error': str(e)}), 422
+        if not isinstance(patched, dict) or set(patched) != {'drivers'} or not isinstance(patched['drivers'], list):
+            return jsonify({'success': False, 'error': 'The patched document must be {"drivers": [...]}'}), 422
+        
+        # Only writes if nobody saved in between; the version trigger bumps the version
+        update = supabase.table('clients_data').update({
+            'drivers': patched['drivers'],
+            'updated_at': datetime.utcnow().isoformat()
+        }).eq('id', row['id']).eq('version', version).execute()
+        if not update.data:
+            return client_data_conflict(None)
+        lead_data_cache.invalidate('client', f'lead:{lead_id}')
+        new_version = update.data[0].get('version')
+        
+        logger.debug("🩹 Patched client data for lead %s: version %s -> %s", lead_id, version, new_version)
+        response = jsonify({'success': True, 'lead_id': lead_id, 'version': new_version})
+        response.headers['ETag'] = f'"{new_version}"'
+        return response, 200
+        
+    except Exception as e:
+        logger.exception("❌ Error patching client data: %s", e)
+        return jsonify({
+            'success': False,
+            'error': f'Failed to patch client data: {str(e)}'
+        }), 500
+
+
+def client_data_conflict(version):
+    """409 telling the client to re-read the data (and the version it should patch against, if known)"""
+    return jsonify({
+        'success': False,
+        'error': 'Client data was changed by another save - reload and retry',
+        'version': version
+    }), 409
+
 
 @app.route('/api/get-property-data/<query>', methods=['GET'])
 def get_property_data(query):
     """Retrieve saved property data by email or lead ID"""
     try:
-        print(f"📂 Retrieving property data for: {query}")
+        logger.debug("📂 Retrieving property data for: %s", query)
+        
+        email = normalize_email(query)
+        cached = lead_data_cache.get('property', f'email:{email}')
+        if cached is not None:
+            return lead_data_response(cached, 'HIT')
         
         # Try to find by email (primary search)
         try:
-            result = supabase.table('properties_data').select('*').eq('email', query).limit(1).execute()
+            result = supabase.table('properties_data').select('*').eq('email', email).limit(1).execute()
             if result.data and len(result.data) > 0:
-                print(f"✅ Found property data by email: {query}")
-                return jsonify({
-                    'success': True,
-                    'data': result.data[0]
-                }), 200
+                logger.debug("✅ Found property data by email: %s", query)
+                lead_data_cache.set('property', result.data[0])
+                return lead_data_response(result.data[0], 'MISS')
         except Exception as e:
-            print(f"⚠️ Error searching by email: {str(e)}")
+            logger.warning("⚠️ Error searching by email: %s", e)
         
-        print(f"⚠️ No property data found for: {query}")
+        logger.debug("⚠️ No property data found for: %s", query)
         return jsonify({
             'success': False,
             'error': 'No data found',
@@ -939,9 +1965,7 @@ def get_property_data(query):
         }), 404
         
     except Exception as e:
-        print(f"❌ Error retrieving property data: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Error retrieving property data: %s", e)
         return jsonify({
             'success': False,
             'error': f'Failed to retrieve property data: {str(e)}'
@@ -957,30 +1981,26 @@ def save_property():
         if not data:
             return jsonify({'success': False, 'error': 'No data provided'}), 400
         
-        print(f"🏠 Saving property data to Supabase...")
-        print(f"📊 Data received keys: {list(data.keys())}")
+        logger.debug("🏠 Saving property data to Supabase...")
+        logger.debug("📊 Data received keys: %s", list(data.keys()))
         
         # Get email to identify the lead
         email = None
         lead_id = None
         
         if data.get('customer') and isinstance(data['customer'], dict):
-            email = data['customer'].get('email', '').strip().lower() if data['customer'].get('email') else None
-            print(f"✓ Extracted email: {email}")
+            email = normalize_email(data['customer'].get('email'))
+            logger.debug("✓ Extracted email: %s", email)
         
         if not email:
-            print(f"⚠️ No email provided in customer data")
+            logger.debug("⚠️ No email provided in customer data")
             return jsonify({'success': False, 'error': 'Email is required'}), 400
         
         # Find lead by email
-        if email:
-            try:
-                result = supabase.table('leads').select('id').eq('email', email).limit(1).execute()
-                if result.data and len(result.data) > 0:
-                    lead_id = result.data[0]['id']
-                    print(f"✅ Found lead by email {email}: {lead_id}")
-            except Exception as e:
-                print(f"⚠️ Error finding lead by email: {str(e)}")
+        try:
+            lead_id = find_lead_id(email=email)
+        except Exception as e:
+            logger.warning("⚠️ Error finding lead by email: %s", e)
         
         # Prepare data for storage
         save_data = {
@@ -990,42 +2010,23 @@ def save_property():
             'updated_at': datetime.utcnow().isoformat()
         }
         
-        # Add lead_id if found
+        # Add lead_id if found (an existing link is kept otherwise - upsert only sets these columns)
         if lead_id:
             save_data['lead_id'] = lead_id
         
-        print(f"💾 INSERT/UPDATE STEP - lead_id: {lead_id}, email: {email}")
-        print(f"📦 Data to save keys: {list(save_data.keys())}")
+        logger.debug("💾 UPSERT STEP - lead_id: %s, email: %s", lead_id, email)
+        logger.debug("📦 Data to save keys: %s", list(save_data.keys()))
         
-        # Insert or update in properties_data table
-        if email:
-            print(f"💡 Saving property data by email: {email}")
-            try:
-                # Check if record exists
-                result = supabase.table('properties_data').select('id').eq('email', email).limit(1).execute()
-                if result.data and len(result.data) > 0:
-                    print(f"🔄 Existing record found for email {email}, updating...")
-                    save_result = supabase.table('properties_data').update(save_data).eq('email', email).execute()
-                    print(f"✅ Updated existing property data for email {email}")
-                else:
-                    print(f"📝 No existing record for email {email}, inserting new...")
-                    save_result = supabase.table('properties_data').insert(save_data).execute()
-                    print(f"✅ Inserted new property data for email {email}")
-                    if save_result.data:
-                        print(f"   Inserted ID: {save_result.data[0].get('id')}")
-            except Exception as e:
-                print(f"❌ Error saving property data: {str(e)}")
-                import traceback
-                traceback.print_exc()
-                return jsonify({'success': False, 'error': f'Failed to save: {str(e)}'}), 500
-        else:
-            print(f"❌ Cannot save - no email available")
-            return jsonify({
-                'success': False,
-                'error': 'Cannot save without email'
-            }), 400
+        # One row per email (unique constraint from add_properties_data_unique_email.sql) - a single
+        # statement, so concurrent saves can no longer both insert
+        try:
+            supabase.table('properties_data').upsert(save_data, on_conflict='email').execute()
+            lead_data_cache.invalidate('property', f'email:{email}', lead_id and f'lead:{lead_id}')
+        except Exception as e:
+            logger.exception("❌ Error saving property data: %s", e)
+            return jsonify({'success': False, 'error': f'Failed to save: {str(e)}'}), 500
         
-        print(f"✅ Property data save operation completed")
+        logger.info("✅ Property data save operation completed")
         
         return jsonify({
             'success': True,
@@ -1035,9 +2036,7 @@ def save_property():
         }), 200
         
     except Exception as e:
-        print(f"❌ Error saving property: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Error saving property: %s", e)
         return jsonify({
             'success': False,
             'error': f'Failed to save property: {str(e)}'
@@ -1046,13 +2045,18 @@ def save_property():
 
 # ========== INITIALIZATION ==========
 
+# Periodic Meta sync - every worker starts the loop, only the lock holder syncs.
+# PDF parser processes are spawned and may re-import this module; they must not sync.
+if multiprocessing.parent_process() is None:
+    sync_scheduler.start()
+
 if __name__ == '__main__':
     # Create tables if they don't exist
     try:
         # Check if leads table exists, if not this will fail gracefully
         supabase.table('leads').select('*').limit(1).execute()
     except:
-        print("Note: Ensure 'leads' table exists in Supabase")
+        logger.warning("Note: Ensure 'leads' table exists in Supabase")
     
     port = int(os.getenv('FLASK_PORT', 5000))
     # Disable use_reloader to avoid issues on Windows
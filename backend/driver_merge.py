@@ -0,0 +1,59 @@
+"""
+Driver Report Merge
+Combines one driver's parsed MVR and DASH data the way the Auto dashboard fills its form
+"""
+import re
+
+# The MVR is the authority on who the driver is - these overwrite whatever the DASH had
+MVR_IDENTITY_FIELDS = ('name', 'dob', 'license_number')
+# MVR licence record fields that share a name with a DASH field get an mvr_ prefix
+MVR_RECORD_FIELDS = {
+    'expiry_date': 'mvr_expiry_date',
+    'issue_date': 'mvr_issue_date',
+    'license_status': 'mvr_license_status',
+    'license_class': 'mvr_license_class',
+    'demerit_points': 'demerit_points',
+    'conditions': 'conditions',
+    'convictions_count': 'convictions_count',
+    'convictions': 'convictions'
+}
+VEHICLE_FIELDS = ('policy1_vehicles', 'vin', 'vehicle_year_make_model')
+
+
+def licence_key(license_number):
+    """Licence number reduced to letters and digits, for matching an MVR to its DASH"""
+    if not license_number:
+        return None
+    return re.sub(r'[^A-Z0-9]', '', str(license_number).upper()) or None
+
+
+def merge_driver_reports(mvr=None, dash=None):
+    """
+    Merge parsed MVR and DASH data for one driver
+
+    Args:
+        mvr: data dict from parse_mvr_pdf (or None)
+        dash: data dict from parse_dash_pdf (or None)
+
+    Returns:
+        dict: DASH fields (address, phone, email, policies, claims, vehicles), with name/DOB/licence
+        taken from the MVR and the MVR licence record alongside
+    """
+    mvr = mvr or {}
+    dash = dash or {}
+    merged = {key: value for key, value in dash.items() if key not in MVR_IDENTITY_FIELDS}
+
+    for field in MVR_IDENTITY_FIELDS:
+        value = mvr.get(field) or dash.get(field)
+        if value:
+            merged[field] = value
+    for field, merged_field in MVR_RECORD_FIELDS.items():
+        if field in mvr:
+            merged[merged_field] = mvr[field]
+
+    # Vehicles come from DASH Policy #1; the MVR's own list only fills in when there is no DASH
+    if not dash.get('policy1_vehicles'):
+        for field in VEHICLE_FIELDS:
+            if mvr.get(field):
+                merged[field] = mvr[field]
+    return merged
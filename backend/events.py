@@ -0,0 +1,76 @@
+"""
+Lead Event Broker
+In-process pub/sub that fans lead inserts/updates out to Server-Sent Events clients
+"""
+import json
+import queue
+import threading
+
+
+class Subscription:
+    """One connected client: a bounded queue plus an overflow flag"""
+
+    def __init__(self, max_queue):
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.overflowed = False
+
+    def get(self, timeout):
+        """Next event, or None when nothing arrived within `timeout` seconds"""
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class EventBroker:
+    """Fan-out to every subscriber of this process; slow clients are cut off, not buffered"""
+
+    def __init__(self, max_queue=100, max_clients=50):
+        self.max_queue = max_queue
+        self.max_clients = max_clients
+        self.published = 0
+        self.dropped_clients = 0
+        self._subscribers = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self):
+        """Register a client, or return None when the process is at max_clients"""
+        with self._lock:
+            if len(self._subscribers) >= self.max_clients:
+                return None
+            subscription = Subscription(self.max_queue)
+            self._subscribers.add(subscription)
+            return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def publish(self, event, data):
+        """Queue an event for every client without ever blocking the publisher"""
+        message = {'event': event, 'data': data}
+        with self._lock:
+            subscribers = list(self._subscribers)
+            self.published += 1
+        for subscription in subscribers:
+            try:
+                subscription.queue.put_nowait(message)
+            except queue.Full:
+                # The client fell behind - drop it and let it resync from /api/leads/changes
+                subscription.overflowed = True
+                self.unsubscribe(subscription)
+                self.dropped_clients += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                'clients': len(self._subscribers),
+                'published': self.published,
+                'dropped_clients': self.dropped_clients
+            }
+
+
+def format_sse(data, event=None):
+    """Encode one Server-Sent Events frame"""
+    frame = f'event: {event}\n' if event else ''
+    return frame + f'data: {json.dumps(data, default=str)}\n\n'
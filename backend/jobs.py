@@ -0,0 +1,163 @@
+"""
+Background Job Runner
+Runs long tasks (Meta lead sync) off the request thread, plus a periodic scheduler
+"""
+import logging
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+try:
+    import fcntl
+except ImportError:  # Windows dev machines run a single process, no lock needed
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class ProcessLock:
+    """Non-blocking inter-process lock backed by flock() on a lock file"""
+
+    def __init__(self, path):
+        self.path = path
+        self._fd = None
+
+    @property
+    def held(self):
+        return self._fd is not None
+
+    def acquire(self):
+        if self._fd is not None:
+            return True
+        if fcntl is None:
+            self._fd = -1
+            return True
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+
+    def release(self):
+        if self._fd is None:
+            return
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+        self._fd = None
+
+
+class JobRunner:
+    """Runs jobs on a small thread pool and keeps their status for polling"""
+
+    def __init__(self, max_workers=1, history=100, persist=None):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='job')
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._history = history
+        # Optional hook so other gunicorn workers can see the job (e.g. a Supabase table)
+        self._persist = persist
+
+    @staticmethod
+    def _copy(job):
+        """Copy of a job, progress included, for serializing (call with self._lock held)"""
+        return dict(job, progress=dict(job['progress']))
+
+    def _save(self, job):
+        if self._persist:
+            with self._lock:
+                snapshot = self._copy(job)
+            try:
+                self._persist(snapshot)
+            except Exception as e:
+                logger.warning("⚠️ Could not persist job %s: %s", job['id'], e)
+
+    def submit(self, kind, fn, trigger='api'):
+        """Queue fn(progress) as a job; reuse the active job of the same kind if there is one"""
+        with self._lock:
+            for job in self._jobs.values():
+                if job['kind'] == kind and job['status'] in ('queued', 'running'):
+                    return self._copy(job)
+
+            job = {
+                'id': str(uuid.uuid4()),
+                'kind': kind,
+                'trigger': trigger,
+                'status': 'queued',
+                'progress': {},
+                'result': None,
+                'error': None,
+                'created_at': datetime.utcnow().isoformat(),
+                'started_at': None,
+                'finished_at': None
+            }
+            self._jobs[job['id']] = job
+            while len(self._jobs) > self._history:
+                self._jobs.popitem(last=False)
+            snapshot = self._copy(job)
+
+        self._save(job)
+        self._pool.submit(self._run, job, fn)
+        return snapshot
+
+    def _run(self, job, fn):
+        def progress(**fields):
+            # Under the lock: get() may be copying this dict for a status request right now
+            with self._lock:
+                job['progress'].update(fields)
+            self._save(job)
+
+        job['status'] = 'running'
+        job['started_at'] = datetime.utcnow().isoformat()
+        self._save(job)
+        try:
+            job['result'] = fn(progress)
+            job['status'] = 'succeeded'
+        except Exception as e:
+            logger.error("❌ Job %s %s failed: %s", job['kind'], job['id'], e)
+            job['error'] = str(e)
+            job['status'] = 'failed'
+        job['finished_at'] = datetime.utcnow().isoformat()
+        self._save(job)
+
+    def get(self, job_id):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return self._copy(job) if job else None
+
+
+class PeriodicScheduler:
+    """Submits a job every `interval` seconds from whichever worker holds the leader lock"""
+
+    def __init__(self, runner, kind, fn, interval, lock_path):
+        self.runner = runner
+        self.kind = kind
+        self.fn = fn
+        self.interval = interval
+        self.leader_lock = ProcessLock(lock_path)
+        self._thread = None
+        self._stop = threading.Event()
+
+    def start(self):
+        if self._thread is not None or self.interval <= 0:
+            return
+        self._thread = threading.Thread(target=self._loop, name=f'{self.kind}-scheduler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self.leader_lock.release()
+
+    def _loop(self):
+        # Every worker keeps trying, so a new leader takes over if the old one dies
+        while not self._stop.is_set():
+            if self.leader_lock.acquire():
+                logger.info("⏰ Scheduled %s", self.kind)
+                self.runner.submit(self.kind, self.fn, trigger='scheduler')
+            self._stop.wait(self.interval)
@@ -0,0 +1,145 @@
+"""
+JSON Patch
+RFC 6902 JSON Patch and RFC 7396 JSON Merge Patch, applied to a copy of the document
+"""
+import copy
+
+
+class JsonPatchError(ValueError):
+    """The patch is malformed or does not fit the document (answer 422)"""
+
+
+class JsonPatchTestFailed(JsonPatchError):
+    """A "test" operation did not match - the document changed under the client (answer 409)"""
+
+
+def _parse_pointer(pointer):
+    """JSON Pointer (RFC 6901) -> list of reference tokens"""
+    if not isinstance(pointer, str) or (pointer and not pointer.startswith('/')):
+        raise JsonPatchError(f'Invalid JSON pointer: {pointer!r}')
+    if pointer == '':
+        return []
+    return [token.replace('~1', '/').replace('~0', '~') for token in pointer[1:].split('/')]
+
+
+def _array_index(array, token, allow_end=False):
+    if allow_end and token == '-':
+        return len(array)
+    if not token.isdigit() or (token != '0' and token.startswith('0')):
+        raise JsonPatchError(f'Invalid array index: {token!r}')
+    index = int(token)
+    if index > len(array) or (index == len(array) and not allow_end):
+        raise JsonPatchError(f'Array index out of range: {index}')
+    return index
+
+
+def _resolve(doc, tokens):
+    """The value at tokens"""
+    for token in tokens:
+        if isinstance(doc, list):
+            doc = doc[_array_index(doc, token)]
+        elif isinstance(doc, dict):
+            if token not in doc:
+                raise JsonPatchError(f'Path not found: /{"/".join(tokens)}')
+            doc = doc[token]
+        else:
+            raise JsonPatchError(f'Path not found: /{"/".join(tokens)}')
+    return doc
+
+
+def _json_equal(a, b):
+    """RFC 6902 "test" equality: same JSON type and value (true is not 1, 1.0 is not 1), recursively"""
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(_json_equal(a[key], b[key]) for key in a)
+    if isinstance(a, list):
+        return len(a) == len(b) and all(_json_equal(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def _add(doc, tokens, value):
+    if not tokens:
+        return value
+    parent = _resolve(doc, tokens[:-1])
+    if isinstance(parent, list):
+        parent.insert(_array_index(parent, tokens[-1], allow_end=True), value)
+    elif isinstance(parent, dict):
+        parent[tokens[-1]] = value
+    else:
+        raise JsonPatchError(f'Cannot add to a scalar at /{"/".join(tokens[:-1])}')
+    return doc
+
+
+def _remove(doc, tokens):
+    if not tokens:
+        raise JsonPatchError('Cannot remove the whole document')
+    parent = _resolve(doc, tokens[:-1])
+    if isinstance(parent, list):
+        return parent.pop(_array_index(parent, tokens[-1]))
+    if isinstance(parent, dict) and tokens[-1] in parent:
+        return parent.pop(tokens[-1])
+    raise JsonPatchError(f'Path not found: /{"/".join(tokens)}')
+
+
+def apply_json_patch(doc, operations):
+    """
+    Apply RFC 6902 operations (add, remove, replace, move, copy, test)
+
+    Args:
+        doc: JSON document (left untouched)
+        operations: list of {"op": ..., "path": ..., ...}
+
+    Returns:
+        The patched copy
+    """
+    if not isinstance(operations, list):
+        raise JsonPatchError('A JSON Patch must be an array of operations')
+    doc = copy.deepcopy(doc)
+    for operation in operations:
+        if not isinstance(operation, dict) or 'op' not in operation or 'path' not in operation:
+            raise JsonPatchError(f'Invalid operation: {operation!r}')
+        op = operation['op']
+        tokens = _parse_pointer(operation['path'])
+
+        if op in ('add', 'replace', 'test') and 'value' not in operation:
+            raise JsonPatchError(f'"{op}" needs a value')
+        if op in ('move', 'copy') and 'from' not in operation:
+            raise JsonPatchError(f'"{op}" needs a from pointer')
+
+        if op == 'add':
+            doc = _add(doc, tokens, copy.deepcopy(operation['value']))
+        elif op == 'remove':
+            _remove(doc, tokens)
+        elif op == 'replace':
+            if not tokens:
+                doc = copy.deepcopy(operation['value'])
+                continue
+            _remove(doc, tokens)
+            doc = _add(doc, tokens, copy.deepcopy(operation['value']))
+        elif op == 'move':
+            source = _parse_pointer(operation['from'])
+            if tokens[:len(source)] == source and tokens != source:
+                raise JsonPatchError('Cannot move a value into itself')
+            doc = _add(doc, tokens, _remove(doc, source))
+        elif op == 'copy':
+            doc = _add(doc, tokens, copy.deepcopy(_resolve(doc, _parse_pointer(operation['from']))))
+        elif op == 'test':
+            if not _json_equal(_resolve(doc, tokens), operation['value']):
+                raise JsonPatchTestFailed(f'Test failed at {operation["path"]}')
+        else:
+            raise JsonPatchError(f'Unknown operation: {op!r}')
+    return doc
+
+
+def apply_merge_patch(doc, patch):
+    """RFC 7396: objects merge recursively, null deletes a member, anything else replaces"""
+    if not isinstance(patch, dict):
+        return copy.deepcopy(patch)
+    result = copy.deepcopy(doc) if isinstance(doc, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = apply_merge_patch(result.get(key), value)
+    return result
@@ -0,0 +1,188 @@
+"""
+Lead Data Cache
+Read-through cache of clients_data / properties_data rows, per worker or shared through Redis, and
+the write generation that keys the lead page cache
+"""
+import json
+import logging
+import threading
+
+from .cache import TTLCache
+
+try:
+    import redis
+except ImportError:  # optional - only needed for a cache shared by all gunicorn workers
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+
+def redis_client(redis_url):
+    """Redis connection for redis_url, or None when unset or the package is missing"""
+    if not redis_url:
+        return None
+    if redis is None:
+        logger.warning("⚠️ REDIS_URL is set but the redis package is not installed - caching per worker")
+        return None
+    return redis.Redis.from_url(redis_url, socket_timeout=0.5, socket_connect_timeout=0.5)
+
+
+def row_keys(row):
+    """Every key a saved row can be looked up by: its email and its lead"""
+    keys = []
+    if row.get('email'):
+        keys.append(f"email:{row['email']}")
+    if row.get('lead_id'):
+        keys.append(f"lead:{row['lead_id']}")
+    return keys
+
+
+class LeadDataCache:
+    """
+    Rows are stored under all of their keys, so dropping one key (a save by email, a lead delete)
+    also drops the others. With redis_url every worker shares one copy and sees every invalidation;
+    otherwise each worker keeps its own LRU and other workers catch up within ttl seconds.
+    """
+
+    def __init__(self, maxsize=256, ttl=30, redis_url=None, prefix='lead-data'):
+        self.ttl = ttl
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+        self._memory = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._redis = redis_client(redis_url)
+
+    @property
+    def backend(self):
+        return 'redis' if self._redis is not None else 'memory'
+
+    def _count(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _redis_key(self, kind, key):
+        return f'{self.prefix}:{kind}:{key}'
+
+    def get(self, kind, key):
+        """Cached row for e.g. ('client', 'email:a@b.com'), or None"""
+        if self._redis is None:
+            row = self._memory.get((kind, key))
+        else:
+            try:
+                raw = self._redis.get(self._redis_key(kind, key))
+                row = json.loads(raw) if raw else None
+            except Exception as e:
+                # A cache outage must never fail the read - fall through to Supabase
+                self._count('errors')
+                logger.warning("⚠️ Lead data cache read failed: %s", e)
+                row = None
+        self._count('hits' if row is not None else 'misses')
+        return row
+
+    def set(self, kind, row):
+        keys = row_keys(row)
+        if self._redis is None:
+            for key in keys:
+                self._memory.set((kind, key), row)
+            return
+        try:
+            payload = json.dumps(row, default=str)
+            pipe = self._redis.pipeline()
+            for key in keys:
+                pipe.set(self._redis_key(kind, key), payload, ex=max(1, int(self.ttl)))
+            pipe.execute()
+        except Exception as e:
+            self._count('errors')
+            logger.warning("⚠️ Lead data cache write failed: %s", e)
+
+    def invalidate(self, kind, *keys):
+        """Drop the rows cached under these keys, under every one of their keys"""
+        keys = [key for key in keys if key]
+        if self._redis is None:
+            for key in keys:
+                row = self._memory.pop((kind, key))
+                for other in row_keys(row or {}):
+                    self._memory.pop((kind, other))
+            return
+        try:
+            doomed = set(keys)
+            for raw in self._redis.mget([self._redis_key(kind, key) for key in keys]) if keys else []:
+                if raw:
+                    doomed.update(row_keys(json.loads(raw)))
+            if doomed:
+                self._redis.delete(*(self._redis_key(kind, key) for key in doomed))
+        except Exception as e:
+            # Entries expire after ttl anyway; log so a stale read can be explained
+            self._count('errors')
+            logger.warning("⚠️ Lead data cache invalidation failed: %s", e)
+
+    def clear(self):
+        self._memory.clear()
+        if self._redis is None:
+            return
+        try:
+            keys = list(self._redis.scan_iter(match=f'{self.prefix}:*', count=500))
+            if keys:
+                self._redis.delete(*keys)
+        except Exception as e:
+            self._count('errors')
+            logger.warning("⚠️ Lead data cache clear failed: %s", e)
+
+    def stats(self):
+        memory = self._memory.stats()
+        with self._lock:
+            return {
+                'backend': self.backend,
+                'size': memory['size'] if self._redis is None else None,
+                'maxsize': memory['maxsize'],
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'errors': self.errors
+            }
+
+
+class WriteGeneration:
+    """
+    Counter bumped on every write, for keying caches and ETags. With redis_url all workers share it,
+    so a write on one worker retires the pages every other worker cached; otherwise it only counts
+    this worker's writes.
+    """
+
+    def __init__(self, name, redis_url=None):
+        self.key = f'generation:{name}'
+        self.errors = 0
+        self._local = 0
+        self._lock = threading.Lock()
+        self._redis = redis_client(redis_url)
+
+    @property
+    def shared(self):
+        return self._redis is not None
+
+    def current(self):
+        """The generation, or None when the shared counter cannot be read (do not cache then)"""
+        if self._redis is None:
+            with self._lock:
+                return self._local
+        try:
+            return int(self._redis.get(self.key) or 0)
+        except Exception as e:
+            with self._lock:
+                self.errors += 1
+            logger.warning("⚠️ Reading %s failed: %s", self.key, e)
+            return None
+
+    def bump(self):
+        with self._lock:
+            self._local += 1
+        if self._redis is None:
+            return
+        try:
+            self._redis.incr(self.key)
+        except Exception as e:
+            with self._lock:
+                self.errors += 1
+            logger.warning("⚠️ Bumping %s failed: %s", self.key, e)
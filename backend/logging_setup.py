@@ -0,0 +1,70 @@
+"""
+Logging Setup
+Leveled logging that never blocks a request: records are queued and written by a listener thread
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+
+TEXT_FORMAT = '%(asctime)s %(levelname)s [%(process)d] %(name)s: %(message)s'
+
+_listener = None
+# Document text/section dumps carry PII - only logged at DEBUG with LOG_DEBUG_DUMPS on,
+# and then only for a LOG_DUMP_SAMPLE_RATE fraction of documents
+_dumps = {'enabled': False, 'sample_rate': 1.0}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line for the log pipeline"""
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'pid': record.process,
+            'message': record.getMessage()
+        }
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+def configure_logging():
+    """Send every record through a queue to a stdout writer thread (once per process)
+
+    Reads LOG_LEVEL (default INFO), LOG_FORMAT (text | json), LOG_DEBUG_DUMPS and LOG_DUMP_SAMPLE_RATE
+    when called, so the PDF parser processes pick up the same settings as the app.
+    """
+    global _listener
+    if _listener is not None:
+        return
+    _dumps['enabled'] = os.getenv('LOG_DEBUG_DUMPS', '').lower() in ('1', 'true', 'yes')
+    _dumps['sample_rate'] = float(os.getenv('LOG_DUMP_SAMPLE_RATE', 1.0))
+
+    handler = logging.StreamHandler(sys.stdout)
+    json_output = os.getenv('LOG_FORMAT', 'text').lower() == 'json'
+    handler.setFormatter(JsonFormatter() if json_output else logging.Formatter(TEXT_FORMAT))
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(os.getenv('LOG_LEVEL', 'INFO').upper())
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    _listener = logging.handlers.QueueListener(log_queue, handler)
+    _listener.start()
+    # Flush whatever is still queued on a clean exit
+    atexit.register(_listener.stop)
+
+
+def dumps_enabled(logger):
+    """Decide once per document whether its verbose text dumps are logged"""
+    if not _dumps['enabled'] or not logger.isEnabledFor(logging.DEBUG):
+        return False
+    return _dumps['sample_rate'] >= 1 or random.random() < _dumps['sample_rate']
@@ -0,0 +1,172 @@
+"""
+Meta Graph API Client
+Shared pooled HTTP session with timeouts, retry/backoff and page streaming
+"""
+import json
+import logging
+import random
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses worth retrying - throttling and transient server errors
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Graph error codes that mean "rate limited" even when returned with a 400/403
+THROTTLE_ERROR_CODES = {4, 17, 32, 613, 80000, 80001, 80002, 80003, 80004, 80005, 80006, 80008, 80009, 80014}
+
+# Methods that are safe to send twice; anything else is only retried when Meta cannot have acted on it
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'}
+
+
+class MetaAPIError(Exception):
+    """Raised when the Graph API keeps failing after all retries"""
+
+    def __init__(self, message, response=None):
+        super().__init__(message)
+        self.response = response
+
+
+class MetaClient:
+    """Thin Graph API client sharing one keep-alive session between calls"""
+
+    def __init__(self, base_url, access_token, timeout=30, connect_timeout=5,
+                 max_retries=3, backoff=1.0, max_backoff=60, pool_size=10):
+        self.base_url = base_url.rstrip('/')
+        self.access_token = access_token
+        self.timeout = (connect_timeout, timeout)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.last_usage = {}
+
+        # One pooled session per process: TLS connections are reused across calls
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({'Accept-Encoding': 'gzip, deflate'})
+
+    def _url(self, path):
+        """Accept either a Graph path ('/123/leads') or a full paging URL"""
+        if path.startswith('http://') or path.startswith('https://'):
+            return path
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def _record_usage(self, response):
+        """Remember the latest Graph usage headers for retry decisions and debugging"""
+        usage = {}
+        for header in ('x-business-use-case-usage', 'x-app-usage', 'x-ad-account-usage'):
+            value = response.headers.get(header)
+            if value:
+                try:
+                    usage[header] = json.loads(value)
+                except ValueError:
+                    usage[header] = value
+        if usage:
+            self.last_usage = usage
+        return usage
+
+    def _regain_access_seconds(self, usage):
+        """Seconds until Meta lifts the business use case throttle (0 if unknown)"""
+        buc_usage = usage.get('x-business-use-case-usage')
+        if not isinstance(buc_usage, dict):
+            return 0
+        minutes = 0
+        for entries in buc_usage.values():
+            for entry in entries if isinstance(entries, list) else []:
+                try:
+                    minutes = max(minutes, float(entry.get('estimated_time_to_regain_access', 0)))
+                except (TypeError, ValueError, AttributeError):
+                    continue
+        return minutes * 60
+
+    def _is_throttled(self, response, idempotent=True):
+        """
+        Whether to retry this failed response. A non-idempotent request is only retried when it was
+        rate limited (rejected before it ran) - after a 5xx or a transient error it may have been applied
+        """
+        if response.status_code == 429 or (idempotent and response.status_code in RETRY_STATUS_CODES):
+            return True
+        try:
+            error = response.json().get('error', {})
+        except ValueError:
+            return False
+        return error.get('code') in THROTTLE_ERROR_CODES or (idempotent and bool(error.get('is_transient')))
+
+    def _retry_delay(self, response, attempt):
+        """Backoff delay for the next attempt, honouring Meta's own hints first"""
+        if response is not None:
+            retry_after = response.headers.get('Retry-After')
+            if retry_after:
+                try:
+                    return float(retry_after)
+                except ValueError:
+                    pass
+            regain_seconds = self._regain_access_seconds(self._record_usage(response))
+            if regain_seconds:
+                return regain_seconds
+        delay = self.backoff * (2 ** attempt)
+        return min(delay + random.uniform(0, self.backoff), self.max_backoff)
+
+    def request(self, method, path, params=None, json_body=None, idempotent=None):
+        """
+        Send a Graph request, retrying throttled/5xx responses with backoff
+
+        POSTs are not idempotent unless the caller says so (e.g. a Conversions API event carrying an
+        event_id that Meta deduplicates on): they are only retried when throttled or when the
+        connection could not be opened, never after a 5xx or a read timeout.
+        """
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        url = self._url(path)
+        params = dict(params or {})
+        if self.access_token and 'access_token=' not in url:
+            params.setdefault('access_token', self.access_token)
+
+        for attempt in range(self.max_retries + 1):
+            response = None
+            try:
+                response = self.session.request(method, url, params=params, json=json_body,
+                                                timeout=self.timeout)
+                self._record_usage(response)
+                if response.ok:
+                    return response.json()
+                if not self._is_throttled(response, idempotent):
+                    response.raise_for_status()
+                    raise MetaAPIError(f"Meta API error {response.status_code}", response)
+                error = f"Meta API throttled/unavailable ({response.status_code})"
+            except (requests.ConnectionError, requests.Timeout) as e:
+                # The request never left if the connection could not be opened
+                if not idempotent and not isinstance(e, requests.ConnectTimeout):
+                    raise MetaAPIError(f"Meta API connection error (not retried): {str(e)}", response) from e
+                error = f"Meta API connection error: {str(e)}"
+
+            if attempt >= self.max_retries:
+                raise MetaAPIError(error, response)
+
+            delay = self._retry_delay(response, attempt)
+            if delay > self.max_backoff:
+                # Throttled for longer than we are willing to block - let the next sync retry
+                raise MetaAPIError(f"{error}; access regained in ~{int(delay)}s", response)
+            logger.warning("⏳ %s, retrying in %.1fs (attempt %s/%s)", error, delay, attempt + 1, self.max_retries)
+            time.sleep(delay)
+
+    def get(self, path, params=None):
+        return self.request('GET', path, params=params)
+
+    def post(self, path, json_body=None, params=None, idempotent=False):
+        return self.request('POST', path, params=params, json_body=json_body, idempotent=idempotent)
+
+    def iter_pages(self, path, params=None):
+        """Yield each page of a Graph collection, following paging.next"""
+        page = self.get(path, params=params)
+        while True:
+            yield page
+            next_url = page.get('paging', {}).get('next')
+            if not next_url:
+                return
+            page = self.get(next_url)
@@ -0,0 +1,159 @@
+"""
+Parsed PDF Cache
+Content-addressed cache of parse results: an in-process LRU in front of a JSON file per document
+"""
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from .cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# The disk tier is pruned at startup and then at most this often, on a write
+PRUNE_INTERVAL = 300
+CACHE_FILE_SUFFIXES = ('.json', '.tmp')
+
+
+class ParseResultCache:
+    """
+    Results keyed by (kind, parser version, content hash); a new parser version never sees old entries.
+    On disk, entries unused for max_age seconds go first, then the least recently used until the
+    version's directory fits in max_bytes; directories left by other parser versions are removed.
+    """
+
+    def __init__(self, version, maxsize=64, directory=None, max_bytes=None, max_age=None):
+        self.version = version
+        self.root = directory or None
+        self.directory = os.path.join(directory, version) if directory else None
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.disk_hits = 0
+        self.disk_evictions = 0
+        self._memory = TTLCache(maxsize=maxsize)
+        self._prune_lock = threading.Lock()
+        self._next_prune = 0
+        if self.directory:
+            self.prune()
+
+    def _path(self, kind, digest):
+        return os.path.join(self.directory, f'{kind}-{digest}.json')
+
+    def get(self, kind, digest):
+        """Cached payload for this document, or None"""
+        key = (kind, digest)
+        payload = self._memory.get(key)
+        if payload is not None or not self.directory:
+            return payload
+        try:
+            with open(self._path(kind, digest), 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("⚠️ Ignoring unreadable parse cache entry %s-%s: %s", kind, digest[:12], e)
+            return None
+        self.disk_hits += 1
+        try:
+            # The mtime doubles as last use, so eviction drops the least recently read entries
+            os.utime(self._path(kind, digest))
+        except OSError:
+            pass
+        self._memory.set(key, payload)
+        return payload
+
+    def set(self, kind, digest, payload):
+        self._memory.set((kind, digest), payload)
+        if not self.directory:
+            return
+        tmp_path = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write to a temp file and rename so other workers never read a half-written entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, default=str)
+            os.replace(tmp_path, self._path(kind, digest))
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("⚠️ Could not write parse cache entry %s-%s: %s", kind, digest[:12], e)
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        if time.monotonic() >= self._next_prune:
+            self.prune()
+
+    def _remove_stale_versions(self):
+        """Delete sibling directories written by other parser versions"""
+        try:
+            siblings = [entry for entry in os.scandir(self.root) if entry.is_dir() and entry.name != self.version]
+        except OSError:
+            return
+        for entry in siblings:
+            try:
+                # Only directories that hold nothing but cache files - PDF_CACHE_DIR may not be ours alone
+                if all(name.endswith(CACHE_FILE_SUFFIXES) for name in os.listdir(entry.path)):
+                    shutil.rmtree(entry.path)
+                    logger.info("🧹 Removed parse cache for parser version %s", entry.name)
+            except OSError as e:
+                logger.warning("⚠️ Could not remove old parse cache %s: %s", entry.path, e)
+
+    def prune(self):
+        """Remove other versions' entries, then expired and least recently used ones past max_bytes"""
+        if not self.directory or not self._prune_lock.acquire(blocking=False):
+            return
+        try:
+            self._next_prune = time.monotonic() + PRUNE_INTERVAL
+            self._remove_stale_versions()
+            # A recent .tmp file may be another worker's write in progress; older ones are leftovers
+            in_flight = time.time() - PRUNE_INTERVAL
+            try:
+                files = []
+                with os.scandir(self.directory) as entries:
+                    for entry in entries:
+                        if not entry.is_file() or not entry.name.endswith(CACHE_FILE_SUFFIXES):
+                            continue
+                        stat = entry.stat()
+                        if entry.name.endswith('.tmp') and stat.st_mtime > in_flight:
+                            continue
+                        files.append((stat.st_mtime, stat.st_size, entry.path))
+            except FileNotFoundError:
+                return
+            except OSError as e:
+                logger.warning("⚠️ Could not scan parse cache %s: %s", self.directory, e)
+                return
+
+            files.sort()
+            total = sum(size for _, size, _ in files)
+            oldest_kept = time.time() - self.max_age if self.max_age else None
+            for mtime, size, path in files:
+                expired = oldest_kept is not None and mtime < oldest_kept
+                if not expired and (not self.max_bytes or total <= self.max_bytes):
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass  # another worker pruned it first
+                except OSError as e:
+                    logger.warning("⚠️ Could not evict parse cache entry %s: %s", path, e)
+                    continue
+                total -= size
+                self.disk_evictions += 1
+        finally:
+            self._prune_lock.release()
+
+    def stats(self):
+        memory = self._memory.stats()
+        return {
+            'version': self.version,
+            'size': memory['size'],
+            'maxsize': memory['maxsize'],
+            'hits': memory['hits'],
+            'misses': memory['misses'],
+            'disk_hits': self.disk_hits,
+            'disk_evictions': self.disk_evictions,
+            'disk': bool(self.directory)
+        }
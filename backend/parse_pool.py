@@ -0,0 +1,158 @@
+"""
+PDF Parsing Pool
+Runs PDF parsing in worker processes so a heavy report never pins a gunicorn worker
+"""
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+
+logger = logging.getLogger(__name__)
+
+
+class ParsePoolError(Exception):
+    """Base error - carries how long the client should wait before retrying"""
+
+    def __init__(self, message, retry_after):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class ParsePoolBusy(ParsePoolError):
+    """Every worker is busy and the wait queue is full (answer 429)"""
+
+
+class ParsePoolUnavailable(ParsePoolError):
+    """The job timed out or a worker died; the pool was restarted (answer 503)"""
+
+
+def _init_worker(initializer):
+    """
+    First thing in every worker: lead a new process group, so _restart can kill whatever the worker
+    started (pdf_text's page-range extraction processes) along with it
+    """
+    if hasattr(os, 'setpgrp'):
+        os.setpgrp()
+    if initializer is not None:
+        initializer()
+
+
+def _kill_process_tree(process):
+    """Kill a worker and every process in its group; just the worker where groups don't exist"""
+    if hasattr(os, 'killpg'):
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+            return
+        except OSError:
+            pass  # the worker died or hasn't reached _init_worker yet, so it leads no group
+    try:
+        process.terminate()
+    except Exception:
+        pass
+
+
+class ParsePool:
+    """Bounded process pool: max_workers parsing at once, up to max_queue more waiting"""
+
+    def __init__(self, max_workers=2, max_queue=4, timeout=60, max_tasks_per_child=25, initializer=None):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.max_tasks_per_child = max_tasks_per_child
+        # Runs once in every new worker process (e.g. to set up logging)
+        self.initializer = initializer
+        self.completed = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.restarts = 0
+        # _slots bounds running + waiting requests; _workers makes sure the executor itself never
+        # queues, so the timeout measures parse time rather than time spent waiting
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._workers = threading.BoundedSemaphore(max_workers)
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def _get_executor(self):
+        # Created lazily so importing the app (or a worker that never parses) spawns nothing
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    # spawn: children don't inherit the Supabase client, scheduler threads or locks
+                    mp_context=multiprocessing.get_context('spawn'),
+                    # Recycle workers so pdfplumber's memory growth is handed back to the OS
+                    max_tasks_per_child=self.max_tasks_per_child,
+                    initializer=_init_worker,
+                    initargs=(self.initializer,)
+                )
+            return self._executor
+
+    def _restart(self, executor):
+        """Kill the workers of a stuck/broken pool; the next job starts a fresh one"""
+        with self._lock:
+            if self._executor is not executor:
+                return  # another thread already replaced it
+            self._executor = None
+            self.restarts += 1
+        # A running pdfplumber call cannot be cancelled, only its process (and its children) killed
+        for process in list((getattr(executor, '_processes', None) or {}).values()):
+            _kill_process_tree(process)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def run(self, fn, *args):
+        """Run fn(*args) in a worker process and return its result"""
+        if not self._slots.acquire(blocking=False):
+            self.rejected += 1
+            raise ParsePoolBusy('PDF parser is busy, try again shortly', retry_after=5)
+
+        # Waiting requests give up after one timeout's worth of queueing
+        if not self._workers.acquire(timeout=self.timeout):
+            self._slots.release()
+            self.rejected += 1
+            raise ParsePoolBusy('PDF parser is busy, try again shortly', retry_after=5)
+
+        with self._lock:
+            self._in_flight += 1
+        try:
+            executor = self._get_executor()
+            try:
+                future = executor.submit(fn, *args)
+            except (BrokenProcessPool, RuntimeError):
+                # Another request restarted the pool between the lookup and the submit
+                self._restart(executor)
+                executor = self._get_executor()
+                future = executor.submit(fn, *args)
+            try:
+                result = future.result(timeout=self.timeout)
+            except FutureTimeout:
+                self.timeouts += 1
+                logger.warning("⏱️ PDF parse exceeded %ss - restarting parser pool", self.timeout)
+                self._restart(executor)
+                raise ParsePoolUnavailable(f'PDF parsing timed out after {self.timeout}s', retry_after=10)
+            except BrokenProcessPool:
+                logger.error("❌ PDF parser worker died - restarting parser pool")
+                self._restart(executor)
+                raise ParsePoolUnavailable('PDF parser restarted, try again', retry_after=5)
+            self.completed += 1
+            return result
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+            self._workers.release()
+            self._slots.release()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'max_workers': self.max_workers,
+                'max_queue': self.max_queue,
+                'in_flight': self._in_flight,
+                'completed': self.completed,
+                'rejected': self.rejected,
+                'timeouts': self.timeouts,
+                'restarts': self.restarts
+            }
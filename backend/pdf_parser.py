@@ -4,9 +4,272 @@ Extracts relevant driver information from uploaded PDF files
 """
 import re
 import json
+import logging
+import bisect
 from datetime import datetime
-import PyPDF2
-from io import BytesIO
+try:
+    from .pdf_text import extract_text_tiered
+    from .logging_setup import dumps_enabled
+except ImportError:
+    # imported as a top-level module by the test scripts
+    from pdf_text import extract_text_tiered
+    from logging_setup import dumps_enabled
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever extraction output changes - cached parse results are keyed by it
+PARSER_VERSION = '2026.10.2'
+
+# Text every parser needs to find its sections; cheaper extractors are only trusted when they keep them
+DASH_ANCHORS = ('Policy #1', 'Claims')
+MVR_ANCHORS = ('Licence Number:', 'Birth Date:')
+
+# ========== DASH FIELD SPECS ==========
+# Precompiled once at import. Each label field is (output fields, label anchors, patterns, transform):
+# patterns are tried in priority order and the first one that matches anywhere wins, exactly like the
+# old chain of re.search calls. The anchors are the lowercase words a match can start with - only
+# those positions are tried, so a field resolves from the header without scanning the rest.
+
+def _strip(value):
+    return value.strip()
+
+
+def _date(value):
+    return normalize_date(value)
+
+
+def _compact_date(value):
+    # Report Date can come out of the PDF with a stray space inside it
+    return normalize_date(value.replace(' ', ''))
+
+
+def _raw(value):
+    return value
+
+
+def _spec(fields, anchors, patterns, transform):
+    return fields, anchors, [re.compile(pattern, re.IGNORECASE) for pattern in patterns], transform
+
+
+_DATE = r'(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})'
+_ISO_DATE = r'(\d{4}-\d{2}-\d{2})'
+_PHONE = r'(\+?[\d\-\(\)\s]+)'
+
+DASH_FIELD_SPECS = {
+    'header': [
+        _spec(('issue_date', 'report_date'), ('report',), [
+            r'Report\s*Date:\s*(\d{4}-\d{1,2}\s*\d{1,2}-\d{1,2})',
+        ], _compact_date),
+        _spec(('address',), ('address',), [
+            r'Address:\s*(.+?)\s+Number of',  # Get everything until "Number of"
+            r'Address:\s*([^\n]+)',
+        ], _strip),
+        _spec(('license_number',), ('dl', 'license'), [
+            r'DLN:\s*([A-Z0-9\-]+)',  # DLN: G6043-37788-80203
+            r'License\s*(?:Number|#|No\.?)?[:\s]+([A-Z0-9\-]+)',
+            r'DL\s*(?:Number|#)?[:\s]+([A-Z0-9\-]+)',
+        ], _strip),
+        _spec(('expiry_date',), ('exp', 'valid'), [
+            r'Expir(?:y|ation)\s*Date[:\s]+' + _DATE,
+            r'Exp\.?\s*Date[:\s]+' + _DATE,
+            r'Valid\s*(?:Through|Until)[:\s]+' + _DATE,
+        ], _date),
+        _spec(('issue_date',), ('report', 'issue', 'renewal'), [
+            r'Report\s*Date[:\s]+' + _ISO_DATE,  # Report Date: 2025-01-05
+            r'Issue\s*Date[:\s]+' + _ISO_DATE,
+            r'Issue\s*Date[:\s]+' + _DATE,
+            r'Issued[:\s]+' + _ISO_DATE,
+            r'Issued[:\s]+' + _DATE,
+            r'Renewal\s*Date[:\s]+' + _ISO_DATE,
+            r'Renewal\s*Date[:\s]+' + _DATE,
+            r'(?:Issue|Issued)[:\s]+' + _ISO_DATE,  # DASH format: 2025-01-05
+        ], _date),
+        _spec(('license_class',), ('class', 'license'), [
+            r'Class[:\s]+([A-Z0-9]+)',
+            r'License\s*Class[:\s]+([A-Z0-9]+)',
+        ], _strip),
+    ],
+    'insurance': [
+        _spec(('years_continuous_insurance',), ('years',), [
+            r'Years\s+of\s+Continuous\s+Insurance:\s*(\d+)',
+        ], _raw),
+    ],
+    'license': [
+        _spec(('license_status',), ('status', 'license'), [
+            r'Status[:\s]+(Valid|Active|Suspended|Revoked|Expired)',
+            r'License\s*Status[:\s]+(Valid|Active|Suspended|Revoked|Expired)',
+        ], _strip),
+        _spec(('demerit_points',), ('demerit', 'point', 'current'), [
+            r'(?:Demerit\s*)?Points?[:\s]+(\d+)',
+            r'Point\s*Balance[:\s]+(\d+)',
+            r'Current\s*Points[:\s]+(\d+)',
+        ], _raw),
+        _spec(('conditions',), ('condition',), [
+            r'Conditions?[:\s]+([^\n]+)',
+        ], _strip),
+    ],
+    'contact': [
+        _spec(('phone',), ('phone', 'tel', 'mobile'), [
+            r'Phone[:\s]+' + _PHONE,
+            r'Tel[:\s]+' + _PHONE,
+            r'Mobile[:\s]+' + _PHONE,
+        ], _strip),
+    ],
+}
+
+# Section headings, matched at their anchor positions the same way as the label fields
+POLICIES_SECTION = re.compile(r'Policies\s*\n(.*?)(?:Claims|Page \d+ of \d+|$)', re.DOTALL | re.IGNORECASE)
+CLAIMS_SECTION = re.compile(r'Claims\s*\n(.*?)(?:Previous Inquiries)', re.DOTALL | re.IGNORECASE)
+CLAIMS_SECTION_TO_END = re.compile(r'Claims\s*\n(.*?)$', re.DOTALL | re.IGNORECASE)
+NEXT_POLICY = re.compile(r'Policy\s*#(\d+)')
+POLICY_TERM = re.compile(r'#(\d+)\s+(\d{4}-\d{1,2}-\d{1,2})\s+to\s+(\d{4}-\d{1,2}-\d{1,2})')
+EARLIEST_TERM = re.compile(r'Start\s+of\s+the\s+Earliest\s+Term:\s*(\d{4}-\d{2}-\d{2})')
+LATEST_TERM = re.compile(r'End\s+of\s+the\s+Latest\s+Term:\s*(\d{4}-\d{2}-\d{2})')
+POLICY1_EXPIRY_PATTERNS = [
+    re.compile(r'Expiry\s*Date:\s*(\d{4}-\d{1,2}-\d{1,2})', re.IGNORECASE),  # YYYY-MM-DD format
+    re.compile(r'Expiry\s*Date:\s*(\d{1,2}/\d{1,2}/\d{4})', re.IGNORECASE),  # MM/DD/YYYY format
+]
+
+# Policy #1 vehicles
+VEHICLE_SPLIT = re.compile(r'Vehicle\s*#(\d+):\s*', re.IGNORECASE)
+VIN_PATTERN = re.compile(r'([A-HJ-NPR-Z0-9]{17})')
+VEHICLE_ROLE_BLOCK = re.compile(r'^(Principal Operator|Named Insured|Self|Spouse)', re.IGNORECASE)
+VEHICLE_ROLE_LINE = re.compile(r'^(Principal Operator|Named Insured|Self|Spouse|DLN|Ontario|Relationship)', re.IGNORECASE)
+WHITESPACE_RUN = re.compile(r'\s+')
+
+# Claims list
+CLAIM_SPLIT = re.compile(r'(?=#\d)')
+CLAIM_NUMBER = re.compile(r'#(\d+)')
+LOSS_DATE = re.compile(r'(\d{4}[-/]\d{1,2}[-/]\d{1,2})')
+AT_FAULT = re.compile(r'At-?Fault\s*:\s*(\d+)\s*%', re.IGNORECASE)
+FIRST_PARTY_DRIVER = re.compile(r'First\s+Party\s+Driver\s*:\s*([A-Z][A-Za-z\s\-\']+(?:,\s*[A-Z][A-Za-z\s\-\']+)?)', re.IGNORECASE)
+DRIVER_TRAILER = re.compile(r'\s+(DLN|Date\s+of|Listed|Excl|Convict).*$', re.IGNORECASE)
+STARRED_NOTE = re.compile(r'\*.*?\*')
+THIRD_PARTY_DRIVER = re.compile(r'\*?THIRD\s*PARTY\*?\s*[-:\s]*([A-Z][A-Z\s\-\']+,\s*[A-Z][A-Za-z\s\-\']+)?', re.IGNORECASE)
+THIRD_PARTY_FLAG = re.compile(r'\*?THIRD\s*PARTY\*?', re.IGNORECASE)
+KOL_ITEM = re.compile(r'(KOL\d+\s*[-–]\s*[^\n:]+?):\s*\$\s*([\d,\.]+)\s*\(Loss\);\s*\$\s*([\d,\.]+)\s*\(Expense\);', re.IGNORECASE)
+CLAIM_COMPANY = re.compile(r'#\d+\s+.*?(\d{4}[-/]\d{1,2}[-/]\d{1,2})\s+(.*?)(?:At-?Fault|$)', re.IGNORECASE | re.DOTALL)
+
+# Claim detail sections ("Claim #N Date of Loss ..."), each running to the next claim or Convictions
+CLAIM_DETAIL_HEADER = re.compile(r'Claim\s*#[:\s]*(\d+)', re.IGNORECASE)
+CLAIM_DETAIL_END = re.compile(r'Convictions', re.IGNORECASE)
+CLAIM_TOTALS = re.compile(r'Total Loss:\s*\$\s*([\d,\.]+).*?Total Expense:\s*\$\s*([\d,\.]+)', re.DOTALL | re.IGNORECASE)
+CLAIM_STATUS = re.compile(r'Claim\s*Status:\s*(\w+)', re.IGNORECASE)
+
+ISO_YEAR_PREFIX = re.compile(r'\d{4}-')
+
+EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+EMAIL_LOCAL_CHARS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._%+-')
+
+DASH_LABELS = sorted({anchor for specs in DASH_FIELD_SPECS.values() for spec in specs for anchor in spec[1]}
+                     | {'policies', 'claims', 'start', 'end'})
+
+
+def index_labels(text, labels):
+    """
+    One lowercase pass over the text: label -> ascending positions where it occurs.
+    Returns None when str.lower() and re.IGNORECASE could disagree (e.g. Turkish dotless i),
+    so callers fall back to a plain search.
+    """
+    lowered = text.lower()
+    if len(lowered) != len(text) or 'ı' in text or 'ſ' in text:
+        return None
+    positions = {}
+    for label in labels:
+        found = []
+        pos = lowered.find(label)
+        while pos >= 0:
+            found.append(pos)
+            pos = lowered.find(label, pos + 1)
+        positions[label] = found
+    return positions
+
+
+def first_match(pattern, text, label_index, anchors):
+    """Same match as pattern.search(text), trying only the positions where an anchor occurs"""
+    if label_index is None:
+        return pattern.search(text)
+    if len(anchors) == 1:
+        candidates = label_index[anchors[0]]
+    else:
+        candidates = sorted({pos for anchor in anchors for pos in label_index[anchor]})
+    for pos in candidates:
+        match = pattern.match(text, pos)
+        if match:
+            return match
+    return None
+
+
+def apply_field_specs(data, text, label_index, specs):
+    """Fill `data` from a group of DASH_FIELD_SPECS, first matching pattern per field"""
+    for fields, anchors, patterns, transform in specs:
+        for pattern in patterns:
+            match = first_match(pattern, text, label_index, anchors)
+            if match:
+                value = transform(match.group(1))
+                for field in fields:
+                    data[field] = value
+                break
+
+
+def find_email(text):
+    """Same match as EMAIL_PATTERN.search(text), only trying the local part in front of each '@'"""
+    at = text.find('@')
+    while at >= 0:
+        start = at
+        while start > 0 and text[start - 1] in EMAIL_LOCAL_CHARS:
+            start -= 1
+        if start < at:
+            match = EMAIL_PATTERN.match(text, start)
+            if match:
+                return match
+        at = text.find('@', at + 1)
+    return None
+
+
+def index_claim_details(text):
+    """
+    Map claim number -> (start, end) of its detail section, from one scan of the claim headers.
+    A section ends at the next header for a different claim (repeated headers on continuation
+    pages stay inside it) or at "Convictions"; the first section for a number wins.
+    """
+    headers = [(match.start(), match.group(1)) for match in CLAIM_DETAIL_HEADER.finditer(text)]
+    stops = [match.start() for match in CLAIM_DETAIL_END.finditer(text)]
+    spans = {}
+    for index, (start, claim_num) in enumerate(headers):
+        if claim_num in spans:
+            continue
+        end = next((next_start for next_start, next_num in headers[index + 1:] if next_num != claim_num), len(text))
+        stop = bisect.bisect_left(stops, start)
+        if stop < len(stops):
+            end = min(end, stops[stop])
+        spans[claim_num] = (start, end)
+    return spans
+
+
+def dash_sections(text, label_index):
+    """Locate the Policies list, Claims list and Policy #1 detail section once per document"""
+    policies_match = first_match(POLICIES_SECTION, text, label_index, ('policies',))
+    claims_match = first_match(CLAIMS_SECTION, text, label_index, ('claims',))
+    if not claims_match:
+        claims_match = first_match(CLAIMS_SECTION_TO_END, text, label_index, ('claims',))
+
+    policy1_section = None
+    policy1_pos = text.find('Policy #1')
+    if policy1_pos >= 0:
+        # Policy #1 section ends where the next policy begins (or at the end of the document)
+        next_policy_match = NEXT_POLICY.search(text, policy1_pos + len('Policy #1'))
+        if next_policy_match:
+            policy1_section = text[policy1_pos:next_policy_match.start()]
+        else:
+            policy1_section = text[policy1_pos:]
+
+    return {
+        'policies': policies_match.group(1) if policies_match else None,
+        'claims': claims_match.group(1) if claims_match else None,
+        'policy1_pos': policy1_pos,
+        'policy1': policy1_section
+    }
 
 
 def parse_dash_pdf(pdf_file):
@@ -14,55 +277,44 @@ def parse_dash_pdf(pdf_file):
     Parse DASH (Driver Abstract/Summary History) PDF and extract driver information
     
     Args:
-        pdf_file: File object or bytes of the PDF
+        pdf_file: Path, file object or bytes of the PDF (a path lets the parser read from disk)
         
     Returns:
         dict: Extracted DASH information
     """
     try:
-        print("\n[INFO] Starting DASH PDF parsing...")
-        # Use pdfplumber for more robust text extraction
-        import pdfplumber
-        if isinstance(pdf_file, bytes):
-            pdf_file = BytesIO(pdf_file)
-        full_text = ""
-        page_count = 0
-        with pdfplumber.open(pdf_file) as pdf:
-            print(f"[PDF] PDF has {len(pdf.pages)} pages")
-            for page_idx, page in enumerate(pdf.pages):
-                try:
-                    page_text = page.extract_text()
-                    if page_text:
-                        full_text += page_text + "\n"
-                        page_count += 1
-                        print(f"  Page {page_idx + 1}: Extracted {len(page_text)} characters")
-                    else:
-                        print(f"  Page {page_idx + 1}: No text extracted (possibly scanned image)")
-                except Exception as page_error:
-                    print(f"  [ERROR] Error extracting text from page {page_idx + 1}: {str(page_error)}")
+        logger.debug("Starting DASH PDF parsing...")
+        # Cheapest extractor that keeps the DASH anchors, pdfplumber as the fallback
+        pdf_text = extract_text_tiered(pdf_file, DASH_ANCHORS)
+        full_text = pdf_text.text
+        for page_idx, page_text in enumerate(pdf_text.page_texts):
+            if page_text:
+                logger.debug("Page %s: Extracted %s characters", page_idx + 1, len(page_text))
+            else:
+                logger.debug("Page %s: No text extracted (possibly scanned image)", page_idx + 1)
         
-        print(f"[OK] Successfully extracted text from {page_count} page(s), total: {len(full_text)} characters")
+        logger.debug("[OK] Successfully extracted text from %s page(s), total: %s characters", pdf_text.pages_with_text, len(full_text))
         
         if not full_text or len(full_text.strip()) < 50:
-            print("[WARNING] Extracted text is too short or empty")
-            print(f"First 100 chars: {full_text[:100]}")
+            logger.warning("Extracted text is too short or empty")
+            logger.debug("First 100 chars: %s", full_text[:100])
 
         # Parse the extracted text
-        print("[PARSE] Calling extract_dash_fields...")
+        logger.debug("[PARSE] Calling extract_dash_fields...")
         dash_data = extract_dash_fields(full_text)
         
-        print(f"[OK] DASH parsing complete. Extracted fields: {list(dash_data.keys())}")
+        logger.debug("[OK] DASH parsing complete. Extracted fields: %s", list(dash_data.keys()))
         
         return {
             "success": True,
             "data": dash_data,
-            "raw_text": full_text  # For debugging
+            "raw_text": full_text,  # For debugging
+            "page_offsets": pdf_text.page_offsets,
+            "text_tier": pdf_text.tier
         }
     except Exception as e:
         error_msg = f"PDF Parsing Error: {str(e)}"
-        print(f"[ERROR] {error_msg}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("%s", error_msg)
         return {
             "success": False,
             "error": error_msg
@@ -73,161 +325,62 @@ def extract_dash_fields(text):
     Extract specific fields from DASH text
     """
     data = {}
-    print("=== DASH PDF TEXT SAMPLE (First 2000 chars) ===")
-    print(text[:2000])
-    print("=== END SAMPLE ===")
-    report_date_match = re.search(r'Report\s*Date:\s*(\d{4}-\d{1,2}\s*\d{1,2}-\d{1,2})', text, re.IGNORECASE)
-    if report_date_match:
-        # Remove any spaces from the date
-        date_str = report_date_match.group(1).replace(' ', '')
-        data['issue_date'] = normalize_date(date_str)
-        data['report_date'] = normalize_date(date_str)
-        print(f" Found Report Date: {data['report_date']}")
-    
-    # Driver Name - REMOVED: Name should only come from MVR
-    # Name will be extracted from MVR PDF, not from DASH
-    
-    # Address - format: "Address: 201-1480 Eglinton Ave W ,Toronto,ON M6C2G5"
-    address_patterns = [
-        r'Address:\s*(.+?)\s+Number of',  # Get everything until "Number of"
-        r'Address:\s*([^\n]+)',
-    ]
-    for pattern in address_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            data['address'] = match.group(1).strip()
-            print(f"Found address: {data['address']}")
-            break
-    
-    # License Number - format: "DLN: G6043-37788-80203"
-    license_patterns = [
-        r'DLN:\s*([A-Z0-9\-]+)',  # DLN: G6043-37788-80203
-        r'License\s*(?:Number|#|No\.?)?[:\s]+([A-Z0-9\-]+)',
-        r'DL\s*(?:Number|#)?[:\s]+([A-Z0-9\-]+)',
-    ]
-    for pattern in license_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            data['license_number'] = match.group(1).strip()
-            break
-    
-    # Date of Birth - REMOVED: DOB should only come from MVR
-    # Date of Birth will be extracted from MVR PDF, not from DASH
-    
-    # Expiry Date
-    expiry_patterns = [
-        r'Expir(?:y|ation)\s*Date[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-        r'Exp\.?\s*Date[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-        r'Valid\s*(?:Through|Until)[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})'
-    ]
-    for pattern in expiry_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            data['expiry_date'] = normalize_date(match.group(1))
-            break
-    
-    # Issue/Renewal Date
-    issue_patterns = [
-        r'Report\s*Date[:\s]+(\d{4}-\d{2}-\d{2})',  # Report Date: 2025-01-05
-        r'Issue\s*Date[:\s]+(\d{4}-\d{2}-\d{2})',
-        r'Issue\s*Date[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-        r'Issued[:\s]+(\d{4}-\d{2}-\d{2})',
-        r'Issued[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-        r'Renewal\s*Date[:\s]+(\d{4}-\d{2}-\d{2})',
-        r'Renewal\s*Date[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-        r'(?:Issue|Issued)[:\s]+(\d{4}-\d{2}-\d{2})'  # DASH format: 2025-01-05
-    ]
-    for pattern in issue_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            data['issue_date'] = normalize_date(match.group(1))
-            print(f" Found issue/renewal/report date: {data['issue_date']} (pattern: {pattern[:30]}...)")
-            break
-    
-    if not data.get('issue_date'):
-        print("[WARNING] No issue/renewal/report date found in PDF")
-    
-    # Class
-    class_patterns = [
-        r'Class[:\s]+([A-Z0-9]+)',
-        r'License\s*Class[:\s]+([A-Z0-9]+)'
-    ]
-    for pattern in class_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            data['license_class'] = match.group(1).strip()
-            break
+    # Text dumps are PII and expensive - only for sampled documents with LOG_DEBUG_DUMPS on
+    dump = dumps_enabled(logger)
+    if dump:
+        logger.debug("=== DASH PDF TEXT SAMPLE (First 2000 chars) ===\n%s\n=== END SAMPLE ===", text[:2000])
+    
+    # One pass to index label positions and locate the sections; every lookup below reuses them
+    label_index = index_labels(text, DASH_LABELS)
+    sections = dash_sections(text, label_index)
+    
+    # Report date, address, licence number/class, expiry and issue dates
+    # Driver Name and Date of Birth are NOT read here - they only come from the MVR
+    apply_field_specs(data, text, label_index, DASH_FIELD_SPECS['header'])
+    if data.get('issue_date'):
+        logger.debug("Found issue/renewal/report date: %s", data['issue_date'])
+    else:
+        logger.warning("No issue/renewal/report date found in PDF")
     
     # VIN and Vehicle info: Extract ALL VEHICLES from Policy #1 section ONLY
     # Find Policy #1, then extract up to Policy #2 (or end if no Policy #2)
     
-    policy1_pos = text.find('Policy #1')
+    policy1_pos = sections['policy1_pos']
+    policy1_section = sections['policy1']
     policy1_vehicles_list = []  # Array to store ALL vehicles from Policy #1
     
-    print(f"\n[VEHICLES] Searching for 'Policy #1'...")
-    print(f"[VEHICLES] policy1_pos = {policy1_pos}")
-    print(f"[VEHICLES] Total text length: {len(text)} chars")
+    logger.debug("[VEHICLES] policy1_pos = %s, total text length: %s chars", policy1_pos, len(text))
     
-    # Also search for vehicle section
-    vehicle_search = text.find('Vehicle #')
-    print(f"[VEHICLES] Searching for 'Vehicle #'... found at position: {vehicle_search}")
-    
-    if vehicle_search >= 0:
-        print(f"[VEHICLES] Vehicle section found! Text around it (500 chars):")
-        start = max(0, vehicle_search - 100)
-        end = min(len(text), vehicle_search + 400)
-        print(f"{text[start:end]}")
-    else:
-        print(f"[VEHICLES] ❌ NO 'Vehicle #' found in entire PDF text!")
-        print(f"[VEHICLES] Searching for alternative vehicle patterns...")
-        
-        # Check for other possible patterns
-        if 'VIN' in text:
-            print(f"[VEHICLES] Found 'VIN' in text")
+    if dump:
+        # Show where the vehicles are (or what looks like them) when Policy #1 parsing misbehaves
+        vehicle_search = text.find('Vehicle #')
+        if vehicle_search >= 0:
+            start = max(0, vehicle_search - 100)
+            logger.debug("[VEHICLES] Text around 'Vehicle #' (500 chars):\n%s", text[start:vehicle_search + 400])
+        else:
+            logger.debug("[VEHICLES] ❌ NO 'Vehicle #' found in entire PDF text!")
             vin_pos = text.find('VIN')
-            print(f"[VEHICLES] Text around VIN (300 chars):")
-            start = max(0, vin_pos - 100)
-            end = min(len(text), vin_pos + 200)
-            print(f"{text[start:end]}")
-        
-        if 'VEHICLE' in text.upper():
-            print(f"[VEHICLES] Found 'VEHICLE' (uppercase) in text")
+            if vin_pos >= 0:
+                logger.debug("[VEHICLES] Text around VIN (300 chars):\n%s", text[max(0, vin_pos - 100):vin_pos + 200])
             veh_pos = text.upper().find('VEHICLE')
-            print(f"[VEHICLES] Text around VEHICLE (300 chars):")
-            start = max(0, veh_pos - 100)
-            end = min(len(text), veh_pos + 200)
-            print(f"{text[start:end]}")
-    
-    if policy1_pos >= 0:
-        # Find the NEXT policy number after Policy #1
-        # Search from after "Policy #1" to find "Policy #2", "Policy #3", etc.
-        remaining_text = text[policy1_pos + len('Policy #1'):]
-        
-        next_policy_match = re.search(r'Policy\s*#(\d+)', remaining_text)
-        
-        if next_policy_match:
-            # Policy #1 section ends where the next policy begins
-            next_policy_pos = policy1_pos + len('Policy #1') + next_policy_match.start()
-            policy1_section = text[policy1_pos:next_policy_pos]
-            print(f"[VEHICLES] Found next policy, Policy #1 section size: {len(policy1_section)} chars")
-        else:
-            # No next policy, take the rest of the document
-            policy1_section = text[policy1_pos:]
-            print(f"[VEHICLES] No next policy found, taking rest of doc. Policy #1 section size: {len(policy1_section)} chars")
-        
-        print(f"[VEHICLES] Policy #1 section (first 1000 chars):\n{policy1_section[:1000]}")
-        print(f"[VEHICLES] ...")
-        print(f"[VEHICLES] Policy #1 section (last 500 chars):\n{policy1_section[-500:]}")
+            if veh_pos >= 0:
+                logger.debug("[VEHICLES] Text around VEHICLE (300 chars):\n%s", text[max(0, veh_pos - 100):veh_pos + 200])
+    
+    if policy1_section is not None:
+        logger.debug("[VEHICLES] Policy #1 section size: %s chars", len(policy1_section))
+        if dump:
+            logger.debug("[VEHICLES] Policy #1 section (first 1000 chars):\n%s\n...\n(last 500 chars):\n%s",
+                         policy1_section[:1000], policy1_section[-500:])
         
         # Extract ALL vehicles from Policy #1 by finding all "Vehicle #N:" patterns
         # Split by any Vehicle #N pattern to get all vehicle blocks
-        vehicle_blocks = re.split(r'Vehicle\s*#(\d+):\s*', policy1_section, flags=re.IGNORECASE)
+        vehicle_blocks = VEHICLE_SPLIT.split(policy1_section)
         
-        print(f"[VEHICLES] Split result: {len(vehicle_blocks)} blocks")
+        logger.debug("[VEHICLES] Split result: %s blocks", len(vehicle_blocks))
         if len(vehicle_blocks) > 1:
-            print(f"[VEHICLES] vehicle_blocks structure: {[type(b).__name__ + f'(len={len(b)})' for b in vehicle_blocks[:5]]}")
+            logger.debug("[VEHICLES] vehicle block lengths: %s", [len(b) for b in vehicle_blocks[:5]])
         else:
-            print(f"[VEHICLES] ❌ No Vehicle #N pattern matched! Regex didn't split anything")
+            logger.warning("[VEHICLES] ❌ No Vehicle #N pattern matched! Regex didn't split anything")
         
         # vehicle_blocks will be: ['text_before', 'num1', 'content1', 'num2', 'content2', ...]
         # Process pairs: (vehicle_number, vehicle_content)
@@ -237,13 +390,14 @@ def extract_dash_fields(text):
                 vehicle_num = vehicle_blocks[i].strip()
                 block = vehicle_blocks[i + 1]
                 
-                print(f"[VEHICLES] Processing Vehicle #{vehicle_num}...")
-                print(f"[VEHICLES]   Block content (first 200 chars): {block[:200]}")
+                logger.debug("[VEHICLES] Processing Vehicle #%s...", vehicle_num)
+                if dump:
+                    logger.debug("[VEHICLES]   Block content (first 200 chars): %s", block[:200])
                 
                 # Check if this block contains a VIN (17-char code)
-                vin_match = re.search(r'([A-HJ-NPR-Z0-9]{17})', block)
+                vin_match = VIN_PATTERN.search(block)
                 
-                if vin_match and not re.match(r'^(Principal Operator|Named Insured|Self|Spouse)', block.strip(), re.IGNORECASE):
+                if vin_match and not VEHICLE_ROLE_BLOCK.match(block.strip()):
                     # This block has a VIN and is not just a role label
                     vin = vin_match.group(1).strip().upper()
                     
@@ -255,27 +409,27 @@ def extract_dash_fields(text):
                     vehicle_info = lines[0].strip() if lines else vehicle_line
                     
                     # Clean up the text
-                    vehicle_info = re.sub(r'\s+', ' ', vehicle_info)  # collapse whitespace
+                    vehicle_info = WHITESPACE_RUN.sub(' ', vehicle_info)  # collapse whitespace
                     vehicle_info = vehicle_info.rstrip(' -/').strip()   # remove trailing separators
                     
                     # Skip if it's empty or just a role
-                    if vehicle_info and not re.match(r'^(Principal Operator|Named Insured|Self|Spouse|DLN|Ontario|Relationship)', vehicle_info, re.IGNORECASE):
+                    if vehicle_info and not VEHICLE_ROLE_LINE.match(vehicle_info):
                         policy1_vehicles_list.append({
                             'vehicle_number': vehicle_num,
                             'vin': vin,
                             'year_make_model': vehicle_info
                         })
-                        print(f"[VEHICLES] ✅ Found Vehicle #{vehicle_num}: {vehicle_info} | VIN: {vin}")
+                        logger.debug("[VEHICLES] ✅ Found Vehicle #%s: %s | VIN: %s", vehicle_num, vehicle_info, vin)
                 else:
-                    print(f"[VEHICLES] ❌ No valid VIN found in block or block is role label")
+                    logger.debug("[VEHICLES] No valid VIN found in block or block is role label")
         
         if not policy1_vehicles_list:
-            print("[VEHICLES] ❌ No vehicles with VIN found in Policy #1 section")
+            logger.warning("[VEHICLES] ❌ No vehicles with VIN found in Policy #1 section")
     else:
-        print("[VEHICLES] ❌ Policy #1 not found in PDF")
+        logger.warning("[VEHICLES] ❌ Policy #1 not found in PDF")
     
-    print(f"[VEHICLES] FINAL RESULT: {len(policy1_vehicles_list)} vehicles extracted")
-    print(f"[VEHICLES] policy1_vehicles_list = {policy1_vehicles_list}")
+    logger.debug("[VEHICLES] FINAL RESULT: %s vehicles extracted", len(policy1_vehicles_list))
+    logger.debug("[VEHICLES] policy1_vehicles_list = %s", policy1_vehicles_list)
     
     # Store all vehicles from Policy #1 for frontend to render
     data['policy1_vehicles'] = policy1_vehicles_list
@@ -291,19 +445,16 @@ def extract_dash_fields(text):
     data['extracted_from_policy'] = '1'  # Indicates this is from Policy #1
     
     # Years of Continuous Insurance
-    cont_ins_match = re.search(r'Years\s+of\s+Continuous\s+Insurance:\s*(\d+)', text, re.IGNORECASE)
-    if cont_ins_match:
-        data['years_continuous_insurance'] = cont_ins_match.group(1)
-        print(f" Years of Continuous Insurance: {data['years_continuous_insurance']}")
+    apply_field_specs(data, text, label_index, DASH_FIELD_SPECS['insurance'])
+    if data.get('years_continuous_insurance'):
+        logger.debug("Years of Continuous Insurance: %s", data['years_continuous_insurance'])
     
     # Policy dates for gap calculation
     # Find all policies in the Policies section: "#1 2025-08-08 to 2026-08-08 ..."
-    policies_section_match = re.search(r'Policies\s*\n(.*?)(?:Claims|Page \d+ of \d+|$)', text, re.DOTALL | re.IGNORECASE)
-    if policies_section_match:
-        policies_text = policies_section_match.group(1)
+    policies_text = sections['policies']
+    if policies_text is not None:
         # Extract all policies with pattern: #N YYYY-MM-DD to YYYY-MM-DD
-        policy_pattern = r'#(\d+)\s+(\d{4}-\d{1,2}-\d{1,2})\s+to\s+(\d{4}-\d{1,2}-\d{1,2})'
-        policy_matches = list(re.finditer(policy_pattern, policies_text))
+        policy_matches = list(POLICY_TERM.finditer(policies_text))
         
         if policy_matches:
             # Store ALL policies for gap calculation
@@ -320,7 +471,7 @@ def extract_dash_fields(text):
             # STRICT REQUIREMENT: DO NOT SORT - use order provided by data source
             # The order of appearance in the PDF is the only source of truth
             data['all_policies'] = all_policies
-            print(f" Extracted {len(all_policies)} policies in PDF order (NO SORTING)")
+            logger.debug("Extracted %s policies in PDF order (NO SORTING)", len(all_policies))
             
             # Get the FIRST policy from the PDF (not necessarily Policy #1)
             first_policy_data = all_policies[0]
@@ -338,81 +489,51 @@ def extract_dash_fields(text):
             last_policy_data = all_policies[-1]
             data['policy_start_date'] = last_policy_data['start_date']
             
-            print(f" First Insurance Date (from first policy in list): {data['first_insurance_date']}")
-            print(f" Renewal Date (First policy Expiry): {data['renewal_date']}")
-            print(f" Current Policy Start Date (from last policy): {data['policy_start_date']}")
+            logger.debug("First Insurance Date (from first policy in list): %s", data['first_insurance_date'])
+            logger.debug("Renewal Date (First policy Expiry): %s", data['renewal_date'])
+            logger.debug("Current Policy Start Date (from last policy): %s", data['policy_start_date'])
 
     
     # Fallback: Try to get from detail section if policies section not found
     if not data.get('policy_start_date'):
-        earliest_term_match = re.search(r'Start\s+of\s+the\s+Earliest\s+Term:\s*(\d{4}-\d{2}-\d{2})', text)
+        earliest_term_match = first_match(EARLIEST_TERM, text, label_index, ('start',))
         if earliest_term_match:
             data['policy_start_date'] = normalize_date(earliest_term_match.group(1))
-            print(f" Policy Start Date (fallback): {data['policy_start_date']}")
+            logger.debug("Policy Start Date (fallback): %s", data['policy_start_date'])
     
     if not data.get('policy_end_date'):
-        latest_term_match = re.search(r'End\s+of\s+the\s+Latest\s+Term:\s*(\d{4}-\d{2}-\d{2})', text)
+        latest_term_match = first_match(LATEST_TERM, text, label_index, ('end',))
         if latest_term_match:
             data['policy_end_date'] = normalize_date(latest_term_match.group(1))
-            print(f" Policy End Date (fallback): {data['policy_end_date']}")
-    
-    # Status
-    status_patterns = [
-        r'Status[:\s]+(Valid|Active|Suspended|Revoked|Expired)',
-        r'License\s*Status[:\s]+(Valid|Active|Suspended|Revoked|Expired)'
-    ]
-    for pattern in status_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            data['license_status'] = match.group(1).strip()
-            break
-    
-    # Demerit Points
-    points_patterns = [
-        r'(?:Demerit\s*)?Points?[:\s]+(\d+)',
-        r'Point\s*Balance[:\s]+(\d+)',
-        r'Current\s*Points[:\s]+(\d+)'
-    ]
-    for pattern in points_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            data['demerit_points'] = match.group(1)
-            break
+            logger.debug("Policy End Date (fallback): %s", data['policy_end_date'])
     
-    # Conditions/Restrictions
-    conditions_match = re.search(r'Conditions?[:\s]+([^\n]+)', text, re.IGNORECASE)
-    if conditions_match:
-        data['conditions'] = conditions_match.group(1).strip()
+    # Licence status, demerit points, conditions/restrictions
+    apply_field_specs(data, text, label_index, DASH_FIELD_SPECS['license'])
     
     # Claims History - extract ONLY from the "Claims" section
     # NOT from the "Policies" section
     claims = []
     
-    print("\n=== EXTRACTING CLAIMS ===")
-    
-    # Find the "Claims" section in the PDF - improved to capture all claims across pages
-    # Look for Claims section and capture until "Previous Inquiries" section
-    claims_section_match = re.search(r'Claims\s*\n(.*?)(?:Previous Inquiries)', text, re.DOTALL | re.IGNORECASE)
-    
-    # If not found, try alternative: capture from Claims to end of document
-    if not claims_section_match:
-        claims_section_match = re.search(r'Claims\s*\n(.*?)$', text, re.DOTALL | re.IGNORECASE)
+    logger.debug("=== EXTRACTING CLAIMS ===")
     
-    if claims_section_match:
-        claims_text = claims_section_match.group(1)
-        print(f"\n=== CLAIMS SECTION ({len(claims_text)} chars) ===")
-        print(f"First 1000 chars:\n{claims_text[:1000]}")
+    # The "Claims" section runs to "Previous Inquiries" (or the end of the document) so claims
+    # continued across pages are included
+    claims_text = sections['claims']
+    if claims_text is not None:
+        logger.debug("=== CLAIMS SECTION (%s chars) ===", len(claims_text))
+        if dump:
+            logger.debug("Claims section (first 1000 chars):\n%s", claims_text[:1000])
         
         # Count potential claim markers
-        claim_num_markers = re.findall(r'#(\d+)', claims_text)
-        print(f"\n[DEBUG] Found claim number markers: {claim_num_markers}")
-        print(f"[DEBUG] Total markers found: {len(claim_num_markers)}")
+        claim_num_markers = CLAIM_NUMBER.findall(claims_text)
+        logger.debug("[DEBUG] Found claim number markers: %s", claim_num_markers)
+        logger.debug("[DEBUG] Total markers found: %s", len(claim_num_markers))
         
         # Strategy: Split by claim numbers and extract data from each section
-        print(f"\n[EXTRACT] Splitting by claim number patterns...")
+        logger.debug("[EXTRACT] Splitting by claim number patterns...")
         
         # Split by # followed by digit
-        parts = re.split(r'(?=#\d)', claims_text)
+        parts = CLAIM_SPLIT.split(claims_text)
         claim_matches = []
         
         for part_idx, part in enumerate(parts):
@@ -421,132 +542,83 @@ def extract_dash_fields(text):
                 continue
                 
             # Extract claim number
-            num_match = re.match(r'#(\d+)', part)
+            num_match = CLAIM_NUMBER.match(part)
             if not num_match:
                 continue
                 
             claim_num = num_match.group(1)
-            print(f"\n[CLAIM {claim_num}] Processing...")
-            print(f"[CLAIM {claim_num}] TEXT PREVIEW: {part[:800]}")  # DEBUG: Show first 800 chars
+            logger.debug("[CLAIM %s] Processing...", claim_num)
+            if dump:
+                logger.debug("[CLAIM %s] TEXT PREVIEW: %s", claim_num, part[:800])
             
             # Extract date of loss
-            date_match = re.search(r'(\d{4}[-/]\d{1,2}[-/]\d{1,2})', part)
+            date_match = LOSS_DATE.search(part)
             loss_date = date_match.group(1) if date_match else "0000-00-00"
-            print(f"  Date: {loss_date}")
+            logger.debug("Date: %s", loss_date)
             
             # Extract at-fault percentage
-            fault_match = re.search(r'At-?Fault\s*:\s*(\d+)\s*%', part, re.IGNORECASE)
+            fault_match = AT_FAULT.search(part)
             at_fault_pct = fault_match.group(1) if fault_match else "0"
-            print(f"  At-Fault: {at_fault_pct}%")
+            logger.debug("At-Fault: %s%%", at_fault_pct)
             
             # Extract company name (usually between Date and At-Fault)
-            company_match = re.search(rf'#{claim_num}\s+.*?(\d{{4}}[-/]\d{{1,2}}[-/]\d{{1,2}})\s+(.*?)(?:At-?Fault|$)', part, re.IGNORECASE | re.DOTALL)
+            company_match = CLAIM_COMPANY.match(part)
             company = company_match.group(2).strip() if company_match else ""
             if company:
                 company = company.split('\n')[0].strip()  # Take first line only
-            print(f"  Company: {company}")
+            logger.debug("Company: %s", company)
             
-            # Create a match-like object to maintain compatibility
-            class PartMatch:
-                def __init__(self, num, date, company, fault, full_text):
-                    self._num = num
-                    self._date = date
-                    self._company = company
-                    self._fault = fault
-                    self._text = full_text
-                def group(self, idx):
-                    if idx == 0: return self._text
-                    elif idx == 1: return self._num
-                    elif idx == 2: return self._date
-                    elif idx == 3: return self._company
-                    elif idx == 4: return self._fault
-                    return None
-                def groups(self):
-                    return (self._num, self._date, self._company, self._fault)
-                def end(self):
-                    return len(self._text)
-            
-            claim_matches.append(PartMatch(claim_num, loss_date, company, at_fault_pct, part))
+            claim_matches.append((claim_num, loss_date, company, at_fault_pct, part))
         
-        print(f"\n[EXTRACT] Total claims extracted: {len(claim_matches)}")
-        print(f"[EXTRACT] Expected: {len(claim_num_markers)}, Found: {len(claim_matches)}")
+        logger.debug("[EXTRACT] Total claims extracted: %s", len(claim_matches))
+        logger.debug("[EXTRACT] Expected: %s, Found: %s", len(claim_num_markers), len(claim_matches))
         
         total_claims_found = len(claim_matches)
-        print(f"\n[CLAIMS] TOTAL FOUND: {total_claims_found}")
+        logger.debug("[CLAIMS] TOTAL FOUND: %s", total_claims_found)
+        
+        # "Claim #N Date of Loss ..." detail sections, indexed once - each claim only reads its own slice
+        claim_spans = index_claim_details(text)
         
-        for idx, match in enumerate(claim_matches, 1):
+        for idx, (claim_num, loss_date, company_and_notes, at_fault_pct, part) in enumerate(claim_matches, 1):
             claim = {}
-            print(f"\n[CLAIM {idx}/{total_claims_found}] Processing...")
-            claim_num = match.group(1)
-            loss_date = match.group(2)
+            logger.debug("[CLAIM %s/%s] Processing...", idx, total_claims_found)
+            logger.debug("Company='%s', AtFault=%s%%", company_and_notes, at_fault_pct)
             
-            # Extract company name and at-fault percentage
-            if len(match.groups()) >= 4:
-                # We have the full match with company and at-fault
-                company_and_notes = match.group(3).strip()
-                at_fault_pct = match.group(4)
-                print(f"  [FULL] Company='{company_and_notes}', AtFault={at_fault_pct}%")
-            else:
-                # Fallback: extract from text after the loss date
-                company_and_notes = ""
-                at_fault_pct = "0"
-                # Try to find at-fault percentage in the text following this claim
-                search_start = match.end()
-                search_end = min(search_start + 200, len(claims_text))
-                next_section = claims_text[search_start:search_end]
-                at_fault_match = re.search(r'At-?Fault\s*:\s*(\d+)\s*%', next_section, re.IGNORECASE)
-                if at_fault_match:
-                    at_fault_pct = at_fault_match.group(1)
-                    # Extract company from between loss date and at-fault
-                    company_section = next_section[:at_fault_match.start()]
-                    company_and_notes = company_section.strip()
-                    print(f"  [PARTIAL] Company='{company_and_notes}', AtFault={at_fault_pct}%")
+            # Without a detail section, fall back to the claim's own entry in the Claims list
+            span = claim_spans.get(claim_num)
+            detail_text = text[span[0]:span[1]] if span else part
             
             claim['date'] = normalize_date(loss_date)
             
             # Extract FIRST PARTY DRIVER NAME
             # In DASH reports, look for "First Party Driver:" label followed by the name
-            # Search in the current claim section first, then in the full PDF text
-            first_party_driver = ''
-            first_party_match = re.search(r'First\s+Party\s+Driver\s*:\s*([A-Z][A-Za-z\s\-\']+(?:,\s*[A-Z][A-Za-z\s\-\']+)?)', part, re.IGNORECASE)
-            if first_party_match:
-                first_party_driver = first_party_match.group(1).strip()
-            else:
-                # If not found in claim section, search the full PDF text around this claim date
-                # Create a pattern to find the claim by date and extract details after it
-                claim_detail_pattern = rf'Claim\s*#[:\s]*{claim_num}\s+Date\s+of\s+Loss\s+{re.escape(loss_date)}.*?First\s+Party\s+Driver\s*:\s*([A-Z][A-Za-z\s\-\']+(?:,\s*[A-Z][A-Za-z\s\-\']+)?)'
-                full_match = re.search(claim_detail_pattern, text, re.DOTALL | re.IGNORECASE)
-                if full_match:
-                    first_party_driver = full_match.group(1).strip()
-                    # Clean up - remove anything after newline or extra content
-                    first_party_driver = first_party_driver.split('\n')[0].strip()
-                    # Also remove trailing text like "DLN" if it got included
-                    first_party_driver = re.sub(r'\s+(DLN|Date\s+of|Listed|Excl|Convict).*$', '', first_party_driver, flags=re.IGNORECASE)
+            first_party_match = FIRST_PARTY_DRIVER.search(detail_text)
+            first_party_driver = first_party_match.group(1).strip() if first_party_match else ''
             
-            # Clean up the name - remove newlines and extra whitespace
-            first_party_driver = first_party_driver.split('\n')[0].strip() if first_party_driver else ''
-            first_party_driver = re.sub(r'\s+(DLN|Date\s+of|Listed|Excl|Convict).*$', '', first_party_driver, flags=re.IGNORECASE)
+            # Clean up the name - remove anything after a newline and trailing text like "DLN"
+            first_party_driver = first_party_driver.split('\n')[0].strip()
+            first_party_driver = DRIVER_TRAILER.sub('', first_party_driver)
             
             if first_party_driver:
                 claim['firstPartyDriver'] = first_party_driver
-                print(f"  [FOUND] First Party Driver: {first_party_driver}")
+                logger.debug("[FOUND] First Party Driver: %s", first_party_driver)
             else:
-                print(f"  [NOT FOUND] First Party Driver")
+                logger.debug("[NOT FOUND] First Party Driver")
             
             # Extract company name and check for THIRD PARTY indicator
-            company = re.sub(r'\*.*?\*', '', company_and_notes).strip()
+            company = STARRED_NOTE.sub('', company_and_notes).strip()
             claim['company'] = company
             
             # Extract THIRD PARTY DRIVER NAME
             # If company contains "*THIRD PARTY*" or similar, extract the third party name
-            third_party_match = re.search(r'\*?THIRD\s*PARTY\*?\s*[-:\s]*([A-Z][A-Z\s\-\']+,\s*[A-Z][A-Za-z\s\-\']+)?', company_and_notes, re.IGNORECASE)
+            third_party_match = THIRD_PARTY_DRIVER.search(company_and_notes)
             if third_party_match and third_party_match.group(1):
                 claim['thirdPartyDriver'] = third_party_match.group(1).strip()
-                print(f"  Third Party Driver: {claim['thirdPartyDriver']}")
-            elif re.search(r'\*?THIRD\s*PARTY\*?', company_and_notes, re.IGNORECASE):
+                logger.debug("Third Party Driver: %s", claim['thirdPartyDriver'])
+            elif THIRD_PARTY_FLAG.search(company_and_notes):
                 # Third party claim but no explicit name extracted, use company as fallback
                 claim['thirdPartyDriver'] = company.replace('*THIRD PARTY*', '').strip() or 'Third Party'
-                print(f"  Third Party Driver (from company): {claim['thirdPartyDriver']}")
+                logger.debug("Third Party Driver (from company): %s", claim['thirdPartyDriver'])
             
             
             # At-fault
@@ -557,10 +629,8 @@ def extract_dash_fields(text):
             else:
                 claim['fault'] = f'{at_fault_pct}%'
             
-            # Try to find claim details in the detailed section below
-            # Look for the specific claim number section and extract financial details
-            claim_detail_pattern = rf'Claim #{claim_num}\s+Date of Loss\s+\d{{4}}-\d{{2}}-\d{{2}}.*?Total Loss:\s*\$\s*([\d,\.]+).*?Total Expense:\s*\$\s*([\d,\.]+)'
-            detail_match = re.search(claim_detail_pattern, text, re.DOTALL | re.IGNORECASE)
+            # Financial details from the claim's detail section
+            detail_match = CLAIM_TOTALS.search(detail_text)
             
             if detail_match:
                 loss_val = detail_match.group(1).replace(',', '').strip()
@@ -573,29 +643,13 @@ def extract_dash_fields(text):
                 try:
                     total = float(loss_val) + float(expense_val)
                     claim['total'] = f'{total:.2f}'
-                    print(f"  -> Financials: Loss=${loss_val}, Expense=${expense_val}, Total=${total:.2f}")
+                    logger.debug("-> Financials: Loss=$%s, Expense=$%s, Total=$%.2f", loss_val, expense_val, total)
                 except ValueError:
-                    print(f"  [WARNING] Could not calculate total for claim #{claim_num}")
+                    logger.warning("Could not calculate total for claim #%s", claim_num)
                 
                 # Extract KOL (claim loss details) items like "KOL16 - Other Property Damage..."
                 # Pattern: KOL## - Description: $X (Loss); $Y (Expense);
-                # Search in the current claim section and the full PDF
-                kol_matches = []
-                
-                # Improved regex to handle variations in spacing and newlines
-                # Match KOL## followed by description, then amounts
-                kol_pattern = r'(KOL\d+\s*[-–]\s*[^\n:]+?):\s*\$\s*([\d,\.]+)\s*\(Loss\);\s*\$\s*([\d,\.]+)\s*\(Expense\);'
-                kol_matches = re.findall(kol_pattern, part, re.IGNORECASE)
-                
-                # If not found in claim section, search full PDF for this specific claim's details
-                if not kol_matches:
-                    # Search a large area around the claim number to find KOL items
-                    # Look for "Claim #X" and capture everything until the next "Claim #" or end of document
-                    claim_section_pattern = rf'Claim\s*#\s*{claim_num}.*?(?=Claim\s*#\d+|Convictions|$)'
-                    claim_section_match = re.search(claim_section_pattern, text, re.DOTALL | re.IGNORECASE)
-                    if claim_section_match:
-                        claim_section_text = claim_section_match.group(0)
-                        kol_matches = re.findall(kol_pattern, claim_section_text, re.IGNORECASE)
+                kol_matches = KOL_ITEM.findall(detail_text)
                 
                 if kol_matches:
                     kol_items = []
@@ -608,110 +662,77 @@ def extract_dash_fields(text):
                             'expense': kol_expense.strip()
                         })
                     claim['kolItems'] = kol_items
-                    print(f"  -> Found {len(kol_items)} loss detail items (KOL)")
+                    logger.debug("-> Found %s loss detail items (KOL)", len(kol_items))
                     for item in kol_items:
-                        print(f"     • {item['description']}: ${item['loss']} (Loss), ${item['expense']} (Expense)")
+                        logger.debug("• %s: $%s (Loss), $%s (Expense)", item['description'], item['loss'], item['expense'])
                 else:
-                    print(f"  -> No loss detail items (KOL) found for this claim")
+                    logger.debug("-> No loss detail items (KOL) found for this claim")
             else:
-                print(f"  [WARNING] No financial details found for claim #{claim_num}")
+                logger.warning("No financial details found for claim #%s", claim_num)
             
             # Try to find claim status
-            status_pattern = rf'Claim #{claim_num}.*?Claim\s*Status:\s*(\w+)'
-            status_match = re.search(status_pattern, text, re.DOTALL | re.IGNORECASE)
+            status_match = CLAIM_STATUS.search(detail_text)
             if status_match:
                 claim['status'] = status_match.group(1).strip()
             else:
                 claim['status'] = 'Closed'  # Default if not found
             
-            print(f" Claim #{claim_num}: {claim['date']}, Company={claim['company']}, At-Fault={claim['fault']}, Status={claim.get('status', 'N/A')}")
+            logger.debug("Claim #%s: %s, Company=%s, At-Fault=%s, Status=%s", claim_num, claim['date'], claim['company'], claim['fault'], claim.get('status', 'N/A'))
             claims.append(claim)
     else:
-        print("[WARNING] No 'Claims' section found in PDF")
+        logger.warning("No 'Claims' section found in PDF")
     
-    print(f"\n FINAL: {len(claims)} claims extracted from Claims section")
+    logger.debug("FINAL: %s claims extracted from Claims section", len(claims))
     
     if claims:
         data['claims'] = claims
         data['claims_count'] = str(len(claims))
-        print(f" Returning {len(claims)} valid claims\n")
+        logger.debug("Returning %s valid claims", len(claims))
     else:
         data['claims'] = []
         data['claims_count'] = '0'
-        print(f"[INFO] No valid claims found in PDF\n")
+        logger.debug("No valid claims found in PDF")
     
-    # Email
-    email_match = re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', text)
+    # Email and phone - if present
+    email_match = find_email(text)
     if email_match:
         data['email'] = email_match.group(0)
     
-    # Phone number - if present
-    phone_patterns = [
-        r'Phone[:\s]+(\+?[\d\-\(\)\s]+)',
-        r'Tel[:\s]+(\+?[\d\-\(\)\s]+)',
-        r'Mobile[:\s]+(\+?[\d\-\(\)\s]+)'
-    ]
-    for pattern in phone_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            data['phone'] = match.group(1).strip()
-            print(f"Found phone: {data['phone']}")
-            break
-    
-    # Email - if present
-    email_match = re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', text)
-    if email_match:
-        data['email'] = email_match.group(0)
-        print(f"Found email: {data['email']}")
+    apply_field_specs(data, text, label_index, DASH_FIELD_SPECS['contact'])
+    if data.get('phone'):
+        logger.debug("Found phone: %s", data['phone'])
+    if data.get('email'):
+        logger.debug("Found email: %s", data['email'])
     
     # Extract Policy #1 Expiry Date from the policy detail section (NOT the "to" date from policies list)
     # The "to" date might be the cancellation date, but "Expiry Date:" is the actual expiry
-    if policy1_pos >= 0:
-        # Get Policy #1 section
-        remaining_text = text[policy1_pos + len('Policy #1'):]
-        next_policy_match = re.search(r'Policy\s*#(\d+)', remaining_text)
-        
-        if next_policy_match:
-            next_policy_pos = policy1_pos + len('Policy #1') + next_policy_match.start()
-            policy1_section = text[policy1_pos:next_policy_pos]
-        else:
-            policy1_section = text[policy1_pos:]
-        
+    if policy1_section is not None:
         # Look for "Expiry Date: YYYY-MM-DD" or "Expiry Date: MM/DD/YYYY"
-        expiry_date_patterns = [
-            r'Expiry\s*Date:\s*(\d{4}-\d{1,2}-\d{1,2})',  # YYYY-MM-DD format
-            r'Expiry\s*Date:\s*(\d{1,2}/\d{1,2}/\d{4})',  # MM/DD/YYYY format
-        ]
-        
         policy1_expiry_found = False
-        for pattern in expiry_date_patterns:
-            expiry_match = re.search(pattern, policy1_section, re.IGNORECASE)
+        for pattern in POLICY1_EXPIRY_PATTERNS:
+            expiry_match = pattern.search(policy1_section)
             if expiry_match:
                 policy1_expiry_date = normalize_date(expiry_match.group(1))
                 data['renewal_date'] = policy1_expiry_date
                 policy1_expiry_found = True
-                print(f" Found Policy #1 Expiry Date: {policy1_expiry_date}")
-                print(f" Updated Renewal Date to Policy #1 Expiry Date: {data['renewal_date']}")
+                logger.debug("Found Policy #1 Expiry Date: %s", policy1_expiry_date)
+                logger.debug("Updated Renewal Date to Policy #1 Expiry Date: %s", data['renewal_date'])
                 break
         
         if not policy1_expiry_found:
-            print(f" Policy #1 Expiry Date not found in policy detail section, using policy list end_date")
+            logger.debug("Policy #1 Expiry Date not found in policy detail section, using policy list end_date")
     
     # Log what was extracted
     extracted_fields = [k for k, v in data.items() if v]
-    print(f"\n[OK] DASH extraction complete:")
-    print(f"  Fields extracted: {extracted_fields}")
-    print(f"  Total fields with values: {len(extracted_fields)} out of {len(data)}")
-    print(f"=== DASH EXTRACTED DATA ===")
-    print(json.dumps(data, indent=2, default=str))
-    print(f"=== END DATA ===")
+    logger.debug("[OK] DASH extraction complete:")
+    logger.debug("Fields extracted: %s", extracted_fields)
+    logger.debug("Total fields with values: %s out of %s", len(extracted_fields), len(data))
+    if dump:
+        logger.debug("=== DASH EXTRACTED DATA ===\n%s\n=== END DATA ===", json.dumps(data, indent=2, default=str))
     
     if not extracted_fields:
-        print("\n[WARNING] WARNING: No fields were extracted from the PDF text!")
-        print("This could mean:")
-        print("  1. PDF is image-based/scanned (needs OCR)")
-        print("  2. Text layout doesn't match expected patterns")
-        print("  3. PDF is corrupted")
+        # Image-based/scanned PDF (needs OCR), a layout the patterns don't expect, or a corrupt file
+        logger.warning("No fields were extracted from the PDF text!")
     
     return data
 
@@ -721,36 +742,31 @@ def parse_mvr_pdf(pdf_file):
     Parse MVR PDF and extract driver information
     
     Args:
-        pdf_file: File object or bytes of the PDF
+        pdf_file: Path, file object or bytes of the PDF (a path lets the parser read from disk)
         
     Returns:
         dict: Extracted MVR information
     """
     try:
-        # Read PDF
-        if isinstance(pdf_file, bytes):
-            pdf_file = BytesIO(pdf_file)
-        
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        
-        # Extract text from all pages
-        full_text = ""
-        for page in pdf_reader.pages:
-            full_text += page.extract_text() + "\n"
+        # Cheapest extractor that keeps the MVR anchors, pdfplumber as the fallback
+        pdf_text = extract_text_tiered(pdf_file, MVR_ANCHORS)
+        full_text = pdf_text.text
         
         # Parse the extracted text
         mvr_data = extract_mvr_fields(full_text)
         
         # CRITICAL: Verify policy1_vehicles is in the response
-        print(f"\n[PARSE_MVR] Verifying response data:")
-        print(f"[PARSE_MVR] - 'policy1_vehicles' in mvr_data: {'policy1_vehicles' in mvr_data}")
+        logger.debug("[PARSE_MVR] Verifying response data:")
+        logger.debug("[PARSE_MVR] - 'policy1_vehicles' in mvr_data: %s", 'policy1_vehicles' in mvr_data)
         if 'policy1_vehicles' in mvr_data:
-            print(f"[PARSE_MVR] - mvr_data['policy1_vehicles']: {mvr_data['policy1_vehicles']}")
+            logger.debug("[PARSE_MVR] - mvr_data['policy1_vehicles']: %s", mvr_data['policy1_vehicles'])
         
         return {
             "success": True,
             "data": mvr_data,
-            "raw_text": full_text  # For debugging
+            "raw_text": full_text,  # For debugging
+            "page_offsets": pdf_text.page_offsets,
+            "text_tier": pdf_text.tier
         }
         
     except Exception as e:
@@ -765,10 +781,10 @@ def extract_mvr_fields(text):
     Extract specific fields from MVR text using regex patterns
     """
     data = {}
-    
-    print("=== MVR PDF TEXT SAMPLE (First 2000 chars) ===")
-    print(text[:2000])
-    print("=== END SAMPLE ===")
+    # Text dumps are PII and expensive - only for sampled documents with LOG_DEBUG_DUMPS on
+    dump = dumps_enabled(logger)
+    if dump:
+        logger.debug("=== MVR PDF TEXT SAMPLE (First 2000 chars) ===\n%s\n=== END SAMPLE ===", text[:2000])
     
     # Extract text before DOB to search for name (names usually come before DOB)
     dob_pos = text.find('Birth Date')
@@ -778,9 +794,9 @@ def extract_mvr_fields(text):
         dob_pos = text.find('Date of Birth')
     
     search_text = text[:dob_pos] if dob_pos > 0 else text[:2000]
-    print(f"=== NAME SEARCH AREA (before DOB, {len(search_text)} chars) ===")
-    print(search_text)
-    print("=== END NAME SEARCH AREA ===")
+    if dump:
+        logger.debug("=== NAME SEARCH AREA (before DOB, %s chars) ===\n%s\n=== END NAME SEARCH AREA ===",
+                     len(search_text), search_text)
     
     # FIRST: Extract Full Name from MVR - Ontario format: "Name: LASTNAME,FIRSTNAME,MIDDLE Birth Date: ..."
     # Method 1: Direct match for "Name: " followed by text until "Birth Date" or newline
@@ -797,18 +813,18 @@ def extract_mvr_fields(text):
                 if len(parts) > 2 and parts[2]:
                     name_formatted += f" {parts[2]}"
                 data['name'] = name_formatted
-                print(f" ✓ Found Name (formatted from comma-separated): {data['name']}")
+                logger.debug("✓ Found Name (formatted from comma-separated): %s", data['name'])
             else:
                 data['name'] = name_raw
-                print(f" ✓ Found Name (raw): {data['name']}")
+                logger.debug("✓ Found Name (raw): %s", data['name'])
         else:
             data['name'] = name_raw
-            print(f" ✓ Found Name (raw): {data['name']}")
+            logger.debug("✓ Found Name (raw): %s", data['name'])
     
     if 'name' not in data:
-        print(f" ⚠️  WARNING: Could not extract name from MVR")
+        logger.warning("⚠️ Could not extract name from MVR")
     else:
-        print(f" ✓ FINAL NAME EXTRACTED: {data['name']}")
+        logger.debug("✓ FINAL NAME EXTRACTED: %s", data['name'])
     
     # License Number - various patterns
     
@@ -823,7 +839,7 @@ def extract_mvr_fields(text):
         match = re.search(pattern, text, re.IGNORECASE)
         if match:
             data['license_number'] = match.group(1).strip()
-            print(f" Found License Number: {data['license_number']}")
+            logger.debug("Found License Number: %s", data['license_number'])
             break
     
     # Expiry Date - MVR format: "Expiry Date: 03/02/2030"
@@ -839,7 +855,7 @@ def extract_mvr_fields(text):
         match = re.search(pattern, text, re.IGNORECASE)
         if match:
             data['expiry_date'] = normalize_date(match.group(1))
-            print(f" Found License Expiry Date: {data['expiry_date']}")
+            logger.debug("Found License Expiry Date: %s", data['expiry_date'])
             # DO NOT override renewal_date here - it should only come from DASH PDF
             # The expiry_date here is the driver's license expiry, not policy renewal
             break
@@ -855,7 +871,7 @@ def extract_mvr_fields(text):
         match = re.search(pattern, text, re.IGNORECASE)
         if match:
             data['dob'] = normalize_date(match.group(1))
-            print(f" Found DOB: {data['dob']}")
+            logger.debug("Found DOB: %s", data['dob'])
             break
     
     # Issue Date - MVR format: "Issue Date: 16/11/2001"
@@ -868,7 +884,7 @@ def extract_mvr_fields(text):
         match = re.search(pattern, text, re.IGNORECASE)
         if match:
             data['issue_date'] = normalize_date(match.group(1))
-            print(f" Found Issue Date: {data['issue_date']}")
+            logger.debug("Found Issue Date: %s", data['issue_date'])
             break
     
     # License Status - MVR format: "Status: LICENCED"
@@ -886,7 +902,7 @@ def extract_mvr_fields(text):
                 data['license_status'] = 'Valid'
             else:
                 data['license_status'] = status.capitalize()
-            print(f" Found License Status: {data['license_status']}")
+            logger.debug("Found License Status: %s", data['license_status'])
             break
     
     # Class/Type - MVR format: "Class: G***"
@@ -900,7 +916,7 @@ def extract_mvr_fields(text):
         match = re.search(pattern, text, re.IGNORECASE)
         if match:
             data['license_class'] = match.group(1).strip().replace('*', '')
-            print(f" Found License Class: {data['license_class']}")
+            logger.debug("Found License Class: %s", data['license_class'])
             break
     
     # VIN and Vehicle info: Extract ALL VEHICLES from Policy #1 section (for MVR PDFs)
@@ -908,8 +924,8 @@ def extract_mvr_fields(text):
     policy1_pos = text.find('Policy #1')
     policy1_vehicles_list = []  # Array to store ALL vehicles from Policy #1
     
-    print(f"\n[VEHICLES] Searching for 'Policy #1' in MVR...")
-    print(f"[VEHICLES] policy1_pos = {policy1_pos}")
+    logger.debug("[VEHICLES] Searching for 'Policy #1' in MVR...")
+    logger.debug("[VEHICLES] policy1_pos = %s", policy1_pos)
     
     if policy1_pos >= 0:
         # Find the NEXT policy number after Policy #1
@@ -920,11 +936,11 @@ def extract_mvr_fields(text):
             # Policy #1 section ends where the next policy begins
             next_policy_pos = policy1_pos + len('Policy #1') + next_policy_match.start()
             policy1_section = text[policy1_pos:next_policy_pos]
-            print(f"[VEHICLES] Found next policy, Policy #1 section size: {len(policy1_section)} chars")
+            logger.debug("[VEHICLES] Found next policy, Policy #1 section size: %s chars", len(policy1_section))
         else:
             # No next policy, take the rest of the document
             policy1_section = text[policy1_pos:]
-            print(f"[VEHICLES] No next policy found, taking rest of doc. Policy #1 section size: {len(policy1_section)} chars")
+            logger.debug("[VEHICLES] No next policy found, taking rest of doc. Policy #1 section size: %s chars", len(policy1_section))
         
         # Extract ALL vehicles from Policy #1
         # Format: "Vehicle #N: YEAR MAKE - MODEL VIN"
@@ -932,19 +948,20 @@ def extract_mvr_fields(text):
         vehicle_pattern = r'Vehicle\s*#(\d+):\s*([^\n]*(?:\n(?!Vehicle\s*#).*)*)'
         vehicle_matches = re.finditer(vehicle_pattern, policy1_section, re.IGNORECASE)
         
-        print(f"[VEHICLES] Searching for vehicles with pattern...")
+        logger.debug("[VEHICLES] Searching for vehicles with pattern...")
         
         for match in vehicle_matches:
             vehicle_num = match.group(1).strip()
             vehicle_content = match.group(2)
             
-            print(f"\n[VEHICLES] Processing Vehicle #{vehicle_num}...")
-            print(f"[VEHICLES] Content (first 300 chars): {vehicle_content[:300]}")
+            logger.debug("[VEHICLES] Processing Vehicle #%s...", vehicle_num)
+            if dump:
+                logger.debug("[VEHICLES] Content (first 300 chars): %s", vehicle_content[:300])
             
             # Check if this is a role label (e.g., "Principal Operator", "Named Insured")
             first_line = vehicle_content.split('\n')[0].strip()
             if re.match(r'^(Principal Operator|Named Insured|Self|Spouse|Relationship|Owner)', first_line, re.IGNORECASE):
-                print(f"[VEHICLES] Skipping - this is a role assignment, not a vehicle")
+                logger.debug("[VEHICLES] Skipping - this is a role assignment, not a vehicle")
                 continue
             
             # Try to extract VIN and year/make/model
@@ -956,7 +973,7 @@ def extract_mvr_fields(text):
             if match1:
                 year_make_model = match1.group(1).strip()
                 vin = match1.group(2).strip().upper()
-                print(f"[VEHICLES] Pattern 1: Found year/make/model: {year_make_model}, VIN: {vin}")
+                logger.debug("[VEHICLES] Pattern 1: Found year/make/model: %s, VIN: %s", year_make_model, vin)
             
             # Pattern 2: "YEAR MAKE - MODEL\nVIN" (VIN on next line)
             if not vin:
@@ -964,7 +981,7 @@ def extract_mvr_fields(text):
                 if match2:
                     year_make_model = match2.group(1).strip()
                     vin = match2.group(2).strip().upper()
-                    print(f"[VEHICLES] Pattern 2: Found year/make/model: {year_make_model}, VIN: {vin}")
+                    logger.debug("[VEHICLES] Pattern 2: Found year/make/model: %s, VIN: %s", year_make_model, vin)
             
             # Pattern 3: Extract first meaningful line and look for VIN anywhere
             if not vin:
@@ -974,7 +991,7 @@ def extract_mvr_fields(text):
                     if vin_match:
                         vin = vin_match.group(1).strip().upper()
                         year_make_model = line[:vin_match.start()].strip()
-                        print(f"[VEHICLES] Pattern 3: Found year/make/model: {year_make_model}, VIN: {vin}")
+                        logger.debug("[VEHICLES] Pattern 3: Found year/make/model: %s, VIN: %s", year_make_model, vin)
                         break
             
             if vin and year_make_model:
@@ -989,16 +1006,16 @@ def extract_mvr_fields(text):
                         'vin': vin,
                         'year_make_model': year_make_model
                     })
-                    print(f"[VEHICLES] [OK] Added Vehicle #{vehicle_num}: {year_make_model} | VIN: {vin}")
+                    logger.debug("[VEHICLES] [OK] Added Vehicle #%s: %s | VIN: %s", vehicle_num, year_make_model, vin)
                 else:
-                    print(f"[VEHICLES] Skipped - year/make/model too short: '{year_make_model}'")
+                    logger.debug("[VEHICLES] Skipped - year/make/model too short: '%s'", year_make_model)
             else:
-                print(f"[VEHICLES] [WARN] Could not extract VIN or year/make/model for Vehicle #{vehicle_num}")
+                logger.warning("[VEHICLES] Could not extract VIN or year/make/model for Vehicle #%s", vehicle_num)
     else:
-        print("[VEHICLES] [ERROR] Policy #1 not found in MVR PDF")
+        logger.warning("[VEHICLES] Policy #1 not found in MVR PDF")
     
-    print(f"\n[VEHICLES] FINAL RESULT: {len(policy1_vehicles_list)} vehicles extracted")
-    print(f"[VEHICLES] policy1_vehicles_list = {policy1_vehicles_list}")
+    logger.debug("[VEHICLES] FINAL RESULT: %s vehicles extracted", len(policy1_vehicles_list))
+    logger.debug("[VEHICLES] policy1_vehicles_list = %s", policy1_vehicles_list)
     
     # Store all vehicles from Policy #1 for frontend to render
     data['policy1_vehicles'] = policy1_vehicles_list
@@ -1019,7 +1036,7 @@ def extract_mvr_fields(text):
         match = re.search(pattern, text, re.IGNORECASE)
         if match:
             data['demerit_points'] = match.group(1)
-            print(f" Found Demerit Points: {data['demerit_points']}")
+            logger.debug("Found Demerit Points: %s", data['demerit_points'])
             break
     
     # Conditions/Restrictions - MVR format: "Conditions: */N"
@@ -1034,7 +1051,7 @@ def extract_mvr_fields(text):
             # Skip if it's just */N or similar placeholder
             if cond and cond not in ['*/N', '*', 'N', 'None', 'NONE']:
                 data['conditions'] = cond
-                print(f" Found Conditions: {data['conditions']}")
+                logger.debug("Found Conditions: %s", data['conditions'])
             break
     
     # Number of Convictions - MVR format: "***Number of Convictions: 0 ***"
@@ -1043,7 +1060,7 @@ def extract_mvr_fields(text):
     if conv_match:
         conv_count = int(conv_match.group(1))
         data['convictions_count'] = str(conv_count)
-        print(f" Found Convictions Count: {conv_count}")
+        logger.debug("Found Convictions Count: %s", conv_count)
         
         # If there are convictions, try to extract them
         if conv_count > 0:
@@ -1068,9 +1085,9 @@ def extract_mvr_fields(text):
                 else:
                     conv_section = text[conv_section_start:]
             
-            print(f"\n=== CONVICTIONS SECTION (First 2000 chars) ===")
-            print(conv_section[:2000] if conv_section else "NO SECTION FOUND")
-            print(f"=== END CONVICTIONS SECTION ===\n")
+            if dump:
+                logger.debug("=== CONVICTIONS SECTION (First 2000 chars) ===\n%s\n=== END CONVICTIONS SECTION ===",
+                             conv_section[:2000] if conv_section else 'NO SECTION FOUND')
             
             # Try multiple patterns to extract conviction details
             # Pattern 1: Standard MVR format - lines with date, offense, and penalties
@@ -1093,7 +1110,7 @@ def extract_mvr_fields(text):
             ]
             
             for pattern in conv_detail_patterns:
-                print(f"\n[PATTERN] Trying pattern: {pattern[:80]}...")
+                logger.debug("[PATTERN] Trying pattern: %s...", pattern[:80])
                 conv_matches = re.finditer(pattern, conv_section, re.IGNORECASE | re.MULTILINE)
                 matched_count = 0
                 
@@ -1124,40 +1141,39 @@ def extract_mvr_fields(text):
                         if conviction not in convictions:
                             convictions.append(conviction)
                             matched_count += 1
-                            print(f"   Found: {conviction['date']} - {conviction['description'][:60]}...")
+                            logger.debug("Found: %s - %s...", conviction['date'], conviction['description'][:60])
                 
                 # If we found enough convictions with this pattern, use it
                 if len(convictions) >= conv_count:
-                    print(f" Pattern matched {matched_count} convictions, stopping pattern search")
+                    logger.debug("Pattern matched %s convictions, stopping pattern search", matched_count)
                     break
                 elif matched_count > 0:
-                    print(f" Pattern matched {matched_count} conviction(s)")
+                    logger.debug("Pattern matched %s conviction(s)", matched_count)
             
             if convictions:
                 data['convictions'] = convictions
-                print(f"\n[OK] Extracted {len(convictions)} conviction details out of {conv_count} expected")
+                logger.debug("[OK] Extracted %s conviction details out of %s expected", len(convictions), conv_count)
                 if len(convictions) < conv_count:
-                    print(f"[WARNING]  Note: Expected {conv_count} but found {len(convictions)} - PDF format may vary")
+                    logger.warning("Note: Expected %s but found %s - PDF format may vary", conv_count, len(convictions))
             else:
                 # If we couldn't extract details, at least show count
-                print(f"[WARNING]  Could not extract conviction details (found count: {conv_count})")
-                print(f"    This might be due to PDF format variation. Please check the PDF manually.")
+                # Usually a PDF format variation - check the PDF manually
+                logger.warning("Could not extract conviction details (found count: %s)", conv_count)
     else:
         # Default to 0 if not found
         data['convictions_count'] = '0'
-        print(f" No convictions section found (defaulting to 0 convictions)")
+        logger.debug("No convictions section found (defaulting to 0 convictions)")
     
-    print(f"=== MVR EXTRACTED DATA ===")
-    print(json.dumps(data, indent=2))
-    print(f"=== END DATA ===")
+    if dump:
+        logger.debug("=== MVR EXTRACTED DATA ===\n%s\n=== END DATA ===", json.dumps(data, indent=2))
     
     # CRITICAL: Verify policy1_vehicles is in the data being returned
-    print(f"\n[VERIFY] About to return extract_mvr_fields data:")
-    print(f"[VERIFY] - 'policy1_vehicles' key exists: {'policy1_vehicles' in data}")
+    logger.debug("[VERIFY] About to return extract_mvr_fields data:")
+    logger.debug("[VERIFY] - 'policy1_vehicles' key exists: %s", 'policy1_vehicles' in data)
     if 'policy1_vehicles' in data:
-        print(f"[VERIFY] - policy1_vehicles value: {data['policy1_vehicles']}")
-        print(f"[VERIFY] - policy1_vehicles length: {len(data['policy1_vehicles'])}")
-    print(f"[VERIFY] - Total data keys: {len(data)}")
+        logger.debug("[VERIFY] - policy1_vehicles value: %s", data['policy1_vehicles'])
+        logger.debug("[VERIFY] - policy1_vehicles length: %s", len(data['policy1_vehicles']))
+    logger.debug("[VERIFY] - Total data keys: %s", len(data))
     
     return data
 
@@ -1167,6 +1183,14 @@ def normalize_date(date_str):
     Convert various date formats to MM/DD/YYYY
     """
     try:
+        # DASH dates are YYYY-MM-DD. Every format listed before '%Y-%m-%d' needs a separator within
+        # the first two characters, so those strings can skip straight to it
+        if ISO_YEAR_PREFIX.match(date_str):
+            try:
+                return datetime.strptime(date_str, '%Y-%m-%d').strftime('%m/%d/%Y')
+            except ValueError:
+                return date_str
+        
         # Try different date formats
         formats = [
             '%m/%d/%Y', '%m-%d-%Y',
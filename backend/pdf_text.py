@@ -0,0 +1,214 @@
+"""
+PDF Text Extraction
+Tiered text extraction (PyPDF2 -> pdfminer -> pdfplumber); the pdfplumber tier fans long reports
+out over worker processes by page range
+"""
+import bisect
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+
+try:
+    from .logging_setup import configure_logging
+except ImportError:
+    from logging_setup import configure_logging  # imported as a top-level module by the test scripts
+
+logger = logging.getLogger(__name__)
+
+# Read here rather than in app.py: this runs inside the parser pool's spawned processes,
+# which inherit the environment but not the app's config
+PDF_EXTRACT_WORKERS = int(os.getenv('PDF_EXTRACT_WORKERS', min(4, os.cpu_count() or 1)))
+PDF_PARALLEL_MIN_PAGES = int(os.getenv('PDF_PARALLEL_MIN_PAGES', 12))
+
+# Cheapest first; a tier is accepted once its text contains every anchor the parser needs
+TIER_PYPDF2 = 'pypdf2'
+TIER_PDFMINER = 'pdfminer'
+TIER_PDFPLUMBER = 'pdfplumber'
+TIERS = (TIER_PYPDF2, TIER_PDFMINER, TIER_PDFPLUMBER)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+class PdfText:
+    """Extracted text plus the offset each page starts at, for page-aware section lookups"""
+
+    def __init__(self, page_texts, tier=TIER_PDFPLUMBER):
+        self.page_texts = page_texts
+        self.tier = tier
+        # Pages without text are skipped, the rest are each followed by a newline
+        self.text = ''.join(page_text + '\n' for page_text in page_texts if page_text)
+        self.page_offsets = []
+        offset = 0
+        for page_text in page_texts:
+            self.page_offsets.append(offset)
+            if page_text:
+                offset += len(page_text) + 1
+
+    @property
+    def page_count(self):
+        return len(self.page_texts)
+
+    @property
+    def pages_with_text(self):
+        return sum(1 for page_text in self.page_texts if page_text)
+
+    def page_at(self, position):
+        """0-based page index containing text offset `position`"""
+        return max(bisect.bisect_right(self.page_offsets, position) - 1, 0)
+
+
+def _open_source(source):
+    return BytesIO(source) if isinstance(source, bytes) else source
+
+
+def _extract_pages(pdf, start, end):
+    texts = []
+    for index in range(start, end):
+        page = pdf.pages[index]
+        try:
+            texts.append(page.extract_text() or '')
+        except Exception as page_error:
+            logger.error("Error extracting text from page %s: %s", index + 1, page_error)
+            texts.append('')
+        finally:
+            # Drop the page's cached chars/layout objects so memory stays flat on long reports
+            page.close()
+    return texts
+
+
+def extract_page_range(source, start, end):
+    """Worker entry point: open the document once and extract pages [start, end)"""
+    import pdfplumber
+    with pdfplumber.open(_open_source(source)) as pdf:
+        return _extract_pages(pdf, start, end)
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=PDF_EXTRACT_WORKERS,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=configure_logging
+            )
+        return _executor
+
+
+def _reset_executor(executor):
+    global _executor
+    with _executor_lock:
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def page_ranges(page_count, parts):
+    """Split pages into at most `parts` contiguous [start, end) ranges of near-equal size"""
+    parts = max(1, min(parts, page_count))
+    size, extra = divmod(page_count, parts)
+    ranges = []
+    start = 0
+    for part in range(parts):
+        end = start + size + (1 if part < extra else 0)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def extract_pdf_text(pdf_file):
+    """
+    Extract the text of every page of a PDF
+
+    Short documents are extracted in this process. Documents with at least PDF_PARALLEL_MIN_PAGES
+    pages are split into contiguous page ranges, one per extraction worker.
+
+    Args:
+        pdf_file: bytes, a path, or a binary file object
+
+    Returns:
+        PdfText
+    """
+    import pdfplumber
+    if not isinstance(pdf_file, (bytes, str)):
+        pdf_file = pdf_file.read()
+
+    with pdfplumber.open(_open_source(pdf_file)) as pdf:
+        page_count = len(pdf.pages)
+        logger.debug("[PDF] PDF has %s pages", page_count)
+        if PDF_EXTRACT_WORKERS < 2 or page_count < PDF_PARALLEL_MIN_PAGES:
+            return PdfText(_extract_pages(pdf, 0, page_count))
+
+    ranges = page_ranges(page_count, PDF_EXTRACT_WORKERS)
+    executor = _get_executor()
+    try:
+        futures = [executor.submit(extract_page_range, pdf_file, start, end) for start, end in ranges]
+        page_texts = []
+        for future in futures:
+            page_texts.extend(future.result())
+    except (BrokenProcessPool, RuntimeError) as e:
+        # Lost an extraction worker - rebuild the pool next time and finish this one serially
+        logger.warning("Parallel page extraction failed (%s), extracting sequentially", e)
+        _reset_executor(executor)
+        page_texts = extract_page_range(pdf_file, 0, page_count)
+    logger.info("[PDF] Extracted %s pages in %s parallel ranges", page_count, len(ranges))
+    return PdfText(page_texts)
+
+
+def _pypdf2_pages(source):
+    import PyPDF2
+    reader = PyPDF2.PdfReader(_open_source(source))
+    # Trailing newlines stripped so pages join the same way as pdfplumber's
+    return [(page.extract_text() or '').rstrip('\n') for page in reader.pages]
+
+
+def _pdfminer_pages(source):
+    from pdfminer.high_level import extract_pages
+    from pdfminer.layout import LTTextContainer
+    pages = []
+    for layout in extract_pages(_open_source(source)):
+        text = ''.join(element.get_text() for element in layout if isinstance(element, LTTextContainer))
+        pages.append(text.rstrip('\n'))
+    return pages
+
+
+def has_anchors(text, anchors):
+    """True when every anchor appears in the text (case-insensitive)"""
+    lowered = text.lower()
+    return all(anchor.lower() in lowered for anchor in anchors)
+
+
+def extract_text_tiered(pdf_file, anchors):
+    """
+    Extract text with the cheapest backend whose output contains every anchor
+
+    PyPDF2 and pdfminer's plain layout are tried first; pdfplumber (page-parallel for long
+    reports) is the fallback and is used as-is even when it misses anchors too.
+
+    Args:
+        pdf_file: bytes, a path, or a binary file object
+        anchors: strings the parser needs to find its sections
+
+    Returns:
+        PdfText, with .tier set to the backend that produced it
+    """
+    if not isinstance(pdf_file, (bytes, str)):
+        pdf_file = pdf_file.read()
+
+    for tier, extract in ((TIER_PYPDF2, _pypdf2_pages), (TIER_PDFMINER, _pdfminer_pages)):
+        try:
+            pdf_text = PdfText(extract(pdf_file), tier=tier)
+        except Exception as e:
+            logger.warning("%s text extraction failed: %s", tier, e)
+            continue
+        if has_anchors(pdf_text.text, anchors):
+            logger.debug("[PDF] %s text has all anchors (%s pages)", tier, pdf_text.page_count)
+            return pdf_text
+        logger.info("[PDF] %s text is missing anchors, trying next extractor", tier)
+
+    return extract_pdf_text(pdf_file)
@@ -0,0 +1,73 @@
+"""
+PDF Uploads
+Streams an uploaded file to a temporary file (hashing it on the way) so parsers get a path, not a copy
+"""
+import hashlib
+import os
+import tempfile
+
+CHUNK_SIZE = 64 * 1024
+# The PDF header must start within the first 1024 bytes (some generators prepend junk)
+PDF_MAGIC = b'%PDF-'
+PDF_HEADER_WINDOW = 1024
+
+
+class UploadRejected(Exception):
+    """The upload is not something the parsers should see (answered with 400)"""
+
+
+class SpooledUpload:
+    """A PDF upload on disk: its path, SHA-256 and size. Use as a context manager to delete it"""
+
+    def __init__(self, path, sha256, size):
+        self.path = path
+        self.sha256 = sha256
+        self.size = size
+
+    def remove(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.remove()
+
+
+def spool_pdf_upload(file_storage, directory=None):
+    """
+    Copy an uploaded file to a temporary .pdf file in CHUNK_SIZE pieces
+
+    The PDF magic bytes are checked on the first chunk, before anything is written or parsed.
+
+    Args:
+        file_storage: werkzeug FileStorage from request.files
+        directory: where to spool (defaults to the system temp dir)
+
+    Returns:
+        SpooledUpload
+    """
+    stream = file_storage.stream
+    head = stream.read(PDF_HEADER_WINDOW)
+    if not head:
+        raise UploadRejected('Uploaded file is empty')
+    if PDF_MAGIC not in head:
+        raise UploadRejected('Uploaded file is not a PDF')
+
+    digest = hashlib.sha256(head)
+    size = len(head)
+    fd, path = tempfile.mkstemp(suffix='.pdf', prefix='upload-', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(head)
+            for chunk in iter(lambda: stream.read(CHUNK_SIZE), b''):
+                digest.update(chunk)
+                f.write(chunk)
+                size += len(chunk)
+    except BaseException:
+        os.remove(path)
+        raise
+    return SpooledUpload(path, digest.hexdigest(), size)
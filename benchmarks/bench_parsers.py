@@ -0,0 +1,248 @@
+"""
+PDF Parser Benchmark
+Times parse_dash_pdf / parse_mvr_pdf stage by stage on synthetic reports and checks their fields
+against the golden corpus in benchmarks/golden/
+
+Usage (from the repo root):
+    python benchmarks/bench_parsers.py                    # benchmark + golden check
+    python benchmarks/bench_parsers.py --update-golden    # after an intended output change
+    python benchmarks/bench_parsers.py --kind dash --policies 10 --claims 60 --kols 4 --docs 5
+
+Exits 1 when any document no longer matches its golden output.
+"""
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import resource
+except ImportError:  # Windows - peak RSS is not reported
+    resource = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.synthetic_pdfs import dash_pdf, mvr_pdf  # noqa: E402
+
+GOLDEN_DIR = os.path.join(ROOT, 'benchmarks', 'golden')
+
+# The golden corpus - fixed shapes, each generated for --docs seeds
+CASES = {
+    'dash': [
+        {'name': 'minimal', 'policies': 1, 'vehicles': 1, 'claims': 0, 'kols': 0},
+        {'name': 'typical', 'policies': 3, 'vehicles': 2, 'claims': 4, 'kols': 2},
+        {'name': 'heavy', 'policies': 10, 'vehicles': 3, 'claims': 40, 'kols': 4},
+    ],
+    'mvr': [
+        {'name': 'clean', 'vehicles': 1, 'convictions': 0},
+        {'name': 'typical', 'vehicles': 2, 'convictions': 2},
+        {'name': 'busy', 'vehicles': 4, 'convictions': 6},
+    ],
+}
+
+# text: tiered extraction as the endpoints run it; text_pdfplumber: the fallback tier on its own;
+# fields: regex field extraction on already-extracted text; total: parse_*_pdf end to end
+STAGES = ('text', 'text_pdfplumber', 'fields', 'total')
+
+
+def build_corpus(kind, docs, custom=None):
+    """[(doc id, pdf bytes, pages)] for every case x seed, or for the custom shape only"""
+    cases = [dict(custom, name='custom')] if custom else CASES[kind]
+    corpus = []
+    for case in cases:
+        params = {key: value for key, value in case.items() if key != 'name'}
+        for seed in range(1, docs + 1):
+            pdf, pages = (dash_pdf if kind == 'dash' else mvr_pdf)(seed, **params)
+            corpus.append((f"{case['name']}-{seed}", pdf, pages))
+    return corpus
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def run_stage(kind, stage, inputs, repeat):
+    """Runs in a fresh process so its peak RSS belongs to this stage alone"""
+    # Same filtering cost as production (INFO) without writing anything
+    logging.getLogger().addHandler(logging.NullHandler())
+    logging.getLogger().setLevel(logging.INFO)
+
+    from backend import pdf_parser, pdf_text
+    anchors = pdf_parser.DASH_ANCHORS if kind == 'dash' else pdf_parser.MVR_ANCHORS
+    stages = {
+        'text': lambda pdf: pdf_text.extract_text_tiered(pdf, anchors),
+        'text_pdfplumber': pdf_text.extract_pdf_text,
+        'fields': pdf_parser.extract_dash_fields if kind == 'dash' else pdf_parser.extract_mvr_fields,
+        'total': pdf_parser.parse_dash_pdf if kind == 'dash' else pdf_parser.parse_mvr_pdf,
+    }
+    fn = stages[stage]
+    fn(inputs[0])  # warm up imports and regex caches before measuring
+    baseline = peak_rss_mb()
+
+    latencies = []
+    outputs = []
+    for _ in range(repeat):
+        for item in inputs:
+            started = time.perf_counter()
+            result = fn(item)
+            latencies.append(time.perf_counter() - started)
+            if stage == 'total' and len(outputs) < len(inputs):
+                outputs.append(result)
+    return {'latencies': latencies, 'baseline_rss_mb': baseline, 'peak_rss_mb': peak_rss_mb(), 'outputs': outputs}
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def summarize(stage, pages, run):
+    latencies = run['latencies']
+    elapsed = sum(latencies)
+    growth = None
+    if run['peak_rss_mb'] is not None:
+        growth = round(run['peak_rss_mb'] - run['baseline_rss_mb'], 1)
+    return {
+        'stage': stage,
+        'docs': len(latencies),
+        'docs_per_s': round(len(latencies) / elapsed, 1),
+        'pages_per_s': round(pages / elapsed, 1),
+        'p50_ms': round(percentile(latencies, 50) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 2),
+        'peak_rss_mb': run['peak_rss_mb'],
+        'rss_growth_mb': growth,
+    }
+
+
+def golden_path(kind):
+    return os.path.join(GOLDEN_DIR, f'{kind}.json')
+
+
+def check_golden(kind, corpus, results, update):
+    """Compare parsed fields with the golden file (or rewrite it); returns mismatch descriptions"""
+    parsed = {doc_id: result.get('data') for (doc_id, _, _), result in zip(corpus, results)}
+    if update:
+        os.makedirs(GOLDEN_DIR, exist_ok=True)
+        with open(golden_path(kind), 'w', encoding='utf-8') as f:
+            json.dump(parsed, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"Updated {os.path.relpath(golden_path(kind), ROOT)} ({len(parsed)} documents)")
+        return []
+
+    try:
+        with open(golden_path(kind), 'r', encoding='utf-8') as f:
+            golden = json.load(f)
+    except FileNotFoundError:
+        return [f"{kind}: no golden file - run with --update-golden"]
+
+    mismatches = []
+    for doc_id, data in parsed.items():
+        expected = golden.get(doc_id)
+        if expected is None:
+            mismatches.append(f"{kind}/{doc_id}: not in golden corpus")
+            continue
+        data = json.loads(json.dumps(data, default=str))
+        for field in sorted(set(expected) | set(data or {})):
+            if (data or {}).get(field) != expected.get(field):
+                mismatches.append(f"{kind}/{doc_id}: {field} = {(data or {}).get(field)!r}, "
+                                  f"expected {expected.get(field)!r}")
+    return mismatches
+
+
+def print_report(kind, corpus, rows):
+    pages = sum(page_count for _, _, page_count in corpus)
+    print(f"\n{kind.upper()}: {len(corpus)} documents, {pages} pages")
+    header = f"{'stage':<16}{'docs':>6}{'docs/s':>10}{'pages/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'peak MB':>10}{'+MB':>8}"
+    print(header)
+    print('-' * len(header))
+    for row in rows:
+        peak = '-' if row['peak_rss_mb'] is None else row['peak_rss_mb']
+        growth = '-' if row['rss_growth_mb'] is None else row['rss_growth_mb']
+        print(f"{row['stage']:<16}{row['docs']:>6}{row['docs_per_s']:>10}{row['pages_per_s']:>10}"
+              f"{row['p50_ms']:>10}{row['p99_ms']:>10}{peak:>10}{growth:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--kind', choices=['dash', 'mvr', 'all'], default='all')
+    parser.add_argument('--docs', type=int, default=3, help='seeds per case (default 3)')
+    parser.add_argument('--repeat', type=int, default=1, help='passes over the corpus per stage')
+    parser.add_argument('--stages', default=','.join(STAGES), help=f"comma-separated subset of {','.join(STAGES)}")
+    parser.add_argument('--policies', type=int, help='custom shape instead of the golden cases')
+    parser.add_argument('--vehicles', type=int)
+    parser.add_argument('--claims', type=int)
+    parser.add_argument('--kols', type=int)
+    parser.add_argument('--convictions', type=int)
+    parser.add_argument('--update-golden', action='store_true', help='rewrite benchmarks/golden/ from this run')
+    parser.add_argument('--json', metavar='PATH', help='also write the report as JSON')
+    args = parser.parse_args()
+
+    stages = [stage for stage in args.stages.split(',') if stage]
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        parser.error(f"unknown stage(s): {', '.join(sorted(unknown))}")
+
+    shape = {key: getattr(args, key) for key in ('policies', 'vehicles', 'claims', 'kols', 'convictions')}
+    custom = {key: value for key, value in shape.items() if value is not None}
+    if custom and args.update_golden:
+        parser.error('--update-golden only applies to the built-in cases')
+    if args.update_golden and 'total' not in stages:
+        stages.append('total')
+
+    report = {}
+    mismatches = []
+    context = multiprocessing.get_context('spawn')
+    for kind in (['dash', 'mvr'] if args.kind == 'all' else [args.kind]):
+        kind_custom = None
+        if custom:
+            allowed = ('policies', 'vehicles', 'claims', 'kols') if kind == 'dash' else ('vehicles', 'convictions')
+            kind_custom = {key: value for key, value in custom.items() if key in allowed}
+        corpus = build_corpus(kind, args.docs, kind_custom)
+        pdfs = [pdf for _, pdf, _ in corpus]
+        pages = sum(page_count for _, _, page_count in corpus) * args.repeat
+
+        texts = None
+        rows = []
+        for stage in stages:
+            inputs = pdfs
+            if stage == 'fields':
+                if texts is None:
+                    from backend.pdf_text import extract_text_tiered
+                    from backend.pdf_parser import DASH_ANCHORS, MVR_ANCHORS
+                    anchors = DASH_ANCHORS if kind == 'dash' else MVR_ANCHORS
+                    texts = [extract_text_tiered(pdf, anchors).text for pdf in pdfs]
+                inputs = texts
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                run = executor.submit(run_stage, kind, stage, inputs, args.repeat).result()
+            rows.append(summarize(stage, pages, run))
+            if stage == 'total' and not custom:
+                mismatches += check_golden(kind, corpus, run['outputs'], args.update_golden)
+
+        print_report(kind, corpus, rows)
+        report[kind] = rows
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    if mismatches:
+        print(f"\nGOLDEN MISMATCHES ({len(mismatches)}):")
+        for mismatch in mismatches:
+            print(f"  {mismatch}")
+        return 1
+    if not custom and not args.update_golden and 'total' in stages:
+        print('\nGolden corpus: all documents match')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,159 @@
+"""
+Synthetic DASH / MVR PDFs
+Deterministic, offline report generator for the parser benchmarks - no real customer data involved
+"""
+import random
+
+MAKES = ['TOYOTA - CAMRY', 'HONDA - CIVIC', 'FORD - F150', 'MAZDA - CX-5', 'BMW - X3', 'HYUNDAI - ELANTRA']
+COMPANIES = ['Intact Insurance', 'Aviva Canada', 'Desjardins', 'Economical', 'TD Insurance']
+DRIVERS = ['SMITH, JOHN', 'LEE, ANN MARIE', 'PATEL, RAJ', 'NGUYEN, LINH']
+KOL_TYPES = ['Collision', 'Other Property Damage', 'Bodily Injury', 'Direct Compensation', 'Rental']
+OFFENCES = ['SPEEDING 20 KM/H OVER', 'FAIL TO STOP', 'DISOBEY LEGEND', 'CARELESS DRIVING']
+VIN_CHARS = 'ABCDEFGHJKLMNPRSTUVWXYZ0123456789'
+
+LINES_PER_PAGE = 48
+
+
+def _date(rng, first_year=2008, last_year=2025):
+    return f"{rng.randint(first_year, last_year)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+
+
+def _slash_date(rng, first_year=2008, last_year=2025):
+    return f"{rng.randint(1, 12):02d}/{rng.randint(1, 28):02d}/{rng.randint(first_year, last_year)}"
+
+
+def _vin(rng):
+    return ''.join(rng.choice(VIN_CHARS) for _ in range(17))
+
+
+def dash_report_lines(seed, policies=3, vehicles=2, claims=3, kols=2):
+    """Text lines of a DASH report with the given number of policies, vehicles per policy, claims and KOL items"""
+    rng = random.Random(seed)
+    lines = [
+        'DASH Driver Report',
+        f"Report Date: {_date(rng, 2024)}",
+        f"Address: {rng.randint(1, 999)}-{rng.randint(100, 9999)} Eglinton Ave W ,Toronto,ON M6C2G5 "
+        f"Number of Vehicles: {vehicles}",
+        f"DLN: G{rng.randint(1000, 9999)}-{rng.randint(10000, 99999)}-{rng.randint(10000, 99999)} Ontario",
+        f"License Class: G{rng.choice(['', '1', '2'])}",
+        f"Status: {rng.choice(['Valid', 'Active'])}",
+        f"Years of Continuous Insurance: {rng.randint(1, 20)}",
+        f"Phone: ({rng.randint(200, 999)}) 555-{rng.randint(1000, 9999)}",
+        f"Email: driver{seed}@example.com",
+        'Policies',
+    ]
+    for number in range(1, policies + 1):
+        lines.append(f"#{number} {_date(rng)} to {_date(rng)} {rng.choice(COMPANIES)} Principal Operator")
+
+    lines.append('Claims')
+    claim_dates = []
+    for number in range(1, claims + 1):
+        claim_dates.append(_date(rng))
+        lines.append(f"#{number} {claim_dates[-1]} {rng.choice(COMPANIES)} At-Fault : {rng.choice([0, 25, 50, 100])}%")
+    lines += ['Previous Inquiries', f"{_date(rng, 2023)} Intact Insurance"]
+
+    for number in range(1, policies + 1):
+        lines += [
+            f"Policy #{number}",
+            f"Start of the Earliest Term: {_date(rng)}",
+            f"End of the Latest Term: {_date(rng)}",
+            f"Expiry Date: {_date(rng, 2025, 2027)}",
+        ]
+        for vehicle in range(1, vehicles + 1):
+            make = rng.choice(MAKES).replace(' - ', ' ')
+            lines += [
+                f"Vehicle #{vehicle}: {rng.randint(2005, 2025)} {make} {_vin(rng)}",
+                f"Relationship: Self DLN: G{rng.randint(1000, 9999)}",
+            ]
+
+    for number in range(1, claims + 1):
+        lines += [
+            f"Claim #{number} Date of Loss {claim_dates[number - 1]}",
+            f"First Party Driver: {rng.choice(DRIVERS)} DLN: G{rng.randint(100, 999)}",
+            f"Claim Status: {rng.choice(['Closed', 'Open'])}",
+            f"Total Loss: $ {rng.randint(0, 20000):,}.00 Total Expense: $ {rng.randint(0, 3000):,}.00",
+        ]
+        for item in range(kols):
+            lines.append(f"KOL{rng.randint(1, 40)} - {rng.choice(KOL_TYPES)} {item}: "
+                         f"${rng.randint(0, 9000):,}.00 (Loss); ${rng.randint(0, 900)}.00 (Expense);")
+    lines += ['Convictions', 'No convictions on record']
+    return lines
+
+
+def mvr_report_lines(seed, vehicles=2, convictions=2):
+    """Text lines of an Ontario-style MVR with Policy #1 vehicles and conviction details"""
+    rng = random.Random(seed)
+    lines = [
+        'MINISTRY OF TRANSPORTATION DRIVER RECORD',
+        f"Licence Number: {rng.choice('ABCDEFGHJKLMNPRSTVW')}{rng.randint(1000, 9999)}-"
+        f"{rng.randint(10000, 99999)}-{rng.randint(10000, 99999)}",
+        f"Name: {rng.choice(DRIVERS).replace(', ', ',')} Birth Date: {_slash_date(rng, 1960, 2004)}",
+        f"Gender: {rng.choice(['M', 'F'])} Height: {rng.randint(150, 195)} cm",
+        f"Expiry Date: {_slash_date(rng, 2026, 2031)} Issue Date: {_slash_date(rng, 1990, 2020)}",
+        f"Status: {rng.choice(['LICENCED', 'VALID', 'SUSPENDED'])} Class: {rng.choice(['G', 'G2', 'G*'])}",
+        f"Demerit Points: {rng.randint(0, 9)}",
+        f"Conditions: {rng.choice(['*/N', 'CORRECTIVE LENSES'])}",
+        'Policy #1',
+    ]
+    for vehicle in range(1, vehicles + 1):
+        lines.append(f"Vehicle #{vehicle}: {rng.randint(2005, 2025)} {rng.choice(MAKES)} - {_vin(rng)}")
+    lines.append(f"*** Number of Convictions: {convictions} ***")
+    if convictions:
+        lines.append('DATE CONVICTIONS, DISCHARGES AND OTHER ACTIONS')
+        for _ in range(convictions):
+            lines.append(f"{_slash_date(rng, 2019, 2025)} {rng.choice(OFFENCES)}")
+        lines.append('*' * 20)
+    lines.append('END OF REPORT')
+    return lines
+
+
+def paginate(lines, lines_per_page=LINES_PER_PAGE):
+    """Split report lines into pages with a "Page X of Y" footer on each"""
+    body = lines_per_page - 1
+    chunks = [lines[i:i + body] for i in range(0, len(lines), body)] or [[]]
+    return [chunk + [f"Page {number} of {len(chunks)}"] for number, chunk in enumerate(chunks, 1)]
+
+
+def make_pdf(pages):
+    """Minimal text-only PDF (Helvetica, one content stream per page) from a list of pages of lines"""
+    chunks = [b'%PDF-1.4\n']
+    offsets = []
+
+    def add_object(body):
+        offsets.append(sum(len(chunk) for chunk in chunks))
+        chunks.append(f"{len(offsets)} 0 obj\n".encode() + body + b"\nendobj\n")
+
+    # Objects 1-3 are the catalog, page tree and font; each page then takes a page + content object
+    page_refs = ' '.join(f"{4 + 2 * index} 0 R" for index in range(len(pages)))
+    add_object(b'<< /Type /Catalog /Pages 2 0 R >>')
+    add_object(f"<< /Type /Pages /Kids [{page_refs}] /Count {len(pages)} >>".encode())
+    add_object(b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>')
+    for index, lines in enumerate(pages):
+        operators = ['BT', '/F1 9 Tf', '11 TL', '40 800 Td']
+        for line in lines:
+            escaped = line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+            operators.append(f"({escaped}) Tj T*")
+        operators.append('ET')
+        stream = '\n'.join(operators).encode('latin-1', 'replace')
+        add_object(f"<< /Type /Page /Parent 2 0 R /Resources << /Font << /F1 3 0 R >> >> "
+                   f"/MediaBox [0 0 612 842] /Contents {5 + 2 * index} 0 R >>".encode())
+        add_object(f"<< /Length {len(stream)} >>\nstream\n".encode() + stream + b"\nendstream")
+
+    xref_offset = sum(len(chunk) for chunk in chunks)
+    xref = [f"xref\n0 {len(offsets) + 1}\n", '0000000000 65535 f \n']
+    xref += [f"{offset:010d} 00000 n \n" for offset in offsets]
+    chunks.append(''.join(xref).encode())
+    chunks.append(f"trailer\n<< /Size {len(offsets) + 1} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n".encode())
+    return b''.join(chunks)
+
+
+def dash_pdf(seed, policies=3, vehicles=2, claims=3, kols=2, lines_per_page=LINES_PER_PAGE):
+    """(pdf bytes, page count) for a synthetic DASH report"""
+    pages = paginate(dash_report_lines(seed, policies, vehicles, claims, kols), lines_per_page)
+    return make_pdf(pages), len(pages)
+
+
+def mvr_pdf(seed, vehicles=2, convictions=2, lines_per_page=LINES_PER_PAGE):
+    """(pdf bytes, page count) for a synthetic MVR"""
+    pages = paginate(mvr_report_lines(seed, vehicles, convictions), lines_per_page)
+    return make_pdf(pages), len(pages)